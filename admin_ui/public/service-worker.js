@@ -0,0 +1,108 @@
+/**
+ * Caches the UI, so when the user opens the admin again, it starts without
+ * waiting for the network. Registered by `serviceWorker.ts`.
+ *
+ * - The JavaScript and CSS files have a hash of their contents in the file
+ *   name, so they never change, and are served straight from the cache.
+ * - The HTML page is served from the cache, and revalidated in the
+ *   background, so the next visit gets the latest version.
+ *
+ * API responses aren't cached here - the UI stores the ones which rarely
+ * change in IndexedDB instead (see `persistentCache.ts`).
+ */
+
+// The Piccolo Admin version is passed in when registering the service worker,
+// so a new release gets a new cache.
+const VERSION = new URL(self.location.href).searchParams.get("version") ?? ""
+const CACHE_PREFIX = "piccolo-admin-"
+const CACHE_NAME = `${CACHE_PREFIX}${VERSION}`
+
+// For example `assets/index-B0sTfVCI.js` - see `HASHED_FILE_NAME` in
+// `piccolo_admin/static.py`.
+const HASHED_ASSET = /\/assets\/[^/]+-[\w-]{8}\.\w+$/
+
+const SCOPE = new URL(self.registration.scope)
+
+self.addEventListener("install", (event) => {
+    event.waitUntil(
+        caches
+            .open(CACHE_NAME)
+            .then((cache) => cache.add(SCOPE.href))
+            .then(() => self.skipWaiting())
+    )
+})
+
+self.addEventListener("activate", (event) => {
+    event.waitUntil(
+        caches
+            .keys()
+            .then((keys) =>
+                Promise.all(
+                    keys
+                        .filter(
+                            (key) =>
+                                key.startsWith(CACHE_PREFIX) &&
+                                key != CACHE_NAME
+                        )
+                        .map((key) => caches.delete(key))
+                )
+            )
+            .then(() => self.clients.claim())
+    )
+})
+
+const cacheFirst = async (request) => {
+    const cache = await caches.open(CACHE_NAME)
+    const cachedResponse = await cache.match(request)
+    if (cachedResponse) {
+        return cachedResponse
+    }
+
+    const response = await fetch(request)
+    if (response.ok) {
+        await cache.put(request, response.clone())
+    }
+    return response
+}
+
+const staleWhileRevalidate = async (event) => {
+    const cache = await caches.open(CACHE_NAME)
+    // The page is always cached under the scope URL, as the hash in the URL
+    // (used by the router) isn't sent to the server anyway.
+    const cachedResponse = await cache.match(SCOPE.href)
+
+    const revalidate = fetch(event.request).then(async (response) => {
+        if (response.ok) {
+            await cache.put(SCOPE.href, response.clone())
+        }
+        return response
+    })
+
+    if (cachedResponse) {
+        event.waitUntil(revalidate.catch(() => undefined))
+        return cachedResponse
+    }
+    return revalidate
+}
+
+self.addEventListener("fetch", (event) => {
+    const request = event.request
+    if (request.method != "GET") {
+        return
+    }
+
+    const url = new URL(request.url)
+    if (url.origin != SCOPE.origin) {
+        return
+    }
+
+    if (HASHED_ASSET.test(url.pathname)) {
+        event.respondWith(cacheFirst(request))
+    } else if (
+        request.mode == "navigate" &&
+        url.pathname == SCOPE.pathname &&
+        !url.search
+    ) {
+        event.respondWith(staleWhileRevalidate(event))
+    }
+})
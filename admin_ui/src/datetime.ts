@@ -0,0 +1,295 @@
+/**
+ * Date and time helpers, built on `Intl.DateTimeFormat`.
+ *
+ * Creating an `Intl.DateTimeFormat` is slow compared to using one, so they're
+ * cached per timezone and time resolution. This matters when rendering
+ * hundreds of timestamps in the row listing.
+ */
+
+/*****************************************************************************/
+// Formatters
+
+const formatterCache = new Map<string, Intl.DateTimeFormat>()
+
+/**
+ * @param timeResolution In seconds - see `TableConfig.time_resolution`.
+ */
+const getFormatter = (
+    timeZone: string,
+    timeResolution: number
+): Intl.DateTimeFormat => {
+    const key = `${timeZone}|${timeResolution}`
+    let formatter = formatterCache.get(key)
+
+    if (!formatter) {
+        formatter = new Intl.DateTimeFormat("en-US", {
+            timeZone,
+            hourCycle: "h23",
+            year: "numeric",
+            month: "2-digit",
+            day: "2-digit",
+            hour: "2-digit",
+            minute: "2-digit",
+            second: timeResolution < 60 ? "2-digit" : undefined,
+            fractionalSecondDigits: timeResolution < 1 ? 3 : undefined
+        })
+        formatterCache.set(key, formatter)
+    }
+
+    return formatter
+}
+
+interface DatetimeParts {
+    year: number
+    month: number
+    day: number
+    hour: number
+    minute: number
+    second: number
+    millisecond: number
+}
+
+const getParts = (date: Date, timeZone: string): DatetimeParts => {
+    const parts: { [key: string]: string } = {}
+    for (const part of getFormatter(timeZone, 0).formatToParts(date)) {
+        parts[part.type] = part.value
+    }
+
+    return {
+        year: Number(parts.year),
+        month: Number(parts.month),
+        day: Number(parts.day),
+        hour: Number(parts.hour),
+        minute: Number(parts.minute),
+        second: Number(parts.second),
+        millisecond: Number(parts.fractionalSecond)
+    }
+}
+
+const pad = (value: number, length = 2) => String(value).padStart(length, "0")
+
+/**
+ * Seconds and milliseconds are only included if the time resolution needs
+ * them.
+ */
+const formatTimeParts = (
+    parts: Pick<DatetimeParts, "hour" | "minute" | "second" | "millisecond">,
+    timeResolution: number
+) => {
+    let value = `${pad(parts.hour)}:${pad(parts.minute)}`
+    if (timeResolution < 60) {
+        value += `:${pad(parts.second)}`
+    }
+    if (timeResolution < 1) {
+        value += `.${pad(parts.millisecond, 3)}`
+    }
+    return value
+}
+
+/**
+ * Returns a string like `2000-01-01T12:30`, which can be used as the value of
+ * a `datetime-local` input.
+ */
+const formatParts = (parts: DatetimeParts, timeResolution: number) => {
+    const date = `${pad(parts.year, 4)}-${pad(parts.month)}-${pad(parts.day)}`
+    return `${date}T${formatTimeParts(parts, timeResolution)}`
+}
+
+/*****************************************************************************/
+// Parsing
+
+const DATETIME_REGEX =
+    /^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?)?/
+
+const TIME_REGEX = /^(\d{2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?/
+
+// Fractional seconds can have up to 6 digits (microseconds).
+const parseMilliseconds = (value: string | undefined) =>
+    value ? Number(value.slice(0, 3).padEnd(3, "0")) : 0
+
+/**
+ * Reads the date and time from an ISO 8601 string, ignoring any UTC offset.
+ */
+const parseWallTime = (value: string): DatetimeParts | null => {
+    const match = DATETIME_REGEX.exec(value)
+    if (!match) {
+        return null
+    }
+
+    return {
+        year: Number(match[1]),
+        month: Number(match[2]),
+        day: Number(match[3]),
+        hour: Number(match[4] ?? 0),
+        minute: Number(match[5] ?? 0),
+        second: Number(match[6] ?? 0),
+        millisecond: parseMilliseconds(match[7])
+    }
+}
+
+/*****************************************************************************/
+// Public API
+
+/**
+ * Timestamps without a timezone (i.e. `Timestamp` columns) - just changes
+ * the precision to match the time resolution.
+ */
+export const formatDatetime = (value: string, timeResolution: number) => {
+    const parts = parseWallTime(value)
+    return parts ? formatParts(parts, timeResolution) : value
+}
+
+/**
+ * Timestamps with a timezone (i.e. `Timestamptz` columns) - converts the
+ * value to the local time in the given timezone.
+ */
+export const formatDatetimeInTimezone = (
+    value: string | Date,
+    timeZone: string,
+    timeResolution: number
+) => {
+    const date = value instanceof Date ? value : new Date(value)
+    if (isNaN(date.getTime())) {
+        return String(value)
+    }
+    return formatParts(getParts(date, timeZone), timeResolution)
+}
+
+/**
+ * For `Time` columns.
+ */
+export const formatTime = (value: string, timeResolution: number) => {
+    const match = TIME_REGEX.exec(value)
+    if (!match) {
+        return value
+    }
+
+    return formatTimeParts(
+        {
+            hour: Number(match[1]),
+            minute: Number(match[2]),
+            second: Number(match[3] ?? 0),
+            millisecond: parseMilliseconds(match[4])
+        },
+        timeResolution
+    )
+}
+
+/**
+ * The opposite of `formatDatetimeInTimezone` - converts a local time in the
+ * given timezone (e.g. from a `datetime-local` input) to a UTC ISO 8601
+ * string.
+ */
+export const timezoneToISO = (value: string, timeZone: string) => {
+    const parts = parseWallTime(value)
+    if (!parts) {
+        return null
+    }
+
+    const wallTime = Date.UTC(
+        parts.year,
+        parts.month - 1,
+        parts.day,
+        parts.hour,
+        parts.minute,
+        parts.second,
+        parts.millisecond
+    )
+
+    // The UTC offset depends on the instant (e.g. daylight saving time), so
+    // we make a guess, and then check the offset at the guess.
+    let timestamp = wallTime - getOffset(wallTime, timeZone)
+    const offset = getOffset(timestamp, timeZone)
+    timestamp = wallTime - offset
+
+    return new Date(timestamp).toISOString()
+}
+
+/**
+ * The UTC offset of the timezone, in milliseconds, at the given instant.
+ */
+const getOffset = (timestamp: number, timeZone: string) => {
+    const date = new Date(timestamp)
+    const parts = getParts(date, timeZone)
+    const wallTime = Date.UTC(
+        parts.year,
+        parts.month - 1,
+        parts.day,
+        parts.hour,
+        parts.minute,
+        parts.second,
+        parts.millisecond
+    )
+    return wallTime - date.getTime()
+}
+
+let timezoneNames: string[] | undefined
+
+export const getTimezoneNames = (): string[] => {
+    if (!timezoneNames) {
+        const names = Intl.supportedValuesOf("timeZone")
+        // Some browsers don't include UTC in the list.
+        timezoneNames = names.includes("UTC") ? names : ["UTC", ...names]
+    }
+    return timezoneNames
+}
+
+/*****************************************************************************/
+// Durations
+
+const DURATION_REGEX =
+    /^(-)?P(?:(\d+(?:\.\d+)?)W)?(?:(\d+(?:\.\d+)?)D)?(?:T(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?(?:(\d+(?:\.\d+)?)S)?)?$/
+
+/**
+ * Converts an ISO 8601 duration (e.g. `P17DT14706S`) to seconds. Years and
+ * months aren't supported, as their length varies - the API never returns
+ * them.
+ */
+export const durationToSeconds = (value: string): number => {
+    const match = DURATION_REGEX.exec(value)
+    if (!match) {
+        return 0
+    }
+
+    const [weeks, days, hours, minutes, seconds] = match
+        .slice(2)
+        .map((i) => Number(i ?? 0))
+
+    const total =
+        weeks * 604800 + days * 86400 + hours * 3600 + minutes * 60 + seconds
+
+    return match[1] ? -total : total
+}
+
+/**
+ * Converts seconds to an ISO 8601 duration (e.g. `P1DT2H3M4S`).
+ */
+export const secondsToDuration = (value: number): string => {
+    if (!value) {
+        return "P0D"
+    }
+
+    const sign = value < 0 ? "-" : ""
+    let remainder = Math.abs(value)
+
+    const days = Math.floor(remainder / 86400)
+    remainder -= days * 86400
+    const hours = Math.floor(remainder / 3600)
+    remainder -= hours * 3600
+    const minutes = Math.floor(remainder / 60)
+    // Avoid floating point noise like 1.0000000001.
+    const seconds = Math.round((remainder - minutes * 60) * 1000) / 1000
+
+    let time = ""
+    if (hours) {
+        time += `${hours}H`
+    }
+    if (minutes) {
+        time += `${minutes}M`
+    }
+    if (seconds) {
+        time += `${seconds}S`
+    }
+
+    return `${sign}P${days ? `${days}D` : ""}${time ? `T${time}` : ""}`
+}
@@ -10,17 +10,69 @@ export interface DeleteRow {
     rowID: RowID
 }
 
+export interface BulkDeleteRows {
+    tableName: string
+    rowIDs: RowID[]
+}
+
+export interface BulkUpdateRows {
+    tableName: string
+    rowIDs: RowID[]
+    columnName: string
+    value: any
+}
+
+export interface BulkUpdateMatchingRows {
+    tableName: string
+    columnName: string
+    value: any
+}
+
+export interface BulkActionError {
+    row_id: RowID
+    detail: string
+}
+
+export interface BulkActionAPIResponse {
+    row_ids: RowID[]
+    errors: BulkActionError[]
+}
+
+// The progress of a bulk action on every row matching the filters.
+export interface BulkJobAPIResponse {
+    job_id: string
+    table_name: string
+    action: "delete" | "update"
+    status: "running" | "completed" | "failed"
+    total: number | null
+    processed: number
+    succeeded: number
+    error_count: number
+    errors: BulkActionError[]
+    detail: string | null
+}
+
 export interface UpdateRow {
     tableName: string
     rowID: RowID
     data: object
 }
 
-export interface FetchIdsConfig {
+export interface SearchRowsConfig {
     tableName: string
-    limit: number
     search: string
-    offset?: number
+    limit: number
+    cursor?: string | null
+}
+
+export interface SearchResult {
+    id: RowID
+    readable: string
+}
+
+export interface SearchAPIResponse {
+    results: SearchResult[]
+    next_cursor: string | null
 }
 
 export interface FetchRowsConfig {
@@ -48,6 +100,48 @@ export interface RowCountAPIResponse {
     page_size: number
 }
 
+export type CountType = "exact" | "capped" | "estimated"
+
+export type Row = { [key: string]: any }
+
+export interface ListingAPIResponse {
+    rows: Row[]
+    // Null if we asked the server not to count the rows.
+    count: number | null
+    count_type: CountType
+    page_size: number
+    next_cursor: string | null
+    previous_cursor: string | null
+}
+
+// How a column's values are displayed in the row listing.
+export type ColumnKind =
+    | "link"
+    | "choice"
+    | "foreignKey"
+    | "boolean"
+    | "interval"
+    | "datetime"
+    | "json"
+    | "media"
+    | "text"
+
+// Worked out once per schema, rather than for every cell.
+export interface ColumnRenderConfig {
+    name: string
+    title: string
+    kind: ColumnKind
+    isArray: boolean
+    // Maps each choice value to its display value.
+    choices: { [key: string | number]: string } | null
+    // The table a foreign key column refers to.
+    foreignKeyTableName: string | null
+    // For `datetime` columns - timezone aware ones are displayed in this
+    // timezone.
+    timeZone: string | null
+    timeResolution: number
+}
+
 export interface TableReference {
     tableName: string
     columnName: string
@@ -62,6 +156,7 @@ export interface TableReferencesAPIResponse {
 export interface TranslationListItemAPI {
     language_name: string
     language_code: string
+    content_hash: string | null
 }
 
 export interface TranslationsListAPIResponse {
@@ -78,6 +173,34 @@ export interface TranslationAPIResponse {
 /*****************************************************************************/
 // File storage
 
+export interface MetaAPIResponse {
+    piccolo_admin_version: string
+    site_name: string
+    service_worker: boolean
+}
+
+export interface BootstrapAPIResponse {
+    meta: MetaAPIResponse
+    user: {
+        username: string
+        user_id: string
+    }
+    translations: TranslationsListAPIResponse
+    language_code: string
+    // Omitted if the `translation_hash` we sent is still current.
+    translation: TranslationAPIResponse | null
+    tables: {
+        grouped: { [key: string]: string[] }
+        ungrouped: string[]
+    }
+    forms: FormConfig[]
+    form_groups: {
+        grouped: { [key: string]: FormConfig[] }
+        ungrouped: FormConfig[]
+    }
+    links: { [key: string]: string }
+}
+
 export interface StoreFileAPIResponse {
     file_key: string
 }
@@ -102,6 +225,10 @@ export interface Choices {
 /*****************************************************************************/
 
 export interface SchemaExtra {
+    // Values in these columns are returned as strings in the row listing,
+    // as they may be too large for a JavaScript number. They're kept as
+    // strings, so they're sent back to the API without losing precision.
+    bigint_columns: string[]
     help_text: string | null
     link_column_name: string
     media_columns: string[]
@@ -112,6 +239,11 @@ export interface SchemaExtra {
     visible_fields_options: string[]
     visible_filter_names: string[]
     time_resolution: { [key: string]: number }
+    keyset_pagination: boolean
+    // Whether every row matching the filters can be deleted at once.
+    allow_bulk_delete: boolean
+    // Whether every row matching the filters can be updated at once.
+    allow_bulk_update: boolean
 }
 
 export interface Schema {
@@ -122,6 +254,11 @@ export interface Schema {
     type: string
 }
 
+export interface CachedSchema {
+    etag: string
+    schema: Schema
+}
+
 export interface Properties {
     [key: string]: Property
 }
@@ -9,7 +9,6 @@ import i18n from "./translations"
 /*****************************************************************************/
 
 import axios from "axios"
-import JSONBig from "json-bigint"
 import Cookies from "js-cookie"
 
 // Add the CSRF token
@@ -26,18 +25,6 @@ axios.interceptors.request.use(function (config) {
     return config
 })
 
-// Handle BigInt values
-axios.defaults.transformResponse = [
-    function (data) {
-        if (typeof data === "string") {
-            try {
-                data = JSONBig.parse(data)
-            } catch (e) {}
-        }
-        return data
-    }
-]
-
 /*****************************************************************************/
 // Create app
 
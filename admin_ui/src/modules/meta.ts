@@ -1,5 +1,8 @@
 import axios from "axios"
 
+import type { MetaAPIResponse } from "@/interfaces"
+import persistentCache from "@/persistentCache"
+import { updateServiceWorker } from "@/serviceWorker"
 import type { Context } from "./interfaces"
 
 interface State {
@@ -22,12 +25,24 @@ export default {
     },
     actions: {
         async fetchMeta(context: Context) {
-            const response = await axios.get(`./public/meta/`)
-            context.commit("updateSiteName", response.data.site_name)
+            const response = await axios.get<MetaAPIResponse>(`./public/meta/`)
+            await context.dispatch("applyMeta", response.data)
+            await context.dispatch("setupCaching", response.data)
+        },
+        applyMeta(context: Context, meta: MetaAPIResponse) {
+            context.commit("updateSiteName", meta.site_name)
             context.commit(
                 "updatePiccoloAdminVersion",
-                response.data.piccolo_admin_version
+                meta.piccolo_admin_version
             )
+        },
+        /**
+         * Called with the latest meta from the API. Anything cached by an
+         * older version of Piccolo Admin is discarded.
+         */
+        async setupCaching(context: Context, meta: MetaAPIResponse) {
+            await persistentCache.setVersion(meta.piccolo_admin_version)
+            updateServiceWorker(meta.service_worker, meta.piccolo_admin_version)
         }
     }
 }
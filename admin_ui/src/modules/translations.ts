@@ -1,6 +1,7 @@
 import axios from "axios"
 
 import i18n from "@/translations"
+import persistentCache from "@/persistentCache"
 import type {
     TranslationsListAPIResponse,
     TranslationListItemAPI,
@@ -10,12 +11,17 @@ import type { Context } from "./interfaces"
 
 const DEFAULT_LANGUAGE_KEY = "piccoloAdminDefaultLanguage"
 
+interface CachedTranslation {
+    contentHash: string
+    translation: TranslationAPIResponse
+}
+
 /**
  * Stores the user's default language in localStorage. If the user selects a
  * language, then this becomes their new default language, otherwise it's
  * defined by the API.
  */
-const localStorageUtils = {
+export const localStorageUtils = {
     getDefaultLanguage: (): string | null => {
         return localStorage.getItem(DEFAULT_LANGUAGE_KEY)
     },
@@ -24,6 +30,24 @@ const localStorageUtils = {
     }
 }
 
+/**
+ * Translations are cached, along with their content hash, so we only
+ * download them again if they've changed.
+ */
+export const translationCache = {
+    get: (languageCode: string): Promise<CachedTranslation | undefined> => {
+        return persistentCache.get<CachedTranslation>(
+            `translation:${languageCode.toLowerCase()}`
+        )
+    },
+    set: (value: CachedTranslation) => {
+        return persistentCache.set(
+            `translation:${value.translation.language_code.toLowerCase()}`,
+            value
+        )
+    }
+}
+
 interface State {
     translations: TranslationListItemAPI[]
 }
@@ -97,17 +121,56 @@ export default {
         /**
          * Fetch the translations for a certain language, and store it.
          */
-        async loadTranslation(context: Context, languageCode: string) {
+        async loadTranslation(
+            context: Context & { state: State },
+            languageCode: string
+        ) {
+            const contentHash = context.state.translations.find(
+                (i) =>
+                    i.language_code.toLowerCase() == languageCode.toLowerCase()
+            )?.content_hash
+
+            const cachedTranslation = await translationCache.get(languageCode)
+
+            if (
+                contentHash &&
+                cachedTranslation &&
+                cachedTranslation.contentHash == contentHash
+            ) {
+                await context.dispatch(
+                    "applyTranslation",
+                    cachedTranslation.translation
+                )
+                return
+            }
+
             const response = await axios.get<TranslationAPIResponse>(
                 `./public/translations/${languageCode}/`
             )
-            localStorageUtils.setDefaultLanguage(languageCode)
+
+            if (contentHash) {
+                await translationCache.set({
+                    contentHash,
+                    translation: response.data
+                })
+            }
+
+            await context.dispatch("applyTranslation", response.data)
+        },
+        /**
+         * Make the UI use this translation.
+         */
+        async applyTranslation(
+            context: Context,
+            translation: TranslationAPIResponse
+        ) {
+            localStorageUtils.setDefaultLanguage(translation.language_code)
 
             i18n.global.setLocaleMessage(
-                response.data.language_code,
-                response.data.translations
+                translation.language_code,
+                translation.translations
             )
-            i18n.global.locale = response.data.language_code
+            i18n.global.locale = translation.language_code
         }
     }
 }
@@ -0,0 +1,113 @@
+/**
+ * Stores API responses which rarely change (table schemas, translations, and
+ * the bootstrap data) in IndexedDB, so when the user opens the admin again,
+ * the UI can start straight away, and revalidate them in the background.
+ *
+ * Everything is discarded when the Piccolo Admin version changes, as the
+ * shape of the responses might have changed too.
+ */
+
+const DB_NAME = "piccoloAdmin"
+const STORE_NAME = "cache"
+const VERSION_KEY = "piccoloAdminVersion"
+
+const toPromise = <T>(request: IDBRequest<T>): Promise<T> =>
+    new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result)
+        request.onerror = () => reject(request.error)
+    })
+
+export class PersistentCache {
+    private db: Promise<IDBDatabase | null> | undefined
+
+    /**
+     * Resolves to `null` if IndexedDB isn't available (e.g. some browsers
+     * disable it in private browsing), in which case nothing is cached.
+     */
+    private open(): Promise<IDBDatabase | null> {
+        if (this.db === undefined) {
+            this.db = new Promise<IDBDatabase | null>((resolve) => {
+                if (typeof indexedDB === "undefined") {
+                    resolve(null)
+                    return
+                }
+
+                const request = indexedDB.open(DB_NAME, 1)
+                request.onupgradeneeded = () => {
+                    request.result.createObjectStore(STORE_NAME)
+                }
+                request.onsuccess = () => resolve(request.result)
+                request.onerror = () => resolve(null)
+                request.onblocked = () => resolve(null)
+            })
+        }
+        return this.db
+    }
+
+    private async getStore(
+        mode: IDBTransactionMode
+    ): Promise<IDBObjectStore | null> {
+        const db = await this.open()
+        return db
+            ? db.transaction(STORE_NAME, mode).objectStore(STORE_NAME)
+            : null
+    }
+
+    async get<T>(key: string): Promise<T | undefined> {
+        try {
+            const store = await this.getStore("readonly")
+            return store
+                ? await toPromise<T | undefined>(store.get(key))
+                : undefined
+        } catch (e) {
+            return undefined
+        }
+    }
+
+    async set(key: string, value: unknown) {
+        try {
+            const store = await this.getStore("readwrite")
+            if (store) {
+                // Vue's reactive proxies can't be cloned, so store a plain
+                // copy.
+                await toPromise(
+                    store.put(JSON.parse(JSON.stringify(value)), key)
+                )
+            }
+        } catch (e) {
+            // The storage quota might be exceeded - it's only a cache.
+        }
+    }
+
+    async delete(key: string) {
+        try {
+            const store = await this.getStore("readwrite")
+            if (store) {
+                await toPromise(store.delete(key))
+            }
+        } catch (e) {}
+    }
+
+    async clear() {
+        try {
+            const store = await this.getStore("readwrite")
+            if (store) {
+                await toPromise(store.clear())
+            }
+        } catch (e) {}
+    }
+
+    /**
+     * Clears the cache if it was populated by a different version of Piccolo
+     * Admin.
+     */
+    async setVersion(version: string) {
+        if ((await this.get<string>(VERSION_KEY)) === version) {
+            return
+        }
+        await this.clear()
+        await this.set(VERSION_KEY, version)
+    }
+}
+
+export default new PersistentCache()
@@ -0,0 +1,149 @@
+/**
+ * Caches API responses in memory, so going back to a page the user has just
+ * viewed is instant.
+ *
+ * Cached responses are shown straight away, but are always fetched again in
+ * the background (stale-while-revalidate), so the UI catches up with any
+ * changes made elsewhere. If the same request is already in flight, it's
+ * reused rather than sent twice.
+ */
+
+interface CacheEntry {
+    data: unknown
+    tableName: string | null
+    fetchedAt: number
+}
+
+interface InFlightRequest {
+    promise: Promise<unknown>
+    tableName: string | null
+}
+
+export class RequestCache {
+    maxEntries: number
+    // How long (in milliseconds) a response is considered up to date, so
+    // doesn't need revalidating - e.g. if it was just prefetched.
+    maxAge: number
+    private entries = new Map<string, CacheEntry>()
+    private inFlight = new Map<string, InFlightRequest>()
+    // Incremented each time a table is invalidated, so responses for
+    // requests which were sent beforehand aren't cached.
+    private versions = new Map<string, number>()
+
+    constructor(maxEntries = 100, maxAge = 10000) {
+        this.maxEntries = maxEntries
+        this.maxAge = maxAge
+    }
+
+    /**
+     * The params are sorted, so the key doesn't depend on their order.
+     */
+    getKey(url: string, params: { [key: string]: any } = {}): string {
+        const sortedParams = Object.keys(params)
+            .filter((key) => params[key] !== undefined)
+            .sort()
+            .map((key) => [key, params[key]])
+        return `${url}?${JSON.stringify(sortedParams)}`
+    }
+
+    get<T>(key: string): T | undefined {
+        const entry = this.entries.get(key)
+        if (entry === undefined) {
+            return undefined
+        }
+
+        // Move it to the end, so the least recently used entries are
+        // discarded first.
+        this.entries.delete(key)
+        this.entries.set(key, entry)
+
+        return entry.data as T
+    }
+
+    isFresh(key: string): boolean {
+        const entry = this.entries.get(key)
+        return (
+            entry !== undefined && Date.now() - entry.fetchedAt < this.maxAge
+        )
+    }
+
+    set(key: string, data: unknown, tableName: string | null = null) {
+        this.entries.delete(key)
+        this.entries.set(key, { data, tableName, fetchedAt: Date.now() })
+
+        while (this.entries.size > this.maxEntries) {
+            const oldestKey = this.entries.keys().next().value
+            if (oldestKey === undefined) {
+                break
+            }
+            this.entries.delete(oldestKey)
+        }
+    }
+
+    /**
+     * Sends the request, and caches the response.
+     *
+     * @param tableName - If set, the response is discarded when the table
+     * is modified.
+     */
+    fetch<T>(
+        key: string,
+        request: () => Promise<T>,
+        tableName: string | null = null
+    ): Promise<T> {
+        const inFlight = this.inFlight.get(key)
+        if (inFlight) {
+            return inFlight.promise as Promise<T>
+        }
+
+        const version = tableName ? this.versions.get(tableName) : undefined
+
+        const promise = request()
+            .then((data) => {
+                if (
+                    !tableName ||
+                    this.versions.get(tableName) === version
+                ) {
+                    this.set(key, data, tableName)
+                }
+                return data
+            })
+            .finally(() => {
+                if (this.inFlight.get(key)?.promise === promise) {
+                    this.inFlight.delete(key)
+                }
+            })
+
+        this.inFlight.set(key, { promise, tableName })
+
+        return promise
+    }
+
+    /**
+     * Called whenever rows in the table are created, updated, or deleted.
+     */
+    invalidateTable(tableName: string) {
+        this.versions.set(tableName, (this.versions.get(tableName) ?? 0) + 1)
+
+        for (const [key, entry] of this.entries) {
+            if (entry.tableName == tableName) {
+                this.entries.delete(key)
+            }
+        }
+
+        // Any requests in flight may have started before the change, so
+        // mustn't be reused.
+        for (const [key, request] of this.inFlight) {
+            if (request.tableName == tableName) {
+                this.inFlight.delete(key)
+            }
+        }
+    }
+
+    clear() {
+        this.entries.clear()
+        this.inFlight.clear()
+    }
+}
+
+export default new RequestCache()
@@ -1,14 +1,17 @@
 import { createRouter, createWebHashHistory } from "vue-router"
 
-import AddRow from "./views/AddRow.vue"
-import EditRow from "./views/EditRow.vue"
 import Home from "./views/Home.vue"
 import Login from "./views/Login.vue"
-import ChangePassword from "./views/ChangePassword.vue"
-import RowListing from "./views/RowListing.vue"
-import AddForm from "./views/AddForm.vue"
 
-export default createRouter({
+// The other views are loaded on demand, so the home and login pages are
+// quick to load.
+const AddRow = () => import("./views/AddRow.vue")
+const EditRow = () => import("./views/EditRow.vue")
+const ChangePassword = () => import("./views/ChangePassword.vue")
+const RowListing = () => import("./views/RowListing.vue")
+const AddForm = () => import("./views/AddForm.vue")
+
+const router = createRouter({
     history: createWebHashHistory(import.meta.env.BASE_URL),
     routes: [
         {
@@ -53,3 +56,24 @@ export default createRouter({
         }
     ]
 })
+
+// If the page was served from the service worker's cache, and Piccolo Admin
+// has since been upgraded, the views it refers to may no longer exist. By
+// now the service worker has fetched the latest page, so reload (only once,
+// in case the file is missing for some other reason).
+const CHUNK_ERROR_REGEX =
+    /dynamically imported module|Importing a module script failed/
+const RELOADED_KEY = "piccoloAdminReloadedForChunk"
+
+router.onError((error, to) => {
+    if (
+        CHUNK_ERROR_REGEX.test(String(error?.message)) &&
+        sessionStorage.getItem(RELOADED_KEY) != to.fullPath
+    ) {
+        sessionStorage.setItem(RELOADED_KEY, to.fullPath)
+        window.location.hash = to.fullPath
+        window.location.reload()
+    }
+})
+
+export default router
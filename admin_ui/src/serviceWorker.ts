@@ -0,0 +1,45 @@
+/**
+ * The service worker is optional - see the `service_worker` argument of
+ * `create_admin`. If it's been disabled since the user's last visit, it's
+ * removed, along with anything it cached.
+ */
+export const updateServiceWorker = async (
+    enabled: boolean,
+    piccoloAdminVersion: string
+) => {
+    // It would cache the files served by the Vite dev server.
+    if (!("serviceWorker" in navigator) || !import.meta.env.PROD) {
+        return
+    }
+
+    try {
+        if (enabled) {
+            // A new version of Piccolo Admin changes the URL, which makes the
+            // browser install the new service worker, and clear out the old
+            // cache.
+            await navigator.serviceWorker.register(
+                `./service-worker.js?version=${encodeURIComponent(
+                    piccoloAdminVersion
+                )}`,
+                { scope: "./" }
+            )
+            return
+        }
+
+        // Make sure it's ours, and not one registered by another app on the
+        // same site, with a broader scope.
+        const scope = new URL("./", window.location.href).href
+        const registration =
+            await navigator.serviceWorker.getRegistration(scope)
+        if (registration?.scope == scope) {
+            await registration.unregister()
+            for (const key of await caches.keys()) {
+                if (key.startsWith("piccolo-admin-")) {
+                    await caches.delete(key)
+                }
+            }
+        }
+    } catch (error) {
+        console.log(error)
+    }
+}
@@ -5,11 +5,144 @@ import type * as i from "./interfaces"
 import aboutModalModule from "./modules/aboutModal"
 import timezoneModalModule from "./modules/timezoneModal"
 import metaModule from "./modules/meta"
-import translationsModule from "./modules/translations"
+import translationsModule, {
+    localStorageUtils,
+    translationCache
+} from "./modules/translations"
+import persistentCache from "./persistentCache"
+import requestCache from "./requestCache"
 import { getOrderByString } from "./utils"
 
 const BASE_URL = import.meta.env.VITE_APP_BASE_URI
 
+// Keys for `persistentCache`.
+const BOOTSTRAP_KEY = "bootstrap"
+const getSchemaKey = (tableName: string) => `schema:${tableName}`
+
+// The most recent listing request - responses to any others are ignored, so
+// a slow response can't overwrite a newer one.
+let latestRowsKey: string | null = null
+
+async function getData<T>(url: string, params: { [key: string]: any } = {}) {
+    const response = await axios.get<T>(url, { params })
+    return response.data
+}
+
+/**
+ * Passes the cached response to `onData` straight away if there is one, and
+ * then again once it has been refreshed in the background.
+ */
+async function fetchWithCache<T>(url: string, onData: (data: T) => void) {
+    const key = requestCache.getKey(url)
+    const request = () => getData<T>(url)
+
+    const cachedData = requestCache.get<T>(key)
+
+    if (cachedData !== undefined) {
+        onData(cachedData)
+        requestCache
+            .fetch(key, request)
+            .then(onData)
+            .catch((error) => console.log(error))
+        return
+    }
+
+    onData(await requestCache.fetch(key, request))
+}
+
+interface ListingState {
+    currentTableName: string | undefined
+    currentPageNumber: number
+    filterParams: { [key: string]: any }
+    infiniteScroll: boolean
+    nextCursor: string | null
+    orderBy: i.OrderByConfig[]
+    pageSize: number
+    rowCount: number
+    rowCountKey: string | null
+    rowCountType: i.CountType
+    rows: i.Row[]
+    schema: i.Schema | undefined
+}
+
+interface ListingPage {
+    pageNumber?: number
+    cursor?: string
+}
+
+/**
+ * Works out the listing request for a page of the current table, using the
+ * current filters and sort order.
+ */
+function getListingRequest(state: ListingState, page: ListingPage) {
+    const tableName = state.currentTableName
+    const params: { [key: string]: any } = {
+        ...(state.filterParams || {})
+    }
+
+    if (state.orderBy && state.orderBy.length > 0) {
+        params["__order"] = getOrderByString(state.orderBy)
+    }
+
+    params["__page_size"] = state.pageSize
+
+    if (page.cursor) {
+        params["__cursor"] = page.cursor
+    } else if (page.pageNumber) {
+        params["__page"] = page.pageNumber
+    }
+
+    // Identifies which rows are being listed - unlike `key`, it doesn't
+    // change depending on whether the rows are counted.
+    const listingKey = JSON.stringify([tableName, params])
+
+    const countKey = JSON.stringify([tableName, state.filterParams])
+
+    if (countKey == state.rowCountKey) {
+        // Only the page has changed, so we can reuse the row count.
+        params["__count"] = false
+    }
+
+    const url = `${BASE_URL}tables/${tableName}/-/listing/?__readable=true`
+
+    return {
+        url,
+        params,
+        key: requestCache.getKey(url, params),
+        countKey,
+        listingKey
+    }
+}
+
+/**
+ * The page after the last one we fetched, or `null` if there aren't any
+ * more rows.
+ */
+function getNextPage(state: ListingState): ListingPage | null {
+    // With infinite scroll, `rows` contains every page we've fetched so far.
+    const expectedRowCount = state.infiniteScroll
+        ? state.currentPageNumber * state.pageSize
+        : state.pageSize
+
+    if (state.rows.length < expectedRowCount) {
+        // The last page wasn't full, so there's nothing after it.
+        return null
+    }
+
+    if (state.schema?.extra.keyset_pagination) {
+        return state.nextCursor ? { cursor: state.nextCursor } : null
+    }
+
+    if (
+        state.rowCountType == "exact" &&
+        state.currentPageNumber * state.pageSize >= state.rowCount
+    ) {
+        return null
+    }
+
+    return { pageNumber: state.currentPageNumber + 1 }
+}
+
 export default createStore({
     modules: {
         aboutModalModule,
@@ -20,13 +153,32 @@ export default createStore({
     state: {
         apiResponseMessage: null as i.APIResponseMessage | null,
         currentPageNumber: 1,
-        currentTableName: undefined,
+        // Only used by tables with `keyset_pagination` enabled.
+        cursor: undefined as string | undefined,
+        nextCursor: null as string | null,
+        previousCursor: null as string | null,
+        currentTableName: undefined as string | undefined,
         darkMode: false,
         filterParams: {} as { [key: string]: any },
         pageSize: 15,
         rowCount: 0,
-        rows: [],
+        // If not `exact`, the row count is approximate.
+        rowCountType: "exact" as i.CountType,
+        // The table and filters which `rowCount` is for. If they haven't
+        // changed, we don't need to count the rows again when changing page.
+        rowCountKey: null as string | null,
+        rows: [] as i.Row[],
+        // The table, filters, sort order and page which `rows` are for. In
+        // infinite scroll mode, appending more rows doesn't change it.
+        rowsKey: null as string | null,
+        // Rather than paging through the rows, more are added as the user
+        // scrolls down.
+        infiniteScroll: false,
+        loadingMoreRows: false,
         schema: undefined as i.Schema | undefined,
+        // The schemas we've already fetched, so they can be revalidated
+        // using their ETag.
+        schemaCache: {} as { [tableName: string]: i.CachedSchema },
         formSchema: undefined,
         selectedRow: undefined,
         orderBy: [] as i.OrderByConfig[],
@@ -57,9 +209,28 @@ export default createStore({
         updateRows(state, rows) {
             state.rows = rows
         },
+        updateRowsKey(state, rowsKey: string | null) {
+            state.rowsKey = rowsKey
+        },
+        appendRows(state, rows: i.Row[]) {
+            state.rows.push(...rows)
+        },
+        updateInfiniteScroll(state, enabled: boolean) {
+            state.infiniteScroll = enabled
+            localStorage.setItem("infiniteScroll", String(enabled))
+        },
+        updateLoadingMoreRows(state, value: boolean) {
+            state.loadingMoreRows = value
+        },
         updateSelectedRow(state, row) {
             state.selectedRow = row
         },
+        updateSchemaCache(
+            state,
+            config: { tableName: string; cachedSchema: i.CachedSchema }
+        ) {
+            state.schemaCache[config.tableName] = config.cachedSchema
+        },
         updateSchema(state, schema) {
             state.schema = schema
         },
@@ -74,24 +245,43 @@ export default createStore({
         },
         updateOrderBy(state, config: i.OrderByConfig[]) {
             state.orderBy = config
+            state.cursor = undefined
         },
         reset(state) {
             state.orderBy = []
             state.filterParams = {}
             state.currentPageNumber = 1
+            state.cursor = undefined
             state.rows = []
+            state.rowsKey = null
         },
         updateFilterParams(state, config: object) {
             state.filterParams = config
+            state.cursor = undefined
         },
         updateRowCount(state, rowCount: number) {
             state.rowCount = rowCount
         },
+        updateRowCountType(state, rowCountType: i.CountType) {
+            state.rowCountType = rowCountType
+        },
+        updateRowCountKey(state, rowCountKey: string | null) {
+            state.rowCountKey = rowCountKey
+        },
         updatePageSize(state, pageSize: number) {
             state.pageSize = pageSize
+            state.cursor = undefined
         },
         updateCurrentPageNumber(state, pageNumber: number) {
             state.currentPageNumber = pageNumber
+            state.cursor = undefined
+        },
+        updateCursor(state, cursor: string | undefined) {
+            state.cursor = cursor
+        },
+        updateKeysetCursors(state, response: i.ListingAPIResponse) {
+            state.nextCursor = response.next_cursor
+            state.previousCursor = response.previous_cursor
         },
         updateDarkMode(state, enabled: boolean) {
             state.darkMode = enabled
@@ -128,66 +318,96 @@ export default createStore({
         /*********************************************************************/
 
         async fetchTableNames(context) {
-            const response = await axios.get(`${BASE_URL}tables/`)
-            context.commit("updateTableNames", response.data)
+            await fetchWithCache(`${BASE_URL}tables/`, (data) =>
+                context.commit("updateTableNames", data)
+            )
         },
         async fetchTableGroups(context) {
-            const response = await axios.get(`${BASE_URL}tables/grouped/`)
-            context.commit("updateTableGroups", response.data)
+            await fetchWithCache(`${BASE_URL}tables/grouped/`, (data) =>
+                context.commit("updateTableGroups", data)
+            )
         },
         async fetchCustomLinks(context) {
             const response = await axios.get(`${BASE_URL}links/`)
             context.commit("updateCustomLinks", response.data)
         },
-        async fetchCount(context) {
-            const tableName = context.state.currentTableName
-
-            // Remove order, as it doesn't make any sense for a count.
-            const params = { ...context.state.filterParams }
-            delete params["__order"]
-
-            const response = await axios.get(
-                `${BASE_URL}tables/${tableName}/count/`,
-                {
-                    params
-                }
-            )
-            const data = response.data as i.RowCountAPIResponse
-            context.commit("updateRowCount", data.count)
-            return data
-        },
         async fetchRows(context) {
             context.commit("updateLoadingStatus", true)
-            const params: { [key: string]: any } = {
-                ...(context.state.filterParams || {})
-            }
             const tableName = context.state.currentTableName
 
-            const orderByConfigs = context.state.orderBy
+            const keysetPagination =
+                context.state.schema?.extra.keyset_pagination
 
-            if (orderByConfigs && orderByConfigs.length > 0) {
-                params["__order"] = getOrderByString(orderByConfigs)
+            if (context.state.infiniteScroll) {
+                // More pages are appended as the user scrolls.
+                context.commit("updateCurrentPageNumber", 1)
+            } else if (keysetPagination && !context.state.cursor) {
+                // Without a cursor we're always on the first page.
+                context.commit("updateCurrentPageNumber", 1)
             }
 
-            // Get the row counts:
-            const rowCountResponse = await context.dispatch("fetchCount")
-            params["__page_size"] = context.state.pageSize
+            const { url, params, key, countKey, listingKey } =
+                getListingRequest(
+                    context.state,
+                    keysetPagination
+                        ? { cursor: context.state.cursor }
+                        : { pageNumber: context.state.currentPageNumber }
+                )
+            latestRowsKey = key
 
-            if (rowCountResponse.count < params["__page_size"]) {
-                context.commit("updateCurrentPageNumber", 1)
-            }
+            const request = () => getData<i.ListingAPIResponse>(url, params)
 
-            // Now get the rows:
-            params["__page"] = context.state.currentPageNumber
+            const onData = async (data: i.ListingAPIResponse) => {
+                if (key != latestRowsKey) {
+                    return
+                }
+
+                if (
+                    !keysetPagination &&
+                    data.rows.length == 0 &&
+                    context.state.currentPageNumber > 1 &&
+                    (data.count ?? context.state.rowCount) > 0
+                ) {
+                    // The filters changed, and the current page no longer
+                    // exists, so go back to the first page.
+                    context.commit("updateCurrentPageNumber", 1)
+                    await context.dispatch("fetchRows")
+                    return
+                }
 
+                if (data.count !== null) {
+                    context.commit("updateRowCount", data.count)
+                    context.commit("updateRowCountType", data.count_type)
+                    context.commit("updateRowCountKey", countKey)
+                }
+                context.commit("updateRowsKey", listingKey)
+                context.commit("updateRows", data.rows)
+                context.commit("updateKeysetCursors", data)
+            }
+
+            // The rows and the row count are returned together.
             try {
-                const response = await axios.get(
-                    `${BASE_URL}tables/${tableName}/?__readable=true`,
-                    {
-                        params: params
+                const cachedData = requestCache.get<i.ListingAPIResponse>(key)
+
+                if (cachedData) {
+                    // Show the cached rows straight away, and then refresh
+                    // them in the background, unless they were only just
+                    // fetched (e.g. by `prefetchNextPage`).
+                    await onData(cachedData)
+                    context.commit("updateLoadingStatus", false)
+                    if (requestCache.isFresh(key)) {
+                        return
                     }
+                    requestCache
+                        .fetch(key, request, tableName ?? null)
+                        .then(onData)
+                        .catch((error) => console.log(error))
+                    return
+                }
+
+                await onData(
+                    await requestCache.fetch(key, request, tableName ?? null)
                 )
-                context.commit("updateRows", response.data.rows)
             } catch (error) {
                 if (axios.isAxiosError(error)) {
                     console.log(error.response)
@@ -197,7 +417,90 @@ export default createStore({
                     })
                 }
             }
-            context.commit("updateLoadingStatus", false)
+
+            if (key == latestRowsKey) {
+                context.commit("updateLoadingStatus", false)
+            }
+        },
+        // Fetches the next page of rows in the background, so it's shown
+        // straight away when the user navigates to it.
+        async prefetchNextPage(context) {
+            const state = context.state
+            const page = getNextPage(state)
+
+            if (!page) {
+                return
+            }
+
+            const { url, params, key } = getListingRequest(state, page)
+
+            if (requestCache.isFresh(key)) {
+                return
+            }
+
+            try {
+                await requestCache.fetch(
+                    key,
+                    () => getData<i.ListingAPIResponse>(url, params),
+                    state.currentTableName ?? null
+                )
+            } catch (error) {
+                console.log(error)
+            }
+        },
+        // Used in infinite scroll mode - adds the next page to the rows we
+        // already have. Returns `true` if more rows were added.
+        async fetchMoreRows(context): Promise<boolean> {
+            const state = context.state
+            const page = getNextPage(state)
+
+            if (!page || state.loadingStatus || state.loadingMoreRows) {
+                return false
+            }
+
+            const { url, params, key, countKey } = getListingRequest(
+                state,
+                page
+            )
+            const previousKey = latestRowsKey
+
+            context.commit("updateLoadingMoreRows", true)
+
+            try {
+                const data = await requestCache.fetch(
+                    key,
+                    () => getData<i.ListingAPIResponse>(url, params),
+                    state.currentTableName ?? null
+                )
+
+                // Make sure the filters haven't changed in the meantime.
+                if (latestRowsKey != previousKey) {
+                    return false
+                }
+                latestRowsKey = key
+
+                context.commit(
+                    "updateCurrentPageNumber",
+                    state.currentPageNumber + 1
+                )
+                if (page.cursor) {
+                    context.commit("updateCursor", page.cursor)
+                }
+                if (data.count !== null) {
+                    context.commit("updateRowCount", data.count)
+                    context.commit("updateRowCountType", data.count_type)
+                    context.commit("updateRowCountKey", countKey)
+                }
+                context.commit("appendRows", data.rows)
+                context.commit("updateKeysetCursors", data)
+
+                return data.rows.length > 0
+            } catch (error) {
+                console.log(error)
+                return false
+            } finally {
+                context.commit("updateLoadingMoreRows", false)
+            }
         },
         async fetchTableReferences(context, tableName: string) {
             const response = await axios.get(
@@ -205,23 +508,21 @@ export default createStore({
             )
             return response
         },
-        async fetchIds(context, config: i.FetchIdsConfig) {
-            const params: { [key: string]: any } = {}
+        async searchRows(context, config: i.SearchRowsConfig) {
+            const params: { [key: string]: any } = {
+                limit: config.limit
+            }
 
             if (config.search) {
                 params["search"] = config.search
             }
 
-            if (config.limit) {
-                params["limit"] = config.limit
+            if (config.cursor) {
+                params["cursor"] = config.cursor
             }
 
-            if (config.offset) {
-                params["offset"] = config.offset
-            }
-
-            const response = await axios.get(
-                `${BASE_URL}tables/${config.tableName}/ids/`,
+            const response = await axios.get<i.SearchAPIResponse>(
+                `${BASE_URL}tables/${config.tableName}/-/search/`,
                 {
                     params
                 }
@@ -235,43 +536,371 @@ export default createStore({
             return response
         },
         async fetchSingleRow(context, config: i.FetchSingleRowConfig) {
-            const response = await axios.get(
-                `${BASE_URL}tables/${config.tableName}/${config.rowID}/?__readable=true`
+            const url = `${BASE_URL}tables/${config.tableName}/-/rows/${config.rowID}/?__readable=true`
+            const key = requestCache.getKey(url)
+
+            const cachedData = requestCache.get(key)
+
+            if (cachedData !== undefined) {
+                context.commit("updateSelectedRow", cachedData)
+                if (requestCache.isFresh(key)) {
+                    return cachedData
+                }
+            }
+
+            const data = await requestCache.fetch(
+                key,
+                () => getData(url),
+                config.tableName
             )
-            context.commit("updateSelectedRow", response.data)
-            return response
+            context.commit("updateSelectedRow", data)
+            return data
+        },
+        // Called when the user hovers over, or focuses on, a link to a row,
+        // so the row and schema have already loaded when they click it.
+        async prefetchSingleRow(context, config: i.FetchSingleRowConfig) {
+            const url = `${BASE_URL}tables/${config.tableName}/-/rows/${config.rowID}/?__readable=true`
+            const key = requestCache.getKey(url)
+
+            try {
+                await Promise.all([
+                    requestCache.isFresh(key)
+                        ? null
+                        : requestCache.fetch(
+                              key,
+                              () => getData(url),
+                              config.tableName
+                          ),
+                    context.state.schemaCache[config.tableName]
+                        ? null
+                        : context.dispatch("revalidateSchema", config.tableName)
+                ])
+            } catch (error) {
+                console.log(error)
+            }
         },
         async fetchSchema(context, tableName: string) {
+            const cachedSchema: i.CachedSchema | undefined =
+                await context.dispatch("loadCachedSchema", tableName)
+
+            if (cachedSchema) {
+                // Show the page using the cached schema while it's being
+                // revalidated.
+                context.commit("updateSchema", cachedSchema.schema)
+            }
+
+            const schema: i.Schema = await context.dispatch(
+                "revalidateSchema",
+                tableName
+            )
+
+            context.commit("updateSchema", schema)
+
+            return schema
+        },
+        // Schemas are kept between visits, so pages can be shown while the
+        // schema is being revalidated.
+        async loadCachedSchema(
+            context,
+            tableName: string
+        ): Promise<i.CachedSchema | undefined> {
+            let cachedSchema = context.state.schemaCache[tableName]
+
+            if (!cachedSchema) {
+                cachedSchema = await persistentCache.get<i.CachedSchema>(
+                    getSchemaKey(tableName)
+                )
+                if (cachedSchema) {
+                    context.commit("updateSchemaCache", {
+                        tableName,
+                        cachedSchema
+                    })
+                }
+            }
+
+            return cachedSchema
+        },
+        // Fetches the schema, unless the one we've already got is still up
+        // to date.
+        async revalidateSchema(
+            context,
+            tableName: string
+        ): Promise<i.Schema> {
+            const cachedSchema: i.CachedSchema | undefined =
+                await context.dispatch("loadCachedSchema", tableName)
+
             const response = await axios.get<i.Schema>(
-                `${BASE_URL}tables/${tableName}/schema/`
+                `${BASE_URL}tables/${tableName}/schema/`,
+                {
+                    headers: cachedSchema
+                        ? { "If-None-Match": cachedSchema.etag }
+                        : {},
+                    validateStatus: (status) =>
+                        (status >= 200 && status < 300) || status == 304
+                }
             )
-            context.commit("updateSchema", response.data)
 
-            return response
+            let schema: i.Schema
+
+            if (response.status == 304 && cachedSchema) {
+                schema = cachedSchema.schema
+            } else {
+                schema = response.data
+                const etag = response.headers["etag"]
+                if (etag) {
+                    context.commit("updateSchemaCache", {
+                        tableName,
+                        cachedSchema: { etag, schema }
+                    })
+                    persistentCache.set(getSchemaKey(tableName), {
+                        etag,
+                        schema
+                    })
+                }
+            }
+
+            return schema
+        },
+        // Any cached responses for the table are out of date once its rows
+        // have changed.
+        invalidateTable(context, tableName: string) {
+            requestCache.invalidateTable(tableName)
+            context.commit("updateRowCountKey", null)
         },
         async createRow(context, config: i.CreateRow) {
             const response = await axios.post(
                 `${BASE_URL}tables/${config.tableName}/`,
                 config.data
             )
+            context.dispatch("invalidateTable", config.tableName)
             return response
         },
         async deleteRow(context, config: i.DeleteRow) {
             const response = await axios.delete(
                 `${BASE_URL}tables/${config.tableName}/${config.rowID}/`
             )
+            context.dispatch("invalidateTable", config.tableName)
+            return response
+        },
+        async bulkDeleteRows(context, config: i.BulkDeleteRows) {
+            const response = await axios.post<i.BulkActionAPIResponse>(
+                `${BASE_URL}tables/${config.tableName}/-/bulk-delete/`,
+                { row_ids: config.rowIDs }
+            )
+            context.dispatch("invalidateTable", config.tableName)
+            return response
+        },
+        async bulkUpdateRows(context, config: i.BulkUpdateRows) {
+            const response = await axios.post<i.BulkActionAPIResponse>(
+                `${BASE_URL}tables/${config.tableName}/-/bulk-update/`,
+                {
+                    row_ids: config.rowIDs,
+                    column_name: config.columnName,
+                    value: config.value
+                }
+            )
+            context.dispatch("invalidateTable", config.tableName)
+            return response
+        },
+        // The user has explicitly selected every matching row, so the API is
+        // told it's OK if there aren't any filters (`__all_rows`).
+        async bulkDeleteMatchingRows(context, tableName: string) {
+            const response = await axios.post<i.BulkJobAPIResponse>(
+                `${BASE_URL}tables/${tableName}/-/bulk-delete/matching/`,
+                {},
+                { params: { ...context.state.filterParams, __all_rows: true } }
+            )
+            return response
+        },
+        async bulkUpdateMatchingRows(
+            context,
+            config: i.BulkUpdateMatchingRows
+        ) {
+            const response = await axios.post<i.BulkJobAPIResponse>(
+                `${BASE_URL}tables/${config.tableName}/-/bulk-update/matching/`,
+                { column_name: config.columnName, value: config.value },
+                { params: { ...context.state.filterParams, __all_rows: true } }
+            )
             return response
         },
+        // Polls the job until it has finished, showing the progress, and
+        // then the outcome.
+        async waitForBulkJob(
+            context,
+            jobID: string
+        ): Promise<i.BulkJobAPIResponse> {
+            while (true) {
+                const response = await axios.get<i.BulkJobAPIResponse>(
+                    `${BASE_URL}bulk-jobs/${jobID}/`
+                )
+                const job = response.data
+                const verb = job.action == "delete" ? "deleted" : "updated"
+
+                if (job.status != "running") {
+                    context.dispatch("invalidateTable", job.table_name)
+                }
+
+                if (job.status == "failed") {
+                    context.commit("updateApiResponseMessage", {
+                        contents: `Unable to finish - ${job.succeeded} rows ${verb} (${job.detail})`,
+                        type: "error"
+                    })
+                    return job
+                }
+
+                if (job.status == "completed") {
+                    const errorString = job.errors
+                        .map((error) => `${error.row_id}: ${error.detail}`)
+                        .join(", ")
+                    context.commit(
+                        "updateApiResponseMessage",
+                        job.error_count > 0
+                            ? {
+                                  contents: `${job.succeeded} rows ${verb}, ${job.error_count} failed (${errorString})`,
+                                  type: "error"
+                              }
+                            : {
+                                  contents: `Successfully ${verb} ${job.succeeded} rows`,
+                                  type: "success"
+                              }
+                    )
+                    return job
+                }
+
+                const progress = `${job.processed.toLocaleString()} / ${
+                    job.total?.toLocaleString() ?? "?"
+                }`
+                const message: i.APIResponseMessage = {
+                    contents: `${
+                        job.action == "delete" ? "Deleting" : "Updating"
+                    } rows (${progress})`,
+                    type: "neutral"
+                }
+                context.commit("updateApiResponseMessage", message)
+
+                await new Promise((resolve) => setTimeout(resolve, 1000))
+            }
+        },
         async updateRow(context, config: i.UpdateRow) {
             const response = await axios.patch(
                 `${BASE_URL}tables/${config.tableName}/${config.rowID}/`,
                 config.data
             )
+            context.dispatch("invalidateTable", config.tableName)
             return response
         },
         async fetchUser(context) {
             const response = await axios.get(`${BASE_URL}user/`)
             context.commit("updateUser", response.data)
+        },
+        /**
+         * Fetches everything the UI needs on startup in a single request. It
+         * requires the user to be logged in.
+         */
+        async bootstrap(context) {
+            const languageCode = localStorageUtils.getDefaultLanguage()
+            const cachedTranslation = languageCode
+                ? await translationCache.get(languageCode)
+                : undefined
+
+            const response = await axios.get<i.BootstrapAPIResponse>(
+                `${BASE_URL}bootstrap/`,
+                {
+                    params: {
+                        language_code: languageCode ?? undefined,
+                        browser_language_code: navigator.language,
+                        translation_hash: cachedTranslation?.contentHash
+                    }
+                }
+            )
+            const data = response.data
+
+            await context.dispatch("setupCaching", data.meta)
+
+            // If the translation was omitted, our cached copy is current.
+            const translation =
+                data.translation ?? cachedTranslation?.translation
+
+            if (data.translation) {
+                const contentHash = data.translations.translations.find(
+                    (i) => i.language_code == data.language_code
+                )?.content_hash
+                if (contentHash) {
+                    await translationCache.set({
+                        contentHash,
+                        translation: data.translation
+                    })
+                }
+            }
+
+            // The translation is cached separately.
+            await persistentCache.set(BOOTSTRAP_KEY, {
+                ...data,
+                translation: null
+            })
+
+            await context.dispatch("applyBootstrap", { data, translation })
+        },
+        /**
+         * If the bootstrap data from the user's last visit is cached, the UI
+         * uses it straight away, and it's revalidated in the background.
+         * Returns `false` if nothing is cached.
+         */
+        async bootstrapFromCache(context): Promise<boolean> {
+            const data =
+                await persistentCache.get<i.BootstrapAPIResponse>(BOOTSTRAP_KEY)
+            const cachedTranslation = data
+                ? await translationCache.get(data.language_code)
+                : undefined
+
+            if (!data || !cachedTranslation) {
+                return false
+            }
+
+            try {
+                await context.dispatch("applyBootstrap", {
+                    data,
+                    translation: cachedTranslation.translation
+                })
+            } catch (error) {
+                console.log(error)
+                return false
+            }
+
+            context.dispatch("bootstrap").catch((error) => {
+                console.log(error)
+                // The session has expired - the user is redirected to the
+                // login page.
+                if (error.response?.status == 401) {
+                    context.dispatch("clearCachedBootstrap")
+                }
+            })
+
+            return true
+        },
+        async applyBootstrap(
+            context,
+            config: {
+                data: i.BootstrapAPIResponse
+                translation: i.TranslationAPIResponse | undefined
+            }
+        ) {
+            const { data, translation } = config
+
+            await context.dispatch("applyMeta", data.meta)
+            context.commit("updateTranslations", data.translations.translations)
+            if (translation) {
+                await context.dispatch("applyTranslation", translation)
+            }
+            context.commit("updateUser", data.user)
+            context.commit("updateTableGroups", data.tables)
+            context.commit("updateFormConfigs", data.forms)
+            context.commit("updateFormGroups", data.form_groups)
+            context.commit("updateCustomLinks", data.links)
+        },
+        // It contains the user's details, so is removed when they log out.
+        async clearCachedBootstrap() {
+            await persistentCache.delete(BOOTSTRAP_KEY)
         }
     }
 })
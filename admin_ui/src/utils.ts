@@ -5,7 +5,7 @@ import {
     isNullable
 } from "@/interfaces"
 import router from "./router"
-import moment from "moment"
+import { durationToSeconds, secondsToDuration } from "./datetime"
 
 /*****************************************************************************/
 // Filters
@@ -27,8 +27,7 @@ export function readable(value: string) {
  * @returns A string of nicelly formated timeValue
  */
 export function readableInterval(timeValue: string) {
-    const parsedTimeValue = moment.duration(timeValue)
-    const timeRange = parsedTimeValue.asSeconds()
+    const timeRange = durationToSeconds(timeValue)
     if (timeRange === 0) {
         return "0 seconds"
     }
@@ -65,7 +64,7 @@ export function readableInterval(timeValue: string) {
  * @returns ISO 8601 duration string
  */
 export function secondsToISO8601Duration(value: number) {
-    return moment.duration(value, "seconds").toISOString()
+    return secondsToDuration(value)
 }
 
 export function titleCase(value: string) {
@@ -209,3 +208,16 @@ export const syncQueryParams = (
         query
     })
 }
+
+/**
+ * Runs the callback once the browser is idle, so it doesn't slow down
+ * rendering. Safari doesn't support `requestIdleCallback`, so we fall back
+ * to a timeout.
+ */
+export function runWhenIdle(callback: () => void) {
+    if ("requestIdleCallback" in window) {
+        window.requestIdleCallback(callback, { timeout: 2000 })
+    } else {
+        setTimeout(callback, 200)
+    }
+}
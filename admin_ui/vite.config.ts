@@ -1,12 +1,55 @@
 import { fileURLToPath, URL } from "node:url"
+import { brotliCompressSync, constants, gzipSync } from "node:zlib"
 
-import { defineConfig } from "vite"
+import { defineConfig, type Plugin } from "vite"
 import vue from "@vitejs/plugin-vue"
 import vueDevTools from "vite-plugin-vue-devtools"
 
+// Writes Brotli and gzip compressed versions of the assets alongside the
+// originals. Piccolo Admin sends them to browsers which support them, so they
+// don't need compressing on each request.
+function compressAssets(): Plugin {
+    return {
+        name: "compress-assets",
+        apply: "build",
+        generateBundle(_, bundle) {
+            for (const [fileName, output] of Object.entries(bundle)) {
+                if (!/\.(js|css|svg)$/.test(fileName)) {
+                    continue
+                }
+
+                const source = Buffer.from(
+                    output.type == "chunk" ? output.code : output.source
+                )
+
+                // Not worth compressing.
+                if (source.length < 1024) {
+                    continue
+                }
+
+                this.emitFile({
+                    type: "asset",
+                    fileName: `${fileName}.br`,
+                    source: brotliCompressSync(source, {
+                        params: {
+                            [constants.BROTLI_PARAM_QUALITY]:
+                                constants.BROTLI_MAX_QUALITY
+                        }
+                    })
+                })
+                this.emitFile({
+                    type: "asset",
+                    fileName: `${fileName}.gz`,
+                    source: gzipSync(source, { level: 9 })
+                })
+            }
+        }
+    }
+}
+
 // https://vite.dev/config/
 export default defineConfig({
-    plugins: [vue(), vueDevTools()],
+    plugins: [vue(), vueDevTools(), compressAssets()],
     resolve: {
         alias: {
             "@": fileURLToPath(new URL("./src", import.meta.url))
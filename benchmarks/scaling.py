@@ -0,0 +1,437 @@
+"""
+Measures how Piccolo Admin scales with the number of tables - how long
+startup takes, how much memory it uses, and the latency of the main API
+endpoints.
+
+The tables are generated, and stored in a temporary SQLite database.
+
+To run the benchmarks against the checked out code, and save the results,
+run this as a module from the root of the project::
+
+    python -m benchmarks.scaling run --output=after.json --table_counts=10,100
+
+To benchmark a release instead, install it, and run this as a script from
+outside the project, so the installed package is imported::
+
+    pip install piccolo_admin==1.0.0
+    python path/to/benchmarks/scaling.py run --output=before.json
+
+Older releases don't have all of the features used here, so they're only
+used when available (see ``supports_lazy_tables`` and ``resolve_paths``).
+
+To compare the results from two versions::
+
+    python -m benchmarks.scaling compare before.json after.json
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+import targ
+from piccolo.apps.user.tables import BaseUser
+from piccolo.columns.column_types import (
+    ForeignKey,
+    Integer,
+    Timestamp,
+    Varchar,
+)
+from piccolo.engine.sqlite import SQLiteEngine
+from piccolo.table import Table, create_db_tables_sync, create_table_class
+from piccolo_api.session_auth.tables import SessionsBase
+
+from piccolo_admin.endpoints import AdminRouter, create_admin, get_all_tables
+from piccolo_admin.version import __VERSION__
+
+USERNAME = "bench"
+PASSWORD = "bench123"
+
+
+def create_tables(
+    table_count: int, chain_length: int, db: SQLiteEngine
+) -> list[type[Table]]:
+    """
+    Each table has a foreign key to the previous one, in chains of
+    ``chain_length`` tables.
+    """
+    tables: list[type[Table]] = []
+
+    for index in range(table_count):
+        columns: dict[str, Any] = {
+            "name": Varchar(length=100),
+            "rating": Integer(),
+            "created_on": Timestamp(),
+        }
+        if index % chain_length:
+            columns["parent"] = ForeignKey(references=tables[-1])
+
+        tables.append(
+            create_table_class(
+                class_name=f"BenchTable{index}",
+                class_kwargs={"tablename": f"bench_table_{index}", "db": db},
+                class_members=columns,
+            )
+        )
+
+    return tables
+
+
+def create_auth_tables(
+    db: SQLiteEngine,
+) -> tuple[type[BaseUser], type[SessionsBase]]:
+    user_table = create_table_class(
+        class_name="BenchUser",
+        bases=(BaseUser,),
+        class_kwargs={"tablename": "piccolo_user", "db": db},
+    )
+    session_table = create_table_class(
+        class_name="BenchSessions",
+        bases=(SessionsBase,),
+        class_kwargs={"tablename": "sessions", "db": db},
+    )
+    return user_table, session_table  # type: ignore
+
+
+def supports_lazy_tables() -> bool:
+    """
+    ``lazy_tables`` was added in a later release, so older releases can only
+    be benchmarked without it.
+    """
+    return "lazy_tables" in inspect.signature(AdminRouter).parameters
+
+
+def get_median_duration(function: Callable[[], Any], repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def get_peak_memory(function: Callable[[], Any]) -> int:
+    """
+    Returns the peak memory allocated while running the function, in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def summarise_latencies(durations: list[float]) -> dict[str, float]:
+    quantiles = statistics.quantiles(durations, n=100, method="inclusive")
+    return {
+        "mean_ms": round(statistics.mean(durations) * 1000, 3),
+        "p50_ms": round(quantiles[49] * 1000, 3),
+        "p95_ms": round(quantiles[94] * 1000, 3),
+    }
+
+
+async def resolve_paths(
+    client: httpx.AsyncClient, paths: dict[str, tuple[str, ...]]
+) -> dict[str, str]:
+    """
+    Each endpoint has a list of paths to try, in order of preference, so
+    older releases which are missing the newer endpoints fall back to the
+    ones which exist in every release.
+    """
+    resolved = {}
+
+    for name, candidates in paths.items():
+        for path in candidates:
+            response = await client.get(path)
+            # In older releases, the newer paths are handled by PiccoloCRUD's
+            # `/{row_id}/` endpoint, which returns a 400 or 404.
+            if response.is_success:
+                resolved[name] = path
+                break
+        else:
+            response.raise_for_status()
+
+    return resolved
+
+
+async def measure_latencies(
+    app: AdminRouter, paths: dict[str, tuple[str, ...]], requests: int
+) -> dict[str, dict[str, float]]:
+    """
+    Sends requests to the app in-process, so only Piccolo Admin (and the
+    database queries) are measured, and not the network.
+    """
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://localhost"
+    ) as client:
+        response = await client.get("/")
+        csrftoken = response.cookies["csrftoken"]
+        response = await client.post(
+            "/public/login/",
+            json={
+                "username": USERNAME,
+                "password": PASSWORD,
+                "csrftoken": csrftoken,
+            },
+            headers={"X-CSRFToken": csrftoken},
+        )
+        response.raise_for_status()
+
+        results = {}
+
+        # This also warms up any caches, so the first request doesn't skew
+        # the results.
+        for name, path in (await resolve_paths(client, paths)).items():
+            durations = []
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = await client.get(path)
+                durations.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+            results[name] = summarise_latencies(durations)
+
+        return results
+
+
+def benchmark(
+    table_count: int,
+    chain_length: int,
+    rows: int,
+    repeat: int,
+    requests: int,
+    directory: str,
+) -> list[dict[str, Any]]:
+    db = SQLiteEngine(path=os.path.join(directory, f"{table_count}.sqlite"))
+    tables = create_tables(table_count, chain_length, db)
+    user_table, session_table = create_auth_tables(db)
+
+    create_db_tables_sync(user_table, session_table, *tables)
+    user_table.create_user_sync(
+        username=USERNAME,
+        password=PASSWORD,
+        active=True,
+        admin=True,
+        superuser=True,
+    )
+
+    # The last table has the longest chain of foreign keys.
+    listing_table = tables[-1]
+    listing_table.insert(
+        *[
+            listing_table(name=f"Row {i}", rating=i % 10)  # type: ignore
+            for i in range(rows)
+        ]
+    ).run_sync()
+    tablename = listing_table._meta.tablename
+
+    # The `listing` endpoint was added in a later release - the PiccoloCRUD
+    # endpoint is used instead in older releases.
+    base_path = f"/api/tables/{tablename}"
+    paths = {
+        "tables": ("/api/tables/",),
+        "tables_grouped": ("/api/tables/grouped/",),
+        "schema": (f"{base_path}/schema/",),
+        "listing": (
+            f"{base_path}/-/listing/?__readable=true",
+            f"{base_path}/?__readable=true",
+        ),
+        "listing_filtered": (
+            f"{base_path}/-/listing/?rating=5&__order=-name",
+            f"{base_path}/?rating=5&__order=-name",
+        ),
+    }
+
+    results = []
+
+    for lazy_tables in (False, True) if supports_lazy_tables() else (False,):
+        admin_kwargs: dict[str, Any] = {
+            "auth_table": user_table,
+            "session_table": session_table,
+        }
+        if lazy_tables:
+            admin_kwargs["lazy_tables"] = True
+
+        print(
+            f"{table_count} tables "
+            f"({'lazy' if lazy_tables else 'eager'}) ...",
+            file=sys.stderr,
+        )
+
+        result: dict[str, Any] = {
+            "table_count": table_count,
+            "lazy_tables": lazy_tables,
+            "get_all_tables_seconds": get_median_duration(
+                lambda: get_all_tables(tables), repeat=repeat
+            ),
+            "admin_router_init_seconds": get_median_duration(
+                lambda: AdminRouter(*tables, **admin_kwargs), repeat=repeat
+            ),
+            "create_admin_seconds": get_median_duration(
+                lambda: create_admin(tables, **admin_kwargs), repeat=repeat
+            ),
+            "create_admin_peak_memory_bytes": get_peak_memory(
+                lambda: create_admin(tables, **admin_kwargs)
+            ),
+        }
+
+        app = create_admin(tables, **admin_kwargs)
+        result["endpoints"] = asyncio.run(
+            measure_latencies(app, paths=paths, requests=requests)
+        )
+        results.append(result)
+
+    return results
+
+
+def run(
+    output: str = "benchmark_results.json",
+    table_counts: str = "10,100,1000",
+    chain_length: int = 10,
+    rows: int = 1000,
+    repeat: int = 3,
+    requests: int = 50,
+):
+    """
+    Run the benchmarks, and save the results as JSON.
+
+    :param output:
+        Where to save the results.
+    :param table_counts:
+        A comma separated list of how many tables to generate.
+    :param chain_length:
+        Each table has a foreign key to the previous one, in chains of this
+        length.
+    :param rows:
+        How many rows to insert into the table used for the listing
+        endpoint.
+    :param repeat:
+        How many times to time each startup step - the median is recorded.
+    :param requests:
+        How many requests to send to each endpoint.
+
+    """
+    # The admin isn't served to anyone, so it doesn't need to be secure.
+    warnings.filterwarnings("ignore", message="If running sessions")
+
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for table_count in [int(i) for i in table_counts.split(",")]:
+            results.extend(
+                benchmark(
+                    table_count=table_count,
+                    chain_length=chain_length,
+                    rows=rows,
+                    repeat=repeat,
+                    requests=requests,
+                    directory=directory,
+                )
+            )
+
+    data = {
+        "piccolo_admin_version": __VERSION__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(tz=timezone.utc).isoformat(),
+        "results": results,
+    }
+
+    with open(output, "w") as f:
+        json.dump(data, f, indent=4)
+
+    print(f"Saved results to {output}", file=sys.stderr)
+
+
+def flatten(result: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    output = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            output.update(flatten(value, prefix=f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            output[f"{prefix}{key}"] = value
+    return output
+
+
+def compare(before: str, after: str):
+    """
+    Compare the results of two benchmark runs.
+
+    :param before:
+        The path to the earlier results.
+    :param after:
+        The path to the later results.
+
+    """
+    with open(before) as f:
+        before_data = json.load(f)
+    with open(after) as f:
+        after_data = json.load(f)
+
+    print(
+        f"{before_data['piccolo_admin_version']} -> "
+        f"{after_data['piccolo_admin_version']}\n"
+    )
+
+    after_results = {
+        (i["table_count"], i["lazy_tables"]): i for i in after_data["results"]
+    }
+
+    for before_result in before_data["results"]:
+        key = (before_result["table_count"], before_result["lazy_tables"])
+        after_result = after_results.get(key)
+        if after_result is None:
+            continue
+
+        print(
+            f"{key[0]} tables ({'lazy' if key[1] else 'eager'})\n" + "-" * 79
+        )
+
+        before_values = flatten(before_result)
+        after_values = flatten(after_result)
+
+        for name, before_value in before_values.items():
+            if name == "table_count" or name not in after_values:
+                continue
+            after_value = after_values[name]
+            change = (
+                f"{(after_value - before_value) / before_value:+.1%}"
+                if before_value
+                else "n/a"
+            )
+            print(
+                f"{name:<45} {before_value:>10.4g} {after_value:>10.4g} "
+                f"{change:>9}"
+            )
+
+        print()
+
+
+def main():
+    cli = targ.CLI(description="Piccolo Admin scaling benchmarks")
+    cli.register(run)
+    cli.register(compare)
+    cli.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -64,7 +64,7 @@ def test_add_sort_column(page: Page, dev_server):
     )
     with page.expect_response(
         lambda response: response.url
-        == f"{BASE_URL}/api/tables/sorted_columns/?__readable=true&__order=integer,letter&__page_size=15&__page=1"  # noqa: E501
+        == f"{BASE_URL}/api/tables/sorted_columns/-/listing/?__readable=true&__order=integer,letter&__page_size=15&__page=1&__count=false"  # noqa: E501
         and response.request.method == "GET"
         and response.status == 200
     ):
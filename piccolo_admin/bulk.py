@@ -0,0 +1,560 @@
+"""
+Modifies many rows at once - either the rows selected in the UI, or every
+row matching a filter, in which case the work is done in the background.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine, Sequence
+from typing import Any, Literal, Optional, Union
+
+from piccolo.apps.user.tables import BaseUser
+from piccolo.columns.base import Column
+from piccolo.query.methods.select import Select
+from piccolo.table import Table
+from piccolo_api.crud.endpoints import PiccoloCRUD
+from piccolo_api.crud.hooks import (
+    HookType,
+    execute_delete_hooks,
+    execute_patch_hooks,
+)
+from pydantic import BaseModel, Field, ValidationError
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+
+from .count import ExactCount
+
+logger = logging.getLogger(__name__)
+
+# How many rows are modified in each transaction.
+BULK_BATCH_SIZE = 100
+
+# A job only keeps this many errors, so its progress stays small, even if
+# every row fails.
+MAX_JOB_ERRORS = 100
+
+# The parts of the request which hooks might need (for example to check who
+# the user is), and which are safe to keep after the response has been sent.
+DETACHED_SCOPE_KEYS = (
+    "type",
+    "http_version",
+    "method",
+    "scheme",
+    "server",
+    "client",
+    "root_path",
+    "path",
+    "raw_path",
+    "query_string",
+    "headers",
+    "path_params",
+    "app",
+    "user",
+    "auth",
+)
+
+RowID = Union[int, str]
+
+
+class BulkActionError(BaseModel):
+    row_id: RowID
+    detail: str
+
+
+def batched(items: Sequence[Any], batch_size: int) -> list[list[Any]]:
+    return [
+        list(items[index : index + batch_size])  # noqa: E203
+        for index in range(0, len(items), batch_size)
+    ]
+
+
+# The largest integer a Javascript ``Number`` can represent exactly.
+MAX_SAFE_INTEGER = 2**53 - 1
+
+
+def serialise_row_id(row_id: Any) -> RowID:
+    """
+    Primary keys which aren't integers (for example UUIDs) are returned as
+    strings. So are integers which are too large for the browser to parse
+    without losing precision.
+    """
+    if isinstance(row_id, int) and abs(row_id) <= MAX_SAFE_INTEGER:
+        return row_id
+    return str(row_id)
+
+
+def detach_request(request: Request) -> Request:
+    """
+    Background jobs pass a request to the hooks, but shouldn't keep the
+    original one alive (along with its body, and connection) until they
+    finish. This returns a copy containing just the request's metadata.
+    """
+    return Request(
+        scope={
+            key: value
+            for key, value in request.scope.items()
+            if key in DETACHED_SCOPE_KEYS
+        }
+    )
+
+
+def get_error_detail(exception: Exception) -> str:
+    if isinstance(exception, HTTPException):
+        return str(exception.detail)
+    return str(exception) or exception.__class__.__name__
+
+
+def parse_row_ids(
+    table: type[Table], row_ids: Sequence[RowID]
+) -> tuple[list[Any], list[BulkActionError]]:
+    """
+    Converts the row IDs to the primary key's type, removing duplicates.
+    """
+    primary_key = table._meta.primary_key
+    parsed_row_ids: dict[Any, None] = {}
+    errors: list[BulkActionError] = []
+
+    for row_id in row_ids:
+        try:
+            parsed_row_ids[primary_key.value_type(row_id)] = None
+        except (AttributeError, TypeError, ValueError):
+            errors.append(
+                BulkActionError(row_id=row_id, detail="Invalid row ID.")
+            )
+
+    return list(parsed_row_ids), errors
+
+
+async def get_existing_row_ids(
+    table: type[Table], row_ids: list[Any]
+) -> set[Any]:
+    primary_key = table._meta.primary_key
+    response = (
+        await table.select(primary_key)
+        .where(primary_key.is_in(row_ids))
+        .output(as_list=True)
+        .run()
+    )
+    return set(response)
+
+
+def get_update_values(
+    piccolo_crud: PiccoloCRUD, column_name: str, value: Any
+) -> dict[Column, Any]:
+    """
+    Validates the new value for the column, in the same way as when
+    updating a single row. Passwords are hashed later, by
+    ``hash_password``, once the hooks have run.
+
+    :raises HTTPException:
+        If the column doesn't exist, or the value is invalid.
+
+    """
+    table = piccolo_crud.table
+
+    column = next(
+        (
+            i
+            for i in table._meta.non_default_columns
+            if i._meta.name == column_name
+        ),
+        None,
+    )
+    if column is None:
+        raise HTTPException(
+            status_code=400, detail=f"Unrecognised column - {column_name}."
+        )
+
+    try:
+        model = piccolo_crud.pydantic_model_optional(
+            **piccolo_crud._clean_data({column_name: value})
+        )
+    except ValidationError as exception:
+        raise HTTPException(status_code=400, detail=str(exception))
+
+    return {column: getattr(model, column_name)}
+
+
+def hash_password(
+    table: type[Table], values: dict[Any, Any]
+) -> dict[Any, Any]:
+    """
+    Like ``PiccoloCRUD.patch_single``, if a user's password is being
+    changed, it's validated and hashed after the ``pre_patch`` hooks have
+    run, so the hooks receive the password which the user entered.
+
+    :raises ValueError:
+        If the password is invalid.
+
+    """
+    if not issubclass(table, BaseUser):
+        return values
+
+    values = dict(values)
+    for key, value in list(values.items()):
+        name = key._meta.name if isinstance(key, Column) else key
+        if name == "password" and value:
+            table._validate_password(value)
+            values[key] = table.hash_password(value)
+
+    return values
+
+
+async def delete_rows(
+    piccolo_crud: PiccoloCRUD, request: Request, row_ids: list[Any]
+) -> tuple[list[Any], list[BulkActionError]]:
+    """
+    Deletes a batch of rows in a transaction, after running the
+    ``pre_delete`` hooks for each one. If the transaction fails (for example
+    due to a foreign key constraint), the rows are deleted one at a time, so
+    only the problematic rows are reported as errors.
+
+    :returns:
+        The deleted row IDs, and the errors.
+
+    """
+    table = piccolo_crud.table
+    primary_key = table._meta.primary_key
+    existing_row_ids = await get_existing_row_ids(table, row_ids)
+    errors: list[BulkActionError] = []
+
+    row_ids_to_delete = []
+    for row_id in row_ids:
+        if row_id not in existing_row_ids:
+            errors.append(
+                BulkActionError(
+                    row_id=serialise_row_id(row_id),
+                    detail="The resource doesn't exist",
+                )
+            )
+            continue
+
+        try:
+            if piccolo_crud._hook_map:
+                await execute_delete_hooks(
+                    hooks=piccolo_crud._hook_map,
+                    hook_type=HookType.pre_delete,
+                    row_id=row_id,
+                    request=request,
+                )
+        except Exception as exception:
+            errors.append(
+                BulkActionError(
+                    row_id=serialise_row_id(row_id),
+                    detail=get_error_detail(exception),
+                )
+            )
+            continue
+
+        row_ids_to_delete.append(row_id)
+
+    if not row_ids_to_delete:
+        return [], errors
+
+    try:
+        async with table._meta.db.transaction():
+            await table.delete().where(
+                primary_key.is_in(row_ids_to_delete)
+            ).run()
+    except Exception:
+        deleted_row_ids = []
+        for row_id in row_ids_to_delete:
+            try:
+                await table.delete().where(primary_key == row_id).run()
+            except Exception as exception:
+                errors.append(
+                    BulkActionError(
+                        row_id=serialise_row_id(row_id),
+                        detail=get_error_detail(exception),
+                    )
+                )
+            else:
+                deleted_row_ids.append(row_id)
+        return deleted_row_ids, errors
+
+    return row_ids_to_delete, errors
+
+
+async def update_rows(
+    piccolo_crud: PiccoloCRUD,
+    request: Request,
+    row_ids: list[Any],
+    values: dict[Column, Any],
+) -> tuple[list[Any], list[BulkActionError]]:
+    """
+    Updates a batch of rows, after running the ``pre_patch`` hooks for each
+    one. Hooks can modify the values for each row, so rows are grouped by
+    the values their hooks return, and each group is updated using
+    ``UPDATE ... WHERE id IN (...)``. Passwords are hashed once per group,
+    after the hooks have run.
+
+    It should be called within a transaction.
+
+    :returns:
+        The updated row IDs, and the errors.
+
+    """
+    table = piccolo_crud.table
+    primary_key = table._meta.primary_key
+    existing_row_ids = await get_existing_row_ids(table, row_ids)
+    errors: list[BulkActionError] = []
+
+    # Maps a serialised version of the values to the values, and the rows
+    # they apply to.
+    groups: dict[str, tuple[dict[Any, Any], list[Any]]] = {}
+
+    for row_id in row_ids:
+        if row_id not in existing_row_ids:
+            errors.append(
+                BulkActionError(
+                    row_id=serialise_row_id(row_id),
+                    detail="The resource doesn't exist",
+                )
+            )
+            continue
+
+        row_values: dict[Any, Any] = dict(values)
+        try:
+            if piccolo_crud._hook_map:
+                row_values = await execute_patch_hooks(
+                    hooks=piccolo_crud._hook_map,
+                    hook_type=HookType.pre_patch,
+                    row_id=row_id,
+                    values=row_values,
+                    request=request,
+                )
+        except Exception as exception:
+            errors.append(
+                BulkActionError(
+                    row_id=serialise_row_id(row_id),
+                    detail=get_error_detail(exception),
+                )
+            )
+            continue
+
+        key = json.dumps(
+            {
+                (k._meta.name if isinstance(k, Column) else k): v
+                for k, v in row_values.items()
+            },
+            sort_keys=True,
+            default=str,
+        )
+        groups.setdefault(key, (row_values, []))[1].append(row_id)
+
+    updated_row_ids: list[Any] = []
+    for row_values, group_row_ids in groups.values():
+        try:
+            row_values = hash_password(table, row_values)
+        except ValueError as exception:
+            errors.extend(
+                BulkActionError(
+                    row_id=serialise_row_id(row_id),
+                    detail=get_error_detail(exception),
+                )
+                for row_id in group_row_ids
+            )
+            continue
+
+        await table.update(row_values).where(
+            primary_key.is_in(group_row_ids)
+        ).run()
+        updated_row_ids.extend(group_row_ids)
+
+    return updated_row_ids, errors
+
+
+async def iterate_row_ids(
+    get_query: Callable[[], Select], batch_size: int
+) -> AsyncIterator[list[Any]]:
+    """
+    Yields the primary keys of the rows returned by the query, in batches.
+
+    Rows are fetched relative to the last primary key in the previous batch,
+    rather than using ``OFFSET``, so it doesn't matter if the rows are
+    deleted, or no longer match the filters once they're updated.
+
+    :param get_query:
+        Returns a new query selecting the primary key, with the filters
+        applied. Piccolo queries are modified in place, so each batch needs
+        its own.
+
+    """
+    last_row_id = None
+
+    while True:
+        query = get_query()
+        primary_key = query.table._meta.primary_key
+        if last_row_id is not None:
+            query = query.where(primary_key > last_row_id)
+
+        row_ids = (
+            await query.order_by(primary_key)
+            .limit(batch_size)
+            .output(as_list=True)
+            .run()
+        )
+        if not row_ids:
+            break
+
+        yield row_ids
+
+        if len(row_ids) < batch_size:
+            break
+        last_row_id = row_ids[-1]
+
+
+###############################################################################
+
+
+JobStatus = Literal["running", "completed", "failed"]
+
+
+class Job(BaseModel):
+    """
+    The progress of a bulk action on every row matching a filter.
+    """
+
+    job_id: str
+    table_name: str
+    action: Literal["delete", "update"]
+    status: JobStatus = "running"
+    total: Optional[int] = Field(
+        default=None,
+        description=(
+            "The number of rows matching the filters when the job started - "
+            "`null` until they've been counted."
+        ),
+    )
+    processed: int = 0
+    succeeded: int = 0
+    error_count: int = 0
+    errors: list[BulkActionError] = Field(
+        default_factory=list,
+        description=f"The first {MAX_JOB_ERRORS} errors.",
+    )
+    detail: Optional[str] = Field(
+        default=None, description="Why the job failed."
+    )
+
+    def add_results(self, row_ids: list[Any], errors: list[BulkActionError]):
+        self.processed += len(row_ids) + len(errors)
+        self.succeeded += len(row_ids)
+        self.error_count += len(errors)
+        self.errors.extend(errors[: MAX_JOB_ERRORS - len(self.errors)])
+
+
+class JobManager:
+    """
+    Runs bulk actions in the background, and keeps track of their progress.
+
+    Jobs only exist in the memory of the process which started them, so if
+    the app runs in several processes, their progress is only available
+    from that process. Once ``max_jobs`` have finished, the oldest ones are
+    forgotten.
+
+    Each job is only visible to the user who started it.
+    """
+
+    def __init__(self, max_jobs: int = 100):
+        self.max_jobs = max_jobs
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        # Maps the job IDs to the user who started each job.
+        self._user_ids: dict[str, Any] = {}
+        # Keep a reference to the tasks, so they aren't garbage collected.
+        self._tasks: set[asyncio.Task] = set()
+
+    def get(self, job_id: str, user_id: Any) -> Optional[Job]:
+        """
+        Returns ``None`` if the job doesn't exist, or was started by a
+        different user.
+        """
+        if job_id not in self._jobs or self._user_ids[job_id] != user_id:
+            return None
+        return self._jobs[job_id]
+
+    def _discard_finished_jobs(self):
+        finished_job_ids = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status != "running"
+        ]
+        for job_id in finished_job_ids[: -self.max_jobs or None]:
+            del self._jobs[job_id]
+            del self._user_ids[job_id]
+
+    def start(
+        self,
+        table_name: str,
+        action: Literal["delete", "update"],
+        user_id: Any,
+        run: Callable[[Job], Coroutine[Any, Any, None]],
+        on_finish: Optional[Callable[[], None]] = None,
+    ) -> Job:
+        """
+        :param user_id:
+            The user who started the job.
+        :param run:
+            Does the work, updating the job's progress as it goes.
+        :param on_finish:
+            Called once the job has finished, whether it succeeded or not.
+
+        """
+        self._discard_finished_jobs()
+
+        job = Job(
+            job_id=uuid.uuid4().hex, table_name=table_name, action=action
+        )
+        self._jobs[job.job_id] = job
+        self._user_ids[job.job_id] = user_id
+
+        async def run_job():
+            try:
+                await run(job)
+            except Exception as exception:
+                logger.exception("Bulk job failed")
+                job.status = "failed"
+                job.detail = get_error_detail(exception)
+            else:
+                job.status = "completed"
+            finally:
+                if on_finish:
+                    on_finish()
+
+        task = asyncio.create_task(run_job())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return job
+
+
+async def delete_matching_rows(
+    job: Job,
+    piccolo_crud: PiccoloCRUD,
+    request: Request,
+    get_query: Callable[[], Select],
+):
+    job.total = (await ExactCount().count(get_query(), filtered=True)).count
+
+    async for row_ids in iterate_row_ids(get_query, BULK_BATCH_SIZE):
+        job.add_results(*await delete_rows(piccolo_crud, request, row_ids))
+
+
+async def update_matching_rows(
+    job: Job,
+    piccolo_crud: PiccoloCRUD,
+    request: Request,
+    get_query: Callable[[], Select],
+    values: dict[Column, Any],
+):
+    job.total = (await ExactCount().count(get_query(), filtered=True)).count
+
+    async for row_ids in iterate_row_ids(get_query, BULK_BATCH_SIZE):
+        async with piccolo_crud.table._meta.db.transaction():
+            results = await update_rows(piccolo_crud, request, row_ids, values)
+        job.add_results(*results)
@@ -0,0 +1,269 @@
+"""
+Strategies for counting the rows shown in the list view.
+
+``COUNT(*)`` has to visit every matching row, so for very large tables it can
+take longer than fetching the rows themselves. Depending on the table, an
+approximate count may be good enough.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Literal, Optional
+
+from piccolo.query.methods.select import Select
+from piccolo.table import Table
+from piccolo_api.crud.hooks import Hook, HookType
+
+CountType = Literal["exact", "capped", "estimated"]
+
+
+@dataclass
+class RowCount:
+    """
+    :param count:
+        The number of rows.
+    :param count_type:
+        ``'exact'``, ``'capped'`` if there are at least ``count`` rows, or
+        ``'estimated'`` if ``count`` is an estimate.
+
+    """
+
+    count: int
+    count_type: CountType = "exact"
+
+
+async def _run_count(query: Select, limit: Optional[int] = None) -> int:
+    """
+    Counts the rows returned by the query, stopping after ``limit`` rows.
+    """
+    table: type[Table] = query.table
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    response = await table.raw(
+        "SELECT COUNT(*) AS count FROM ({}) AS subquery",
+        query.querystrings[0],
+    ).run()
+    return response[0]["count"]
+
+
+class CountStrategy(metaclass=ABCMeta):
+    """
+    Subclass this to change how rows are counted.
+    """
+
+    @abstractmethod
+    async def count(self, query: Select, filtered: bool) -> RowCount:
+        """
+        :param query:
+            A query which selects the primary key of each row, with any
+            filters applied.
+        :param filtered:
+            Whether the user has applied any filters.
+
+        """
+        raise NotImplementedError
+
+
+class ExactCount(CountStrategy):
+    """
+    Counts every matching row - this is the default.
+    """
+
+    async def count(self, query: Select, filtered: bool) -> RowCount:
+        return RowCount(count=await _run_count(query))
+
+
+class CappedCount(CountStrategy):
+    """
+    Stops counting after ``limit`` rows, and the UI shows ``10,000+`` for
+    example.
+    """
+
+    def __init__(self, limit: int = 10_000):
+        if limit < 1:
+            raise ValueError("The limit must be at least 1.")
+        self.limit = limit
+
+    async def count(self, query: Select, filtered: bool) -> RowCount:
+        count = await _run_count(query, limit=self.limit + 1)
+        if count > self.limit:
+            return RowCount(count=self.limit, count_type="capped")
+        return RowCount(count=count)
+
+
+class EstimatedCount(CountStrategy):
+    """
+    Uses the Postgres query planner's estimate of how many rows there are. It
+    costs almost nothing, but can be out by a wide margin, especially when
+    filtering. Without filters, the estimate comes from ``pg_class``, which
+    is updated by ``VACUUM`` and ``ANALYZE``. With filters, the estimate from
+    ``EXPLAIN`` is used.
+
+    Estimates are least reliable for small numbers of rows, which are also
+    cheap to count, so an exact count is done below ``exact_below`` rows. For
+    databases other than Postgres, the rows are always counted exactly.
+    """
+
+    def __init__(self, exact_below: int = 10_000):
+        self.exact_below = exact_below
+
+    async def _get_table_estimate(self, table: type[Table]) -> int:
+        response = await table.raw(
+            "SELECT reltuples::bigint AS estimate FROM pg_class "
+            "WHERE oid = to_regclass({})",
+            table._meta.get_formatted_tablename(),
+        ).run()
+        estimate = response[0]["estimate"] if response else None
+        return -1 if estimate is None else estimate
+
+    async def _get_query_estimate(self, query: Select) -> int:
+        response = await query.table.raw(
+            "EXPLAIN (FORMAT JSON) {}", query.querystrings[0]
+        ).run()
+        plan: Any = response[0]["QUERY PLAN"]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def count(self, query: Select, filtered: bool) -> RowCount:
+        if query.engine_type != "postgres":
+            return RowCount(count=await _run_count(query))
+
+        estimate = (
+            await self._get_query_estimate(query)
+            if filtered
+            else await self._get_table_estimate(query.table)
+        )
+
+        # A table which has never been analysed has an estimate of -1, so
+        # this also covers that.
+        if estimate < self.exact_below:
+            return RowCount(count=await _run_count(query))
+
+        return RowCount(count=estimate, count_type="estimated")
+
+
+###############################################################################
+
+
+class CountCache:
+    """
+    Caches row counts in memory, so admin users viewing the same table with
+    the same filters don't each run a count query. Old entries expire after
+    ``ttl``, and once there are ``max_size`` entries, the least recently used
+    ones are discarded.
+
+    The cache for a table is cleared whenever a row in it is created,
+    updated, or deleted via the admin. Changes made elsewhere are picked up
+    once the entries expire.
+
+    For single rows, the cache is cleared by ``PiccoloCRUD`` hooks (see
+    ``get_hooks``), which run before the change is committed. So if a count
+    starts after the hook, but before the commit, the old count can be
+    cached until it expires. The bulk actions don't have this problem, as
+    they clear the cache again once their changes have been committed.
+    """
+
+    def __init__(self, ttl: timedelta, max_size: int = 1000):
+        if max_size < 1:
+            raise ValueError("The max_size must be at least 1.")
+
+        self.ttl = ttl.total_seconds()
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], tuple[float, RowCount]] = (
+            OrderedDict()
+        )
+        # Incremented each time a table's entries are invalidated, so counts
+        # which were started beforehand aren't cached.
+        self._versions: dict[str, int] = {}
+
+    @staticmethod
+    def get_key(table_name: str, params: dict[str, Any]) -> tuple[str, str]:
+        """
+        Only the filters affect the count, so ordering and pagination params
+        (which start with ``'__'``) are ignored.
+        """
+        filters = {
+            key: value
+            for key, value in params.items()
+            if not key.startswith("__")
+        }
+        return (table_name, json.dumps(filters, sort_keys=True, default=str))
+
+    def get_version(self, table_name: str) -> int:
+        return self._versions.get(table_name, 0)
+
+    def get(
+        self, table_name: str, params: dict[str, Any]
+    ) -> Optional[RowCount]:
+        key = self.get_key(table_name, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, row_count = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return row_count
+
+    def set(
+        self,
+        table_name: str,
+        params: dict[str, Any],
+        row_count: RowCount,
+        version: int,
+    ):
+        """
+        :param version:
+            The value of ``get_version`` before the count was started. If the
+            table has been invalidated since, the count is discarded.
+
+        """
+        if version != self.get_version(table_name):
+            return
+
+        key = self.get_key(table_name, params)
+        self._entries[key] = (time.monotonic() + self.ttl, row_count)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, table_name: str):
+        self._versions[table_name] = self.get_version(table_name) + 1
+        for key in [i for i in self._entries if i[0] == table_name]:
+            del self._entries[key]
+
+    def get_hooks(self, table_name: str) -> list[Hook]:
+        """
+        ``PiccoloCRUD`` hooks which invalidate the table's cache whenever a
+        row is modified.
+        """
+
+        def pre_save(row: Table) -> Table:
+            self.invalidate(table_name)
+            return row
+
+        def pre_patch(row_id: Any, values: dict[Any, Any]) -> dict[Any, Any]:
+            self.invalidate(table_name)
+            return values
+
+        def pre_delete(row_id: Any):
+            self.invalidate(table_name)
+
+        return [
+            Hook(hook_type=HookType.pre_save, callable=pre_save),
+            Hook(hook_type=HookType.pre_patch, callable=pre_patch),
+            Hook(hook_type=HookType.pre_delete, callable=pre_delete),
+        ]
@@ -4,33 +4,48 @@ Creates a basic wrapper around a Piccolo model, turning it into an ASGI app.
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import csv
 import inspect
 import io
 import itertools
 import json
 import logging
 import os
-from collections.abc import Callable, Coroutine, Sequence
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine, Sequence
 from dataclasses import dataclass
 from datetime import timedelta
-from functools import partial
-from typing import Any, Optional, TypeVar, Union
+from functools import cached_property, partial
+from typing import Any, Optional, TypeVar, Union, cast
 
 import typing_extensions
-from fastapi import FastAPI, File, Form, UploadFile
+from fastapi import APIRouter, FastAPI, File, Form, UploadFile
+from fastapi.openapi.utils import get_openapi
 from piccolo.apps.user.tables import BaseUser
 from piccolo.columns.base import Column
 from piccolo.columns.column_types import (
+    Array,
+    BigInt,
+    BigSerial,
     ForeignKey,
     Time,
     Timestamp,
     Timestamptz,
 )
 from piccolo.columns.reference import LazyTableReference
+from piccolo.query.methods.select import Select
 from piccolo.table import Table
 from piccolo.utils.warnings import Level, colored_warning
 from piccolo_api.change_password.endpoints import change_password
-from piccolo_api.crud.endpoints import OrderBy, PiccoloCRUD
+from piccolo_api.crud.endpoints import (
+    OrderBy,
+    ParamException,
+    Params,
+    PiccoloCRUD,
+)
+from piccolo_api.crud.exceptions import MalformedQuery, db_exception_handler
 from piccolo_api.crud.hooks import Hook
 from piccolo_api.crud.validators import Validators
 from piccolo_api.csp.middleware import CSPConfig, CSPMiddleware
@@ -54,9 +69,45 @@ from starlette.middleware import Middleware
 from starlette.middleware.authentication import AuthenticationMiddleware
 from starlette.middleware.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, JSONResponse, Response
+from starlette.responses import FileResponse as StarletteFileResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.staticfiles import StaticFiles
-
+from starlette.types import ASGIApp
+
+from . import bulk
+from .bulk import (
+    BulkActionError,
+    Job,
+    JobManager,
+    RowID,
+    batched,
+    delete_matching_rows,
+    delete_rows,
+    detach_request,
+    get_update_values,
+    parse_row_ids,
+    serialise_row_id,
+    update_matching_rows,
+    update_rows,
+)
+from .count import (
+    CountCache,
+    CountStrategy,
+    CountType,
+    ExactCount,
+    RowCount,
+)
+from .http_cache import CachedResponse
+from .pagination import (
+    Cursor,
+    CursorException,
+    fetch_keyset_page,
+    fetch_offset_page,
+    get_keyset_order_by,
+)
+from .routing import TableMount
+from .search import ContainsSearch, SearchCursor, SearchStrategy
+from .static import AssetFiles
 from .translations.data import TRANSLATIONS
 from .translations.models import (
     Translation,
@@ -70,6 +121,14 @@ logger = logging.getLogger(__name__)
 
 ASSET_PATH = os.path.join(os.path.dirname(__file__), "dist")
 
+# How many rows are fetched from the database cursor at a time when exporting
+# a table as CSV.
+EXPORT_BATCH_SIZE = 1000
+CSV_DELIMITERS = (",", ";")
+
+# How many search results are returned, if no limit is given.
+SEARCH_PAGE_SIZE = 10
+
 
 class UserResponseModel(BaseModel):
     username: str
@@ -79,6 +138,13 @@ class UserResponseModel(BaseModel):
 class MetaResponseModel(BaseModel):
     piccolo_admin_version: str
     site_name: str
+    service_worker: bool = Field(
+        default=False,
+        description=(
+            "Whether the UI should register the service worker, which caches "
+            "its assets."
+        ),
+    )
 
 
 class StoreFileResponseModel(BaseModel):
@@ -95,6 +161,83 @@ class GenerateFileURLResponseModel(BaseModel):
     file_url: str = Field(description="A URL which the file is accessible on.")
 
 
+class ListingResponseModel(BaseModel):
+    rows: list[dict[str, Any]] = Field(
+        description=(
+            "Values in the schema's `bigint_columns` are returned as "
+            "strings, as they can be too large for a Javascript `Number`."
+        )
+    )
+    count: Optional[int] = Field(
+        description=(
+            "The number of rows matching the filters - `null` if "
+            "`__count=false` was passed."
+        )
+    )
+    count_type: CountType = Field(
+        default="exact",
+        description=(
+            "If `capped`, there are at least `count` rows, and if "
+            "`estimated`, `count` is an estimate."
+        ),
+    )
+    page_size: int
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Pass as `__cursor` to get the next page - only used by tables "
+            "with keyset pagination."
+        ),
+    )
+    previous_cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Pass as `__cursor` to get the previous page - only used by "
+            "tables with keyset pagination."
+        ),
+    )
+
+
+class SearchResultModel(BaseModel):
+    id: RowID
+    readable: str
+
+
+class SearchResponseModel(BaseModel):
+    results: list[SearchResultModel]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Pass as `cursor` to get more results - `null` if there aren't "
+            "any more."
+        ),
+    )
+
+
+class BulkDeleteRequestModel(BaseModel):
+    row_ids: list[RowID] = Field(description="The primary keys to delete.")
+
+
+class BulkUpdateRequestModel(BaseModel):
+    row_ids: list[RowID] = Field(description="The primary keys to update.")
+    column_name: str
+    value: Any = Field(description="The new value for the column.")
+
+
+class BulkUpdateMatchingRequestModel(BaseModel):
+    column_name: str
+    value: Any = Field(description="The new value for the column.")
+
+
+class BulkActionResponseModel(BaseModel):
+    row_ids: list[RowID] = Field(
+        description="The primary keys of the rows which were modified."
+    )
+    errors: list[BulkActionError] = Field(
+        description="The rows which couldn't be modified, and why."
+    )
+
+
 class GroupItem(BaseModel):
     name: str
     slug: str
@@ -209,6 +352,37 @@ class TableConfig:
         * 1 - the max resolution is 1 second (the default)
         * 60 - the max resolution is 1 minute
 
+    :param keyset_pagination:
+        If ``True``, the list view pages through rows using a cursor, rather
+        than page numbers. Each page then takes the same amount of time to
+        load, no matter how deep into the table it is, which is useful for
+        very large tables. The ``ORDER BY`` values of the last row are used to
+        find the next page, with the primary key as a tie breaker.
+    :param count_strategy:
+        Controls how the rows are counted in the list view. By default it's
+        :class:`ExactCount <piccolo_admin.count.ExactCount>`. Counting every
+        row can be slow for very large tables, in which case
+        :class:`CappedCount <piccolo_admin.count.CappedCount>` or
+        :class:`EstimatedCount <piccolo_admin.count.EstimatedCount>` can be
+        used instead.
+    :param search_strategy:
+        Controls how rows are searched when picking a foreign key value which
+        references this table. By default it's
+        :class:`ContainsSearch <piccolo_admin.search.ContainsSearch>`, which
+        can't use an index. For large tables, use
+        :class:`TrigramSearch <piccolo_admin.search.TrigramSearch>` or
+        :class:`FullTextSearch <piccolo_admin.search.FullTextSearch>`
+        instead.
+    :param allow_bulk_delete:
+        If ``True``, every row matching the filters in the list view can be
+        deleted at once (the same as ``PiccoloCRUD``'s ``allow_bulk_delete``).
+        It's dangerous, so is disabled by default - rows can still be
+        deleted in bulk by selecting them individually.
+    :param allow_bulk_update:
+        Like ``allow_bulk_delete``, but for updating every row matching the
+        filters at once. Rows can still be updated in bulk by selecting them
+        individually.
+
     """
 
     table_class: type[Table]
@@ -226,6 +400,11 @@ class TableConfig:
     time_resolution: Optional[
         dict[Union[Timestamp, Timestamptz, Time], Union[float, int]]
     ] = None
+    keyset_pagination: bool = False
+    count_strategy: Optional[CountStrategy] = None
+    search_strategy: Optional[SearchStrategy] = None
+    allow_bulk_delete: bool = False
+    allow_bulk_update: bool = False
 
     def __post_init__(self):
         if self.visible_columns and self.exclude_visible_columns:
@@ -319,6 +498,13 @@ class TableConfig:
             else {}
         )
 
+    def get_bigint_column_names(self) -> tuple[str, ...]:
+        return tuple(
+            i._meta.name
+            for i in self.table_class._meta.columns
+            if is_bigint_column(i)
+        )
+
 
 PydanticModel = TypeVar("PydanticModel", bound=BaseModel)
 
@@ -412,6 +598,26 @@ class FormConfigResponseModel(BaseModel):
     description: Optional[str] = None
 
 
+class BootstrapResponseModel(BaseModel):
+    meta: MetaResponseModel
+    user: UserResponseModel
+    translations: TranslationListResponse
+    language_code: str = Field(
+        description="The language the UI should use initially."
+    )
+    translation: Optional[Translation] = Field(
+        default=None,
+        description=(
+            "The translation for `language_code`, unless the client already "
+            "has it - see `translation_hash`."
+        ),
+    )
+    tables: GroupedTableNamesResponseModel
+    forms: list[FormConfigResponseModel]
+    form_groups: GroupedFormsResponseModel
+    links: dict[str, str]
+
+
 def handle_auth_exception(request: Request, exc: Exception):
     return JSONResponse({"error": "Auth failed"}, status_code=401)
 
@@ -437,6 +643,190 @@ async def log_error(request: Request, exc: HTTPException):
     raise exc
 
 
+async def run_validators(
+    piccolo_crud: PiccoloCRUD, request: Request, *endpoint_names: str
+):
+    """
+    ``PiccoloCRUD`` only applies ``Validators`` to its own endpoints. Piccolo
+    Admin adds some extra endpoints for each table, which call this, so the
+    same rules apply to them.
+
+    :param endpoint_names:
+        The ``Validators`` attributes to use - for example ``'get_all'`` for
+        endpoints which read rows.
+
+    """
+    validators = piccolo_crud.validators
+    if validators is None:
+        return
+
+    for validator in [
+        *itertools.chain.from_iterable(
+            getattr(validators, i) for i in endpoint_names
+        ),
+        *validators.every,
+    ]:
+        try:
+            if inspect.iscoroutinefunction(validator):
+                await validator(
+                    piccolo_crud=piccolo_crud,
+                    request=request,
+                    **validators.extra_context,
+                )
+            else:
+                validator(
+                    piccolo_crud=piccolo_crud,
+                    request=request,
+                    **validators.extra_context,
+                )
+        except HTTPException as exception:
+            raise exception
+        except Exception:
+            raise HTTPException(status_code=400, detail="Validation error")
+
+
+def build_select(
+    piccolo_crud: PiccoloCRUD,
+    params: Params,
+    extra_columns: Sequence[Column] = (),
+) -> tuple[Any, type[BaseModel]]:
+    """
+    Builds the same ``Select`` query as ``PiccoloCRUD.get_all``, without the
+    ordering and pagination, so endpoints which return rows in other ways stay
+    consistent with the row listing.
+
+    :param extra_columns:
+        Columns to select in addition to the visible fields - they aren't
+        included in the serialised rows.
+    :returns:
+        The query, and a Pydantic model for serialising each row.
+    :raises MalformedQuery:
+        If the filters are invalid.
+
+    """
+    table = piccolo_crud.table
+
+    nested: Union[bool, tuple[Column, ...]]
+    visible_fields = params.visible_fields
+    if visible_fields:
+        nested = tuple(
+            i._meta.call_chain[-1]
+            for i in visible_fields
+            if len(i._meta.call_chain) > 0
+        )
+    else:
+        visible_fields = table._meta.columns
+        nested = False
+
+    readable_columns = (
+        [
+            table._get_related_readable(i)
+            for i in visible_fields
+            if isinstance(i, ForeignKey)
+        ]
+        if params.include_readable
+        else []
+    )
+
+    visible_field_names = [i._meta.name for i in visible_fields]
+
+    query: Any = table.select(
+        *visible_fields,
+        *readable_columns,
+        *[i for i in extra_columns if i._meta.name not in visible_field_names],
+        exclude_secrets=piccolo_crud.exclude_secrets,
+    )
+
+    if nested:
+        query = query.output(nested=True)
+
+    query = piccolo_crud._apply_filters(query, params)
+
+    row_model = piccolo_crud._pydantic_model_output(
+        include_readable=params.include_readable,
+        include_columns=tuple(visible_fields),
+        nested=nested,  # type: ignore
+    )
+
+    return query, row_model
+
+
+def get_order_by(table: type[Table], params: Params) -> list[OrderBy]:
+    """
+    Like ``PiccoloCRUD.get_all``, if no ordering is specified, the newest rows
+    are returned first.
+    """
+    return params.order_by or [
+        OrderBy(column=table._meta.primary_key, ascending=False)
+    ]
+
+
+async def fetch_in_batches(
+    query: Any, batch_size: int
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Yields the rows returned by a ``Select`` query in batches.
+
+    On Postgres this uses a server side cursor. Piccolo's SQLite batch
+    implementation doesn't support query parameters, so instead we page
+    through the results using ``LIMIT`` and ``OFFSET``.
+    """
+    if query.table._meta.db.engine_type in ("postgres", "cockroach"):
+        async with await query.batch(batch_size=batch_size) as batch:
+            async for rows in batch:
+                yield rows
+    else:
+        offset = 0
+        while True:
+            rows = await query.limit(batch_size).offset(offset).run()
+            if rows:
+                yield rows
+            if len(rows) < batch_size:
+                break
+            offset += batch_size
+
+
+def is_bigint_column(column: Column) -> bool:
+    """
+    Whether the column can contain integers which are too large for a
+    Javascript ``Number`` (i.e. above ``2 ** 53``).
+    """
+    if isinstance(column, ForeignKey):
+        column = column._foreign_key_meta.resolved_target_column
+    if isinstance(column, Array):
+        column = column.base_column
+    return isinstance(column, (BigInt, BigSerial))
+
+
+def stringify_integers(
+    row: dict[str, Any], column_names: Sequence[str]
+) -> dict[str, Any]:
+    """
+    Converts the integer values in the given columns to strings, so they
+    don't lose precision when parsed by the browser.
+    """
+    for column_name in column_names:
+        value = row.get(column_name)
+        if isinstance(value, int):
+            row[column_name] = str(value)
+        elif isinstance(value, list):
+            row[column_name] = [
+                str(i) if isinstance(i, int) else i for i in value
+            ]
+    return row
+
+
+def format_csv_value(value: Any) -> str:
+    """
+    Converts a JSON compatible value into a CSV cell.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
 class AdminRouter(FastAPI):
     """
     The root returns a single page app. The other URLs are REST endpoints.
@@ -466,6 +856,11 @@ class AdminRouter(FastAPI):
         debug: bool = False,
         sidebar_links: dict[str, str] = {},
         mfa_providers: Optional[Sequence[MFAProvider]] = None,
+        count_cache_ttl: Optional[timedelta] = None,
+        count_cache_size: int = 1000,
+        lazy_tables: bool = False,
+        lazy_tables_cache_size: int = 100,
+        service_worker: bool = False,
     ) -> None:
         super().__init__(
             title=site_name,
@@ -546,6 +941,15 @@ class AdminRouter(FastAPI):
             translation.language_code.lower(): translation
             for translation in (translations or TRANSLATIONS)
         }
+        # The translations are requested a lot (e.g. by the login page), so
+        # they're only serialised once.
+        self.translation_responses = {
+            language_code: CachedResponse(
+                content=translation.model_dump_json().encode("utf-8"),
+                cache_control="public, no-cache",
+            )
+            for language_code, translation in self.translations_map.items()
+        }
 
         #######################################################################
 
@@ -555,10 +959,30 @@ class AdminRouter(FastAPI):
         self.read_only = read_only
         self.sidebar_links = sidebar_links
         self.form_config_map = {form.slug: form for form in self.forms}
+        self.count_cache = (
+            CountCache(ttl=count_cache_ttl, max_size=count_cache_size)
+            if count_cache_ttl
+            else None
+        )
+        self.page_size = page_size
+        self.session_table = session_table
+        self.lazy_tables = lazy_tables
+        self.lazy_tables_cache_size = lazy_tables_cache_size
+        self.service_worker = service_worker
 
         with open(os.path.join(ASSET_PATH, "index.html")) as f:
             self.template = f.read()
 
+        # A new release might change the asset file names, so browsers need
+        # to revalidate the template. The ETag is weak, as middleware or a
+        # proxy might compress the response.
+        self.template_response = CachedResponse(
+            content=self.template.encode("utf-8"),
+            media_type="text/html",
+            cache_control="no-cache",
+            weak=True,
+        )
+
         #######################################################################
 
         private_app = FastAPI(
@@ -569,47 +993,142 @@ class AdminRouter(FastAPI):
         )
         private_app.mount("/docs/", swagger_ui(schema_url="../openapi.json"))
 
-        for table_config in table_configs:
-            table_class = table_config.table_class
-            visible_column_names = table_config.get_visible_column_names()
-            visible_filter_names = table_config.get_visible_filter_names()
-            rich_text_columns_names = (
-                table_config.get_rich_text_columns_names()
-            )
-            media_columns_names = table_config.get_media_columns_names()
-            link_column_name = table_config.get_link_column()._meta.name
-            order_by = table_config.get_order_by()
-            time_resolution = table_config.get_time_resolution()
-            validators = table_config.validators
-            if table_class in (auth_table, session_table):
-                validators = validators or Validators()
-                validators.every = [superuser_validators, *validators.every]
-
-            FastAPIWrapper(
-                root_url=f"/tables/{table_class._meta.tablename}/",
-                fastapi_app=private_app,
-                piccolo_crud=PiccoloCRUD(
-                    table=table_class,
-                    read_only=read_only,
-                    page_size=page_size,
-                    schema_extra={
-                        "visible_column_names": visible_column_names,
-                        "visible_filter_names": visible_filter_names,
-                        "rich_text_columns": rich_text_columns_names,
-                        "media_columns": media_columns_names,
-                        "link_column_name": link_column_name,
-                        "order_by": tuple(i.to_dict() for i in order_by),
-                        "time_resolution": time_resolution,
-                    },
-                    validators=validators,
-                    hooks=table_config.hooks,
-                ),
-                fastapi_kwargs=FastAPIKwargs(
-                    all_routes={
-                        "tags": [f"{table_class._meta.tablename.capitalize()}"]
-                    },
-                ),
-            )
+        # In lazy mode, this only contains the most recently used tables.
+        self.piccolo_crud_map: OrderedDict[str, PiccoloCRUD] = OrderedDict()
+        self.schema_cache: dict[str, CachedResponse] = {}
+        self.job_manager = JobManager()
+
+        # These are registered before the PiccoloCRUD routes, otherwise the
+        # requests would be dispatched to them by `TableMount`.
+        #
+        # The admin's own table endpoints are under `/tables/{tablename}/-/`.
+        # PiccoloCRUD's `/tables/{tablename}/{row_id}/` only matches a single
+        # path segment, so they can never shadow a row, whatever its primary
+        # key is.
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/listing/",
+            endpoint=self.get_listing,  # type: ignore
+            methods=["GET"],
+            response_model=ListingResponseModel,
+            tags=["Tables"],
+        )
+
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/rows/{row_id:str}/",
+            endpoint=self.get_row,  # type: ignore
+            methods=["GET"],
+            tags=["Tables"],
+        )
+
+        # This replaces PiccoloCRUD's own schema endpoint, so it's at the
+        # same path.
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/schema/",
+            endpoint=self.get_table_schema,  # type: ignore
+            methods=["GET"],
+            tags=["Tables"],
+        )
+
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/search/",
+            endpoint=self.search_rows,  # type: ignore
+            methods=["GET"],
+            response_model=SearchResponseModel,
+            tags=["Tables"],
+        )
+
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/bulk-delete/",
+            endpoint=self.bulk_delete,  # type: ignore
+            methods=["POST"],
+            response_model=BulkActionResponseModel,
+            tags=["Tables"],
+        )
+
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/bulk-update/",
+            endpoint=self.bulk_update,  # type: ignore
+            methods=["POST"],
+            response_model=BulkActionResponseModel,
+            tags=["Tables"],
+        )
+
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/bulk-delete/matching/",
+            endpoint=self.bulk_delete_matching,  # type: ignore
+            methods=["POST"],
+            response_model=Job,
+            status_code=202,
+            tags=["Tables"],
+        )
+
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/bulk-update/matching/",
+            endpoint=self.bulk_update_matching,  # type: ignore
+            methods=["POST"],
+            response_model=Job,
+            status_code=202,
+            tags=["Tables"],
+        )
+
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/export.csv",
+            endpoint=self.export_csv,  # type: ignore
+            methods=["GET"],
+            tags=["Tables"],
+        )
+
+        # Lets the UI check for errors before starting the download.
+        private_app.add_api_route(
+            path="/tables/{table_name:str}/-/export.csv",
+            endpoint=self.export_csv,  # type: ignore
+            methods=["HEAD"],
+            include_in_schema=False,
+        )
+
+        # The routes for each table are in their own router, and requests are
+        # dispatched to them using a dictionary lookup, rather than Starlette
+        # checking the routes of every table in turn.
+        self.table_routers: dict[str, APIRouter] = {}
+
+        if not lazy_tables:
+            for table_config in self.table_configs:
+                tablename = table_config.table_class._meta.tablename
+                piccolo_crud = self._create_piccolo_crud(table_config)
+                self.piccolo_crud_map[tablename] = piccolo_crud
+
+                table_router = APIRouter()
+                FastAPIWrapper(
+                    root_url="/",
+                    fastapi_app=table_router,
+                    piccolo_crud=piccolo_crud,
+                    fastapi_kwargs=FastAPIKwargs(
+                        all_routes={"tags": [f"{tablename.capitalize()}"]},
+                    ),
+                )
+                self.table_routers[tablename] = table_router
+
+        private_app.router.routes.append(TableMount(self._get_table_app))
+
+        def get_openapi_schema() -> dict[str, Any]:
+            """
+            The table routes aren't registered with ``private_app``, so need
+            adding to the schema.
+            """
+            if private_app.openapi_schema is None:
+                docs_router = APIRouter()
+                for tablename, table_router in self.table_routers.items():
+                    docs_router.include_router(
+                        table_router, prefix=f"/tables/{tablename}"
+                    )
+                private_app.openapi_schema = get_openapi(
+                    title=private_app.title,
+                    version=private_app.version,
+                    routes=[*private_app.routes, *docs_router.routes],
+                )
+            return private_app.openapi_schema
+
+        private_app.openapi = get_openapi_schema  # type: ignore
 
         private_app.add_api_route(
             path="/tables/",
@@ -671,6 +1190,22 @@ class AdminRouter(FastAPI):
             tags=["Forms"],
         )
 
+        private_app.add_api_route(
+            path="/bulk-jobs/{job_id:str}/",
+            endpoint=self.get_bulk_job,  # type: ignore
+            methods=["GET"],
+            response_model=Job,
+            tags=["Tables"],
+        )
+
+        private_app.add_api_route(
+            path="/bootstrap/",
+            endpoint=self.get_bootstrap,  # type: ignore
+            methods=["GET"],
+            tags=["Bootstrap"],
+            response_model=BootstrapResponseModel,
+        )
+
         private_app.add_api_route(
             path="/user/",
             endpoint=self.get_user,  # type: ignore
@@ -820,9 +1355,15 @@ class AdminRouter(FastAPI):
             path="/", endpoint=self.get_root, methods=["GET"]
         )
 
+        self.router.add_route(
+            path="/service-worker.js",
+            endpoint=self.get_service_worker,
+            methods=["GET"],
+        )
+
         self.mount(
             path="/assets",
-            app=StaticFiles(directory=os.path.join(ASSET_PATH, "assets")),
+            app=AssetFiles(directory=os.path.join(ASSET_PATH, "assets")),
         )
 
         auth_middleware = partial(
@@ -839,8 +1380,23 @@ class AdminRouter(FastAPI):
         self.mount(path="/api", app=auth_middleware(private_app))
         self.mount(path="/public", app=public_app)
 
-    async def get_root(self, request: Request) -> HTMLResponse:
-        return HTMLResponse(self.template)
+    async def get_root(self, request: Request) -> Response:
+        return self.template_response.to_response(request)
+
+    async def get_service_worker(self, request: Request) -> Response:
+        """
+        The service worker has to be served from the root of the admin, so it
+        can handle requests for the whole UI. Browsers check for a new
+        version on each visit, so it mustn't be cached.
+        """
+        if not self.service_worker:
+            raise HTTPException(status_code=404)
+
+        return StarletteFileResponse(
+            os.path.join(ASSET_PATH, "service-worker.js"),
+            media_type="text/javascript",
+            headers={"Cache-Control": "no-cache"},
+        )
 
     ###########################################################################
 
@@ -1072,6 +1628,94 @@ class AdminRouter(FastAPI):
         return MetaResponseModel(
             piccolo_admin_version=PICCOLO_ADMIN_VERSION,
             site_name=self.site_name,
+            service_worker=self.service_worker,
+        )
+
+    ###########################################################################
+
+    @cached_property
+    def bootstrap_data(self) -> dict[str, Any]:
+        """
+        The parts of the bootstrap response which are the same for every
+        user, and don't change while the app is running.
+        """
+        return {
+            "meta": self.get_meta(),
+            "translations": self.get_translation_list(),
+            "tables": self.get_table_list_grouped(),
+            "forms": self.get_forms(),
+            "form_groups": self.get_grouped_forms(),
+            "links": self.get_sidebar_links(),
+        }
+
+    def _get_language_code(
+        self,
+        language_code: Optional[str],
+        browser_language_code: Optional[str],
+    ) -> str:
+        """
+        Works out which translation the UI should use initially.
+
+        :param language_code:
+            The language the user previously chose, if any.
+        :param browser_language_code:
+            The user's preferred language, according to their browser. Only
+            used if ``default_language_code`` is ``'auto'``.
+
+        """
+        if language_code and language_code.lower() in self.translations_map:
+            return language_code.lower()
+
+        if self.default_language_code != "auto":
+            return self.default_language_code.lower()
+
+        if browser_language_code:
+            browser_language_code = browser_language_code.lower()
+            # The browser might give us 'en-us' when we only have 'en'.
+            for i in (
+                browser_language_code,
+                browser_language_code.split("-")[0],
+            ):
+                if i in self.translations_map:
+                    return i
+
+        return "en"
+
+    def get_bootstrap(
+        self,
+        request: Request,
+        language_code: Optional[str] = None,
+        browser_language_code: Optional[str] = None,
+        translation_hash: Optional[str] = None,
+    ) -> BootstrapResponseModel:
+        """
+        Returns everything the UI needs when it first loads, so it only has to
+        make a single request.
+
+        :param translation_hash:
+            The ``content_hash`` of the translation for ``language_code``
+            which the client has cached. If it's still current, the
+            translation is omitted from the response.
+
+        """
+        translation = self.translations_map.get(
+            self._get_language_code(language_code, browser_language_code)
+        ) or next(iter(self.translations_map.values()))
+        translation_code = translation.language_code.lower()
+
+        if (
+            translation_hash
+            == self.translation_responses[translation_code].content_hash
+        ):
+            translation_response = None
+        else:
+            translation_response = translation
+
+        return BootstrapResponseModel(
+            user=self.get_user(request),
+            language_code=translation.language_code,
+            translation=translation_response,
+            **self.bootstrap_data,
         )
 
     ###########################################################################
@@ -1115,6 +1759,644 @@ class AdminRouter(FastAPI):
 
         return response
 
+    def _create_piccolo_crud(self, table_config: TableConfig) -> PiccoloCRUD:
+        table_class = table_config.table_class
+
+        validators = table_config.validators
+        if table_class in (self.auth_table, self.session_table):
+            # Copied, as in lazy mode this can run more than once for a table.
+            validators = copy.copy(validators or Validators())
+            validators.every = [superuser_validators, *validators.every]
+
+        hooks = table_config.hooks
+        if self.count_cache:
+            # PiccoloCRUD groups the hooks using `itertools.groupby`, so hooks
+            # of the same type need to be next to each other.
+            hooks = sorted(
+                [
+                    *(hooks or []),
+                    *self.count_cache.get_hooks(table_class._meta.tablename),
+                ],
+                key=lambda hook: hook.hook_type.value,
+            )
+
+        return PiccoloCRUD(
+            table=table_class,
+            read_only=self.read_only,
+            allow_bulk_delete=table_config.allow_bulk_delete,
+            page_size=self.page_size,
+            schema_extra={
+                "visible_column_names": (
+                    table_config.get_visible_column_names()
+                ),
+                "visible_filter_names": (
+                    table_config.get_visible_filter_names()
+                ),
+                "rich_text_columns": (
+                    table_config.get_rich_text_columns_names()
+                ),
+                "media_columns": table_config.get_media_columns_names(),
+                "link_column_name": table_config.get_link_column()._meta.name,
+                "order_by": tuple(
+                    i.to_dict() for i in table_config.get_order_by()
+                ),
+                "time_resolution": table_config.get_time_resolution(),
+                "keyset_pagination": table_config.keyset_pagination,
+                "allow_bulk_delete": table_config.allow_bulk_delete,
+                "allow_bulk_update": table_config.allow_bulk_update,
+                "bigint_columns": table_config.get_bigint_column_names(),
+            },
+            validators=validators,
+            hooks=hooks,
+        )
+
+    def _get_piccolo_crud(self, table_name: str) -> PiccoloCRUD:
+        """
+        Retrieve the ``PiccoloCRUD`` for the given table.
+
+        :raises HTTPException:
+            If the table isn't registered with the admin.
+
+        """
+        piccolo_crud = self.piccolo_crud_map.get(table_name)
+
+        if piccolo_crud is None:
+            table_config = self.table_config_map.get(table_name)
+            if table_config is None or not self.lazy_tables:
+                raise HTTPException(
+                    status_code=404, detail="No such table found."
+                )
+
+            piccolo_crud = self._create_piccolo_crud(table_config)
+            self.piccolo_crud_map[table_name] = piccolo_crud
+            while len(self.piccolo_crud_map) > self.lazy_tables_cache_size:
+                self.piccolo_crud_map.popitem(last=False)
+        else:
+            self.piccolo_crud_map.move_to_end(table_name)
+
+        return piccolo_crud
+
+    def _get_table_app(self, table_name: str) -> Optional[ASGIApp]:
+        """
+        Returns the app which handles the table's routes, or ``None`` if the
+        table isn't registered with the admin. In lazy mode, this is just
+        the ``PiccoloCRUD`` app, created when first needed.
+        """
+        if self.lazy_tables:
+            if table_name not in self.table_config_map:
+                return None
+            return self._get_piccolo_crud(table_name)
+
+        return self.table_routers.get(table_name)
+
+    async def get_table_schema(
+        self, request: Request, table_name: str
+    ) -> Response:
+        """
+        Returns the JSON schema for the table, which the UI uses to render
+        the list view and forms. It can't change while the app is running, so
+        it's only serialised once, and clients can revalidate it using the
+        ``ETag``. The validators still run on every request.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+        await run_validators(piccolo_crud, request, "get_schema")
+
+        cached_response = self.schema_cache.get(table_name)
+        if cached_response is None:
+            cached_response = CachedResponse.from_json(
+                piccolo_crud.pydantic_model.model_json_schema()
+            )
+            self.schema_cache[table_name] = cached_response
+
+        return cached_response.to_response(request)
+
+    async def get_listing(
+        self, request: Request, table_name: str
+    ) -> Union[ListingResponseModel, Response]:
+        """
+        Returns a page of rows, and the total number of rows matching the
+        filters, so the UI only needs a single request. It accepts the same
+        params as the row listing.
+
+        If the table uses keyset pagination, ``__page`` is ignored - instead,
+        pass the ``next_cursor`` or ``previous_cursor`` from the previous
+        response as ``__cursor``.
+
+        When paging through rows with the same filters, the count doesn't
+        change, so the client can pass ``__count=false`` to skip it.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+        await run_validators(piccolo_crud, request, "get_all", "get_count")
+
+        table = piccolo_crud.table
+        keyset_pagination = piccolo_crud.schema_extra.get(
+            "keyset_pagination", False
+        )
+
+        params = piccolo_crud._clean_data(
+            piccolo_crud._parse_params(request.query_params)
+        )
+        cursor_string = params.pop("__cursor", None)
+        include_count = params.pop("__count", "true") != "false"
+
+        try:
+            split_params = piccolo_crud._split_params(params)
+            cursor = Cursor.decode(cursor_string) if cursor_string else None
+        except (ParamException, CursorException) as exception:
+            return Response(str(exception), status_code=400)
+
+        page_size = split_params.page_size or piccolo_crud.page_size
+        if page_size > piccolo_crud.max_page_size:
+            return JSONResponse(
+                {"error": "The page size limit has been exceeded"},
+                status_code=403,
+            )
+
+        order_by = get_order_by(table, split_params)
+        if keyset_pagination:
+            order_by = get_keyset_order_by(table, order_by)
+
+        try:
+            query, row_model = build_select(
+                piccolo_crud,
+                split_params,
+                extra_columns=(
+                    [i.column for i in order_by] if keyset_pagination else ()
+                ),
+            )
+            count_query = cast(
+                Select,
+                piccolo_crud._apply_filters(
+                    table.select(table._meta.primary_key), split_params
+                ),
+            )
+        except MalformedQuery as exception:
+            return Response(str(exception), status_code=400)
+
+        if keyset_pagination:
+            page_coroutine = fetch_keyset_page(
+                query=query,
+                order_by=order_by,
+                page_size=page_size,
+                cursor=cursor,
+            )
+        else:
+            for _order_by in order_by:
+                query = query.order_by(
+                    _order_by.column, ascending=_order_by.ascending
+                )
+            page_coroutine = fetch_offset_page(
+                query=query, page_size=page_size, page=split_params.page
+            )
+
+        count_strategy = (
+            self.table_config_map[table_name].count_strategy or ExactCount()
+        )
+
+        async def get_row_count() -> RowCount:
+            if self.count_cache is None:
+                return await count_strategy.count(
+                    query=count_query, filtered=bool(split_params.fields)
+                )
+
+            row_count = self.count_cache.get(table_name, params)
+            if row_count is None:
+                version = self.count_cache.get_version(table_name)
+                row_count = await count_strategy.count(
+                    query=count_query, filtered=bool(split_params.fields)
+                )
+                self.count_cache.set(
+                    table_name, params, row_count, version=version
+                )
+            return row_count
+
+        # The rows and the count don't depend on each other, so run them
+        # concurrently.
+        try:
+            if include_count:
+                page, row_count = await asyncio.gather(
+                    page_coroutine, get_row_count()
+                )
+            else:
+                page, row_count = await page_coroutine, None
+        except CursorException as exception:
+            return Response(str(exception), status_code=400)
+
+        bigint_columns = piccolo_crud.schema_extra.get("bigint_columns", ())
+
+        return ListingResponseModel(
+            rows=[
+                stringify_integers(
+                    row_model(**i).model_dump(mode="json"), bigint_columns
+                )
+                for i in page.rows
+            ],
+            count=row_count.count if row_count else None,
+            count_type=row_count.count_type if row_count else "exact",
+            page_size=page_size,
+            next_cursor=page.next_cursor,
+            previous_cursor=page.previous_cursor,
+        )
+
+    async def get_row(
+        self, request: Request, table_name: str, row_id: str
+    ) -> Response:
+        """
+        Returns a single row. It's the same as PiccoloCRUD's ``GET
+        /{row_id}/`` endpoint, except values in the schema's
+        ``bigint_columns`` are returned as strings, like the row listing.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+
+        # PiccoloCRUD converts the row ID, and applies the validators.
+        response = await piccolo_crud.detail(request)
+        if response.status_code != 200:
+            return response
+
+        bigint_columns = piccolo_crud.schema_extra.get("bigint_columns", ())
+        return JSONResponse(
+            stringify_integers(
+                json.loads(bytes(response.body)), bigint_columns
+            )
+        )
+
+    async def search_rows(
+        self, request: Request, table_name: str
+    ) -> Union[SearchResponseModel, Response]:
+        """
+        Searches the rows of a table, when picking a foreign key value. Rows
+        starting with the ``search`` param are returned first. To get more
+        results, pass the ``next_cursor`` from the previous response as
+        ``cursor``. The number of results is set using ``limit``.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+        await run_validators(piccolo_crud, request, "get_ids")
+
+        table = piccolo_crud.table
+        search_term = request.query_params.get("search", "").strip()
+        cursor_string = request.query_params.get("cursor")
+
+        try:
+            limit = int(request.query_params.get("limit", SEARCH_PAGE_SIZE))
+        except ValueError:
+            return Response("The limit must be an integer", status_code=400)
+
+        if not 1 <= limit <= piccolo_crud.max_page_size:
+            return Response(
+                f"The limit must be between 1 and "
+                f"{piccolo_crud.max_page_size}",
+                status_code=400,
+            )
+
+        try:
+            cursor = (
+                SearchCursor.decode(cursor_string, table=table)
+                if cursor_string
+                else None
+            )
+        except CursorException as exception:
+            return Response(str(exception), status_code=400)
+
+        search_strategy = (
+            self.table_config_map[table_name].search_strategy
+            or ContainsSearch()
+        )
+        page = await search_strategy.search(
+            table, search_term=search_term, limit=limit, cursor=cursor
+        )
+
+        return SearchResponseModel(
+            results=[
+                SearchResultModel(
+                    id=serialise_row_id(row_id),
+                    readable="" if readable is None else str(readable),
+                )
+                for row_id, readable in page.results
+            ],
+            next_cursor=page.next_cursor,
+        )
+
+    async def export_csv(self, request: Request, table_name: str) -> Response:
+        """
+        Streams the rows of a table as a CSV file. It accepts the same filter,
+        ``__order``, ``__visible_fields`` and ``__readable`` params as the row
+        listing, and the delimiter can be set using ``__delimiter``.
+
+        The rows are fetched from a database cursor in batches, so memory
+        usage stays flat, no matter how many rows are exported.
+
+        A ``HEAD`` request is validated in the same way, but no rows are
+        fetched. Once the browser starts downloading the file, any errors
+        can't be shown to the user, so the UI checks for them first.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+        await run_validators(piccolo_crud, request, "get_all")
+
+        params = piccolo_crud._parse_params(request.query_params)
+
+        delimiter = params.pop("__delimiter", ",")
+        if delimiter not in CSV_DELIMITERS:
+            return Response(
+                f"Unrecognised __delimiter argument - {delimiter}",
+                status_code=400,
+            )
+
+        # Everything matching the filters is exported.
+        params.pop("__page", None)
+        params.pop("__page_size", None)
+
+        try:
+            split_params = piccolo_crud._split_params(
+                piccolo_crud._clean_data(params)
+            )
+        except ParamException as exception:
+            return Response(str(exception), status_code=400)
+
+        try:
+            query, row_model = build_select(piccolo_crud, split_params)
+        except MalformedQuery as exception:
+            return Response(str(exception), status_code=400)
+
+        for order_by in get_order_by(piccolo_crud.table, split_params):
+            query = query.order_by(
+                order_by.column, ascending=order_by.ascending
+            )
+
+        secret_column_names = (
+            {i._meta.name for i in piccolo_crud.table._meta.secret_columns}
+            if piccolo_crud.exclude_secrets
+            else set()
+        )
+        column_names = [
+            i for i in row_model.model_fields if i not in secret_column_names
+        ]
+
+        headers = {
+            "Content-Disposition": f'attachment; filename="{table_name}.csv"'
+        }
+
+        if request.method == "HEAD":
+            return Response(
+                media_type="text/csv; charset=utf-8", headers=headers
+            )
+
+        async def stream_rows() -> AsyncIterator[str]:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, delimiter=delimiter)
+
+            writer.writerow(column_names)
+            yield buffer.getvalue()
+
+            async for rows in fetch_in_batches(query, EXPORT_BATCH_SIZE):
+                buffer.seek(0)
+                buffer.truncate()
+                for row in rows:
+                    data = row_model(**row).model_dump(mode="json")
+                    writer.writerow(
+                        [format_csv_value(data[i]) for i in column_names]
+                    )
+                yield buffer.getvalue()
+
+        return StreamingResponse(
+            stream_rows(),
+            media_type="text/csv; charset=utf-8",
+            headers=headers,
+        )
+
+    async def bulk_delete(
+        self, request: Request, table_name: str, model: BulkDeleteRequestModel
+    ) -> Union[BulkActionResponseModel, Response]:
+        """
+        Deletes several rows in a single request. The same validators and
+        ``pre_delete`` hooks are applied as when deleting a single row.
+
+        The rows are deleted in batches, each in a transaction. If a batch
+        fails (for example due to a foreign key constraint), its rows are
+        deleted one at a time, so only the problematic rows are reported as
+        errors.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+        if self.read_only:
+            return Response("Running in read only mode", status_code=405)
+
+        await run_validators(piccolo_crud, request, "delete_single")
+
+        row_ids, errors = parse_row_ids(piccolo_crud.table, model.row_ids)
+        deleted_row_ids: list[Any] = []
+
+        for batch in batched(row_ids, bulk.BULK_BATCH_SIZE):
+            batch_row_ids, batch_errors = await delete_rows(
+                piccolo_crud, request, batch
+            )
+            deleted_row_ids.extend(batch_row_ids)
+            errors.extend(batch_errors)
+
+        self._invalidate_count_cache(table_name)
+
+        return BulkActionResponseModel(
+            row_ids=[serialise_row_id(i) for i in deleted_row_ids],
+            errors=errors,
+        )
+
+    @db_exception_handler
+    async def bulk_update(
+        self, request: Request, table_name: str, model: BulkUpdateRequestModel
+    ) -> Union[BulkActionResponseModel, Response]:
+        """
+        Sets a column to the same value for several rows. The same
+        validators and ``pre_patch`` hooks are applied as when updating a
+        single row.
+
+        Rows are updated using ``UPDATE ... WHERE id IN (...)`` in batches,
+        all within a single transaction, so either every row is updated or
+        none are.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+        if self.read_only:
+            return Response("Running in read only mode", status_code=405)
+
+        await run_validators(piccolo_crud, request, "patch_single")
+
+        values = get_update_values(
+            piccolo_crud, column_name=model.column_name, value=model.value
+        )
+        row_ids, errors = parse_row_ids(piccolo_crud.table, model.row_ids)
+        updated_row_ids: list[Any] = []
+
+        try:
+            async with piccolo_crud.table._meta.db.transaction():
+                for batch in batched(row_ids, bulk.BULK_BATCH_SIZE):
+                    batch_row_ids, batch_errors = await update_rows(
+                        piccolo_crud, request, batch, values
+                    )
+                    updated_row_ids.extend(batch_row_ids)
+                    errors.extend(batch_errors)
+        except ValueError:
+            return Response("Unable to save the resources.", status_code=500)
+        finally:
+            self._invalidate_count_cache(table_name)
+
+        return BulkActionResponseModel(
+            row_ids=[serialise_row_id(i) for i in updated_row_ids],
+            errors=errors,
+        )
+
+    def _invalidate_count_cache(self, table_name: str):
+        """
+        The hooks clear the count cache before each row is modified, but a
+        count could have been cached again before the changes were
+        committed, so bulk actions clear it once they've finished.
+        """
+        if self.count_cache:
+            self.count_cache.invalidate(table_name)
+
+    def _get_matching_rows_query(
+        self, piccolo_crud: PiccoloCRUD, request: Request
+    ) -> Callable[[], Select]:
+        """
+        Parses the same filter params as the row listing, and returns a
+        function which builds a query for the primary keys of the matching
+        rows.
+
+        To stop every row being modified by mistake, requests without any
+        filters are rejected, unless they pass ``__all_rows=true``.
+
+        :raises HTTPException:
+            If the filters are invalid, or missing.
+
+        """
+        table = piccolo_crud.table
+        all_rows = request.query_params.get("__all_rows") == "true"
+        params = piccolo_crud._parse_params(request.query_params)
+
+        # Only the filters are relevant.
+        params = {
+            key: value
+            for key, value in params.items()
+            if not key.startswith("__")
+        }
+
+        try:
+            split_params = piccolo_crud._split_params(
+                piccolo_crud._clean_data(params)
+            )
+        except ParamException as exception:
+            raise HTTPException(status_code=400, detail=str(exception))
+
+        def get_query() -> Select:
+            return cast(
+                Select,
+                piccolo_crud._apply_filters(
+                    table.select(table._meta.primary_key), split_params
+                ),
+            )
+
+        try:
+            query = get_query()
+        except MalformedQuery as exception:
+            raise HTTPException(status_code=400, detail=str(exception))
+
+        if query.where_delegate._where is None and not all_rows:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    "No filters were given - pass `__all_rows=true` to "
+                    "modify every row."
+                ),
+            )
+
+        return get_query
+
+    async def bulk_delete_matching(
+        self, request: Request, table_name: str
+    ) -> Union[Job, Response]:
+        """
+        Deletes every row matching the filters, which are passed as query
+        params, in the same way as the row listing. It can be a lot of rows,
+        so they're deleted in the background - use the returned ``job_id``
+        to check on the progress.
+
+        Like ``PiccoloCRUD``'s bulk delete, it's only allowed if the table
+        has ``allow_bulk_delete`` enabled, and the ``delete_all`` validators
+        are applied, as well as the ``delete_single`` ones.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+        if self.read_only:
+            return Response("Running in read only mode", status_code=405)
+
+        if not piccolo_crud.allow_bulk_delete:
+            return Response("Bulk deletes aren't allowed", status_code=405)
+
+        await run_validators(
+            piccolo_crud, request, "delete_all", "delete_single"
+        )
+
+        get_query = self._get_matching_rows_query(piccolo_crud, request)
+
+        return self.job_manager.start(
+            table_name=table_name,
+            action="delete",
+            user_id=request.user.user_id,
+            on_finish=partial(self._invalidate_count_cache, table_name),
+            run=partial(
+                delete_matching_rows,
+                piccolo_crud=piccolo_crud,
+                request=detach_request(request),
+                get_query=get_query,
+            ),
+        )
+
+    async def bulk_update_matching(
+        self,
+        request: Request,
+        table_name: str,
+        model: BulkUpdateMatchingRequestModel,
+    ) -> Union[Job, Response]:
+        """
+        Like ``bulk_delete_matching``, but sets a column to the same value
+        for every row matching the filters. Each batch of rows is updated in
+        its own transaction.
+
+        It's only allowed if the table has ``allow_bulk_update`` enabled.
+        """
+        piccolo_crud = self._get_piccolo_crud(table_name)
+        if self.read_only:
+            return Response("Running in read only mode", status_code=405)
+
+        if not piccolo_crud.schema_extra.get("allow_bulk_update", False):
+            return Response("Bulk updates aren't allowed", status_code=405)
+
+        await run_validators(piccolo_crud, request, "patch_single")
+
+        values = get_update_values(
+            piccolo_crud, column_name=model.column_name, value=model.value
+        )
+        get_query = self._get_matching_rows_query(piccolo_crud, request)
+
+        return self.job_manager.start(
+            table_name=table_name,
+            action="update",
+            user_id=request.user.user_id,
+            on_finish=partial(self._invalidate_count_cache, table_name),
+            run=partial(
+                update_matching_rows,
+                piccolo_crud=piccolo_crud,
+                request=detach_request(request),
+                get_query=get_query,
+                values=values,
+            ),
+        )
+
+    def get_bulk_job(self, request: Request, job_id: str) -> Job:
+        """
+        Returns the progress of a bulk action. Only the user who started the
+        job can see it.
+        """
+        job = self.job_manager.get(job_id, user_id=request.user.user_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="No such job found.")
+        return job
+
     ###########################################################################
 
     def get_translation_list(self) -> TranslationListResponse:
@@ -1127,23 +2409,30 @@ class AdminRouter(FastAPI):
                 TranslationListItem(
                     language_code=translation.language_code,
                     language_name=translation.language_name,
+                    content_hash=self.translation_responses[
+                        language_code
+                    ].content_hash,
                 )
-                for translation in self.translations_map.values()
+                for language_code, translation in self.translations_map.items()
             ],
             default_language_code=self.default_language_code,
         )
 
-    def get_translation(self, language_code: str = "en") -> Translation:
+    def get_translation(
+        self, request: Request, language_code: str = "en"
+    ) -> Response:
         """
         Return a single language. The ``language_code`` is an IETF language
         code, for example 'en' for English.
         """
-        translation = self.translations_map.get(language_code.lower())
-        if translation is None:
+        translation_response = self.translation_responses.get(
+            language_code.lower()
+        )
+        if translation_response is None:
             raise HTTPException(
                 status_code=404, detail="Translation not found"
             )
-        return translation
+        return translation_response.to_response(request)
 
 
 def get_all_tables(
@@ -1198,6 +2487,11 @@ def create_admin(
     debug: bool = False,
     sidebar_links: dict[str, str] = {},
     mfa_providers: Optional[Sequence[MFAProvider]] = None,
+    count_cache_ttl: Optional[timedelta] = None,
+    count_cache_size: int = 1000,
+    lazy_tables: bool = False,
+    lazy_tables_cache_size: int = 100,
+    service_worker: bool = False,
 ):
     """
     :param tables:
@@ -1321,6 +2615,29 @@ def create_admin(
 
     :param mfa_providers:
         Enables Multi-factor Authentication in the login process.
+    :param count_cache_ttl:
+        If set, the row counts in the list view are cached in memory for this
+        long, and shared between users. This is useful when lots of users are
+        viewing large tables. The cache for a table is cleared when a row is
+        modified via the admin, but changes made elsewhere won't be reflected
+        until the cached counts expire.
+    :param count_cache_size:
+        The maximum number of row counts to cache, if ``count_cache_ttl`` is
+        set. Once full, the least recently used counts are discarded.
+    :param lazy_tables:
+        By default, the API endpoints for every table are created on startup.
+        If there are hundreds of tables, this can be slow, and use a lot of
+        memory. If ``True``, the endpoints for a table are only created when
+        it's first used. The trade off is that the tables' endpoints aren't
+        listed in the API docs.
+    :param lazy_tables_cache_size:
+        If ``lazy_tables`` is ``True``, the endpoints for this many of the
+        most recently used tables are kept in memory.
+    :param service_worker:
+        If ``True``, the UI registers a service worker, which caches its
+        JavaScript and CSS files. Along with the table schemas and
+        translations, which the UI caches in the browser's IndexedDB, this
+        means repeat visits can start without waiting for the network.
 
     """  # noqa: E501
     auth_table = auth_table or BaseUser
@@ -1368,4 +2685,9 @@ def create_admin(
         debug=debug,
         sidebar_links=sidebar_links,
         mfa_providers=mfa_providers,
+        count_cache_ttl=count_cache_ttl,
+        count_cache_size=count_cache_size,
+        lazy_tables=lazy_tables,
+        lazy_tables_cache_size=lazy_tables_cache_size,
+        service_worker=service_worker,
     )
@@ -267,7 +267,12 @@ APP = create_admin(
 )
 
 
-def run(persist: bool = False, engine: str = "sqlite", inflate: int = 0):
+def run(
+    persist: bool = False,
+    engine: str = "sqlite",
+    inflate: int = 0,
+    fast: bool = False,
+):
     """
     Start the Piccolo admin.
 
@@ -279,13 +284,21 @@ def run(persist: bool = False, engine: str = "sqlite", inflate: int = 0):
         If set, this number of extra rows are inserted containing dummy data.
         This is useful when you need to test with lots of data. Example
         `--inflate=10000`.
+    :param fast:
+        If set, the `--inflate` rows are generated across several processes,
+        and bulk inserted. Use this for millions of rows. Example
+        `--inflate=5000000 --fast`.
 
     """
     set_engine(engine)
     create_schema(persist=persist)
 
     if not persist:
-        populate_data(inflate=inflate, engine=engine)
+        elapsed = populate_data(inflate=inflate, engine=engine, fast=fast)
+        if elapsed is not None:
+            print(
+                f"Generated {inflate} directors and movies in {elapsed:.1f}s"
+            )
 
     # Server
     class CustomConfig(Config):
@@ -0,0 +1,393 @@
+"""
+Load tests the example admin, by sending a realistic mix of requests
+concurrently, and reporting the throughput and latency of each endpoint.
+
+Can be run from the command line using `piccolo piccolo_admin bench`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+
+# How often each kind of request is sent, relative to the others. Viewing and
+# filtering rows is much more common than editing or exporting them. They
+# match the requests the UI sends - for example, when moving to another page
+# with the same filters, the UI already knows the count, so it's skipped.
+REQUEST_WEIGHTS: dict[str, int] = {
+    "listing": 20,
+    "page": 15,
+    "filter": 15,
+    "sort": 10,
+    "search": 10,
+    "schema": 10,
+    "row": 10,
+    "edit": 5,
+    "csv_export": 5,
+}
+
+SORT_COLUMNS = ["name", "-rating", "release_date", "-box_office", "director"]
+
+SEARCH_TERMS = ["a", "the", "ste", "ch", "ri", "mar"]
+
+
+@dataclass
+class Results:
+    durations: dict[str, list[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    elapsed: float = 0.0
+
+    def record(self, name: str, duration: float, success: bool):
+        self.durations[name].append(duration)
+        if not success:
+            self.errors[name] += 1
+
+    def summarise(self) -> dict[str, dict[str, float]]:
+        summary: dict[str, dict[str, float]] = {}
+        all_durations: list[float] = []
+
+        for name in REQUEST_WEIGHTS:
+            durations = self.durations.get(name)
+            if durations:
+                summary[name] = self._summarise(
+                    durations, errors=self.errors.get(name, 0)
+                )
+                all_durations.extend(durations)
+
+        if all_durations:
+            summary["total"] = self._summarise(
+                all_durations, errors=sum(self.errors.values())
+            )
+
+        return summary
+
+    def _summarise(
+        self, durations: list[float], errors: int
+    ) -> dict[str, float]:
+        if len(durations) > 1:
+            quantiles = statistics.quantiles(
+                durations, n=100, method="inclusive"
+            )
+            p50, p95, p99 = quantiles[49], quantiles[94], quantiles[98]
+        else:
+            p50 = p95 = p99 = durations[0]
+
+        return {
+            "requests": len(durations),
+            "errors": errors,
+            "requests_per_second": round(len(durations) / self.elapsed, 1),
+            "p50_ms": round(p50 * 1000, 2),
+            "p95_ms": round(p95 * 1000, 2),
+            "p99_ms": round(p99 * 1000, 2),
+        }
+
+
+def build_request(
+    client: httpx.AsyncClient,
+    name: str,
+    movie_ids: list[int],
+    csrftoken: str,
+) -> httpx.Request:
+    """
+    Builds a request similar to what the UI sends.
+    """
+    listing_url = "/api/tables/movie/-/listing/"
+    page_params = {
+        "__readable": "true",
+        "__page_size": "15",
+        "__page": str(random.randint(1, 5)),
+    }
+
+    if name == "listing":
+        return client.build_request("GET", listing_url, params=page_params)
+    elif name == "page":
+        return client.build_request(
+            "GET", listing_url, params={**page_params, "__count": "false"}
+        )
+    elif name == "filter":
+        return client.build_request(
+            "GET",
+            listing_url,
+            params={
+                **page_params,
+                "__page": "1",
+                "name": random.choice(SEARCH_TERMS),
+                "name__match": "contains",
+                "rating": str(random.randint(1, 9)),
+                "rating__operator": "gte",
+            },
+        )
+    elif name == "sort":
+        return client.build_request(
+            "GET",
+            listing_url,
+            params={**page_params, "__order": random.choice(SORT_COLUMNS)},
+        )
+    elif name == "search":
+        # When picking a foreign key value.
+        return client.build_request(
+            "GET",
+            "/api/tables/director/-/search/",
+            params={"search": random.choice(SEARCH_TERMS), "limit": "5"},
+        )
+    elif name == "schema":
+        return client.build_request("GET", "/api/tables/movie/schema/")
+    elif name == "row":
+        # When opening the edit page.
+        return client.build_request(
+            "GET",
+            f"/api/tables/movie/-/rows/{random.choice(movie_ids)}/",
+            params={"__readable": "true"},
+        )
+    elif name == "edit":
+        return client.build_request(
+            "PATCH",
+            f"/api/tables/movie/{random.choice(movie_ids)}/",
+            json={"rating": random.randint(10, 100) / 10},
+            headers={"X-CSRFToken": csrftoken},
+        )
+    elif name == "csv_export":
+        return client.build_request(
+            "GET",
+            "/api/tables/movie/-/export.csv",
+            params={"__readable": "true", "genre": str(random.randint(1, 8))},
+        )
+    else:
+        raise ValueError(f"Unrecognised request - {name}")
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str):
+    """
+    Logs in the same way as the UI, so the client has a session cookie.
+
+    :returns:
+        The CSRF token, which is required for requests which modify data.
+
+    """
+    # The CSRF middleware sets the cookie, if the client doesn't have one.
+    await client.get("/")
+    csrftoken = client.cookies["csrftoken"]
+
+    response = await client.post(
+        "/public/login/",
+        json={
+            "username": username,
+            "password": password,
+            "csrftoken": csrftoken,
+        },
+        headers={"X-CSRFToken": csrftoken},
+    )
+    response.raise_for_status()
+
+    return csrftoken
+
+
+async def wait_for_server(client: httpx.AsyncClient, timeout: float = 10.0):
+    import httpx
+
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            response = await client.get("/public/meta/")
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+        else:
+            response.raise_for_status()
+            return
+
+
+async def run_load(
+    base_url: str,
+    username: str,
+    password: str,
+    concurrency: int,
+    requests: int,
+    movie_ids: list[int],
+) -> Results:
+    import httpx
+
+    results = Results()
+    names = list(REQUEST_WEIGHTS.keys())
+    weights = list(REQUEST_WEIGHTS.values())
+    remaining = requests
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        limits=httpx.Limits(max_connections=concurrency),
+        timeout=60,
+    ) as client:
+        await wait_for_server(client)
+        csrftoken = await login(client, username, password)
+
+        async def worker():
+            nonlocal remaining
+
+            while remaining > 0:
+                remaining -= 1
+                name = random.choices(names, weights=weights)[0]
+                request = build_request(
+                    client,
+                    name=name,
+                    movie_ids=movie_ids,
+                    csrftoken=csrftoken,
+                )
+
+                start = time.perf_counter()
+                try:
+                    response = await client.send(request)
+                    await response.aread()
+                except httpx.HTTPError:
+                    success = False
+                else:
+                    success = response.is_success
+                results.record(
+                    name,
+                    duration=time.perf_counter() - start,
+                    success=success,
+                )
+
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        results.elapsed = time.perf_counter() - start
+
+    return results
+
+
+def print_summary(summary: dict[str, dict[str, float]]):
+    columns = [
+        "requests",
+        "errors",
+        "requests_per_second",
+        "p50_ms",
+        "p95_ms",
+        "p99_ms",
+    ]
+    headings = ["requests", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms"]
+
+    print(f"{'endpoint':<12}" + "".join(f"{i:>10}" for i in headings))
+    for name, values in summary.items():
+        print(f"{name:<12}" + "".join(f"{values[i]:>10}" for i in columns))
+
+
+def bench(
+    engine: str = "sqlite",
+    concurrency: int = 10,
+    requests: int = 1000,
+    inflate: int = 1000,
+    port: int = 8000,
+    seed: int = 0,
+    output: str = "",
+):
+    """
+    Load test the example admin. It's started with fresh data, then a mix of
+    listing, filter, sort, search, schema, edit and CSV export requests are
+    sent to it, logged in as the demo user.
+
+    :param engine:
+        Options are sqlite and postgres. By default sqlite is used.
+    :param concurrency:
+        How many requests are sent at the same time.
+    :param requests:
+        The total number of requests to send.
+    :param inflate:
+        How many extra rows of dummy data to insert (requires faker).
+    :param port:
+        Which port the example admin is served on.
+    :param seed:
+        Seeds the random choice of requests, so runs are comparable.
+    :param output:
+        If set, the results are also saved to this path as JSON.
+
+    """
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        print("Install httpx to use this feature: `pip install httpx`")
+        return
+
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    from piccolo_admin.example.app import APP
+    from piccolo_admin.example.tables import (
+        PASSWORD,
+        USERNAME,
+        Movie,
+        create_schema,
+        populate_data,
+        set_engine,
+    )
+
+    random.seed(seed)
+
+    set_engine(engine)
+    create_schema()
+    populate_data(inflate=inflate, engine=engine)
+
+    movie_ids = (
+        Movie.select(Movie._meta.primary_key).output(as_list=True).run_sync()
+    )
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.accesslog = None
+
+    async def main() -> Results:
+        shutdown_event = asyncio.Event()
+        server = asyncio.create_task(
+            serve(
+                APP,  # type: ignore
+                config,
+                shutdown_trigger=shutdown_event.wait,  # type: ignore
+            )
+        )
+        try:
+            return await run_load(
+                base_url=f"http://127.0.0.1:{port}",
+                username=USERNAME,
+                password=PASSWORD,
+                concurrency=concurrency,
+                requests=requests,
+                movie_ids=movie_ids,
+            )
+        finally:
+            shutdown_event.set()
+            await server
+
+    results = asyncio.run(main())
+    summary = results.summarise()
+
+    print(
+        f"\n{requests} requests, concurrency {concurrency}, {engine}, "
+        f"{results.elapsed:.1f}s\n"
+    )
+    print_summary(summary)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(
+                {
+                    "engine": engine,
+                    "concurrency": concurrency,
+                    "requests": requests,
+                    "elapsed_seconds": results.elapsed,
+                    "endpoints": summary,
+                },
+                f,
+                indent=4,
+            )
@@ -0,0 +1,326 @@
+"""
+Quickly generates millions of rows of dummy data, for testing the admin at
+scale.
+
+Rather than creating a ``Table`` instance for each row, rows are generated as
+tuples in batches, across several processes, using names and sentences which
+are created up front with Faker. They're then bulk inserted using ``COPY``
+on Postgres, or ``executemany`` on SQLite, in a single transaction per table.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import decimal
+import os
+import random
+import sqlite3
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Optional
+
+from piccolo.engine.postgres import PostgresEngine
+from piccolo.query.functions.aggregate import Max
+from piccolo.table import Table
+
+from piccolo_admin.example.data import MOVIE_WORDS
+from piccolo_admin.example.tables import Director, Movie
+
+# How many rows each process generates at a time.
+BATCH_SIZE = 10_000
+
+# How many distinct values each pool contains.
+POOL_SIZE = 1_000
+
+DIRECTOR_COLUMNS = [
+    "id",
+    "name",
+    "years_nominated",
+    "gender",
+    "photo",
+    "additional_skills",
+]
+
+MOVIE_COLUMNS = [
+    "name",
+    "rating",
+    "duration",
+    "director",
+    "oscar_nominations",
+    "won_oscar",
+    "description",
+    "poster",
+    "screenshots",
+    "release_date",
+    "box_office",
+    "tags",
+    "barcode",
+    "genre",
+]
+
+Pools = dict[str, list[str]]
+
+# Each process has its own copy, which is set when the process starts.
+_pools: Pools = {}
+
+
+def create_pools(size: int = POOL_SIZE) -> Pools:
+    """
+    Faker is slow, so values are generated once, and then randomly combined
+    for each row.
+    """
+    import faker
+
+    fake = faker.Faker()
+
+    return {
+        "m": [fake.first_name_male() for _ in range(size)],
+        "f": [fake.first_name_female() for _ in range(size)],
+        "n": [fake.first_name_nonbinary() for _ in range(size)],
+        "last_names": [fake.last_name() for _ in range(size)],
+        "words": [fake.word().title() for _ in range(size)],
+        "sentences": [fake.sentence(30) for _ in range(size)],
+    }
+
+
+def set_pools(pools: Pools):
+    global _pools
+    _pools = pools
+
+
+def generate_directors(arguments: tuple[int, int, int]) -> list[tuple]:
+    """
+    :param arguments:
+        The ID of the first director, how many to generate, and the random
+        seed.
+
+    """
+    first_id, count, seed = arguments
+    rng = random.Random(seed)
+
+    genders = rng.choices(["m", "f", "n"], k=count)
+    last_names = rng.choices(_pools["last_names"], k=count)
+
+    return [
+        (
+            first_id + index,
+            f"{rng.choice(_pools[gender])} {last_name}",
+            [],
+            gender,
+            "",
+            [],
+        )
+        for index, (gender, last_name) in enumerate(zip(genders, last_names))
+    ]
+
+
+def generate_movies(arguments: tuple[int, int, int, int]) -> list[tuple]:
+    """
+    :param arguments:
+        The range of director IDs to choose from (inclusive), how many movies
+        to generate, and the random seed.
+
+    """
+    min_director_id, max_director_id, count, seed = arguments
+    rng = random.Random(seed)
+
+    oscar_nominations = rng.choices([0, 0, 0, 0, 0, 1, 1, 3, 5], k=count)
+    words = rng.choices(_pools["words"], k=count)
+    movie_words = rng.choices(MOVIE_WORDS, k=count)
+    descriptions = rng.choices(_pools["sentences"], k=count)
+    first_release_date = datetime.date(1950, 1, 1).toordinal()
+    last_release_date = datetime.date.today().toordinal()
+
+    return [
+        (
+            f"{words[index]} {movie_words[index]}",
+            (
+                rng.randint(80, 100)
+                if oscar_nominations[index]
+                else rng.randint(1, 100)
+            )
+            / 10,
+            datetime.timedelta(minutes=rng.randint(60, 210)),
+            rng.randint(min_director_id, max_director_id),
+            oscar_nominations[index],
+            oscar_nominations[index] > 0,
+            descriptions[index],
+            "",
+            [],
+            datetime.date.fromordinal(
+                rng.randint(first_release_date, last_release_date)
+            ),
+            decimal.Decimal(rng.randint(10, 1500)) / 10,
+            [],
+            rng.randint(1_000_000_000, 9_999_999_999),
+            rng.randint(1, 8),
+        )
+        for index in range(count)
+    ]
+
+
+async def generate_batches(
+    executor: Executor,
+    function: Callable[[Any], list[tuple]],
+    arguments: Iterable[Any],
+    window: int,
+) -> AsyncIterator[list[tuple]]:
+    """
+    Generates the batches in the executor, yielding them in order. Only
+    ``window`` batches are generated ahead of the one being inserted, so
+    memory usage stays flat.
+    """
+    loop = asyncio.get_running_loop()
+    pending: deque[asyncio.Future] = deque()
+
+    for argument in arguments:
+        pending.append(loop.run_in_executor(executor, function, argument))
+        if len(pending) >= window:
+            yield await pending.popleft()
+
+    while pending:
+        yield await pending.popleft()
+
+
+async def insert_batches(
+    table: type[Table],
+    columns: list[str],
+    batches: AsyncIterator[list[tuple]],
+):
+    """
+    Inserts all of the batches in a single transaction, bypassing Piccolo's
+    query builder.
+    """
+    db = table._meta.db
+    tablename = table._meta.tablename
+
+    if isinstance(db, PostgresEngine):
+        connection = await db.get_new_connection()
+        try:
+            async with connection.transaction():
+                async for rows in batches:
+                    await connection.copy_records_to_table(
+                        tablename, records=rows, columns=columns
+                    )
+        finally:
+            await connection.close()
+    else:
+        # Piccolo registers adapters with `sqlite3` for dates, lists etc, so
+        # the values are stored in the same way as when using Piccolo.
+        connection = sqlite3.connect(db.path)  # type: ignore
+        column_names = ", ".join(f'"{i}"' for i in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        query = (
+            f'INSERT INTO "{tablename}" ({column_names}) '
+            f"VALUES ({placeholders})"
+        )
+        try:
+            with connection:
+                async for rows in batches:
+                    connection.executemany(query, rows)
+        finally:
+            connection.close()
+
+
+async def generate_data_async(
+    rows: int,
+    processes: Optional[int] = None,
+    batch_size: int = BATCH_SIZE,
+    seed: Optional[int] = None,
+):
+    rng = random.Random(seed)
+    processes = processes or os.cpu_count() or 1
+    pools = create_pools()
+
+    response = await Director.select(Max(Director.id)).first().run()
+    max_director_id = (response or {}).get("max") or 0
+    first_director_id = max_director_id + 1
+    last_director_id = max_director_id + rows
+
+    batch_sizes = [
+        min(batch_size, rows - offset) for offset in range(0, rows, batch_size)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=set_pools, initargs=(pools,)
+    ) as executor:
+        await insert_batches(
+            Director,
+            columns=DIRECTOR_COLUMNS,
+            batches=generate_batches(
+                executor,
+                generate_directors,
+                (
+                    (
+                        first_director_id + index * batch_size,
+                        count,
+                        rng.getrandbits(32),
+                    )
+                    for index, count in enumerate(batch_sizes)
+                ),
+                window=processes * 2,
+            ),
+        )
+
+        await insert_batches(
+            Movie,
+            columns=MOVIE_COLUMNS,
+            batches=generate_batches(
+                executor,
+                generate_movies,
+                (
+                    (
+                        first_director_id,
+                        last_director_id,
+                        count,
+                        rng.getrandbits(32),
+                    )
+                    for count in batch_sizes
+                ),
+                window=processes * 2,
+            ),
+        )
+
+    if isinstance(Director._meta.db, PostgresEngine):
+        # The director IDs were set explicitly, so the sequence needs
+        # updating. Its name isn't always the default one (e.g. if the table
+        # was renamed), so look it up.
+        tablename = Director._meta.tablename
+        column_name = Director.id._meta.db_column_name
+        await Director.raw(
+            "SELECT setval(pg_get_serial_sequence({}, {}), "
+            f'max("{column_name}")) FROM "{tablename}"',
+            tablename,
+            column_name,
+        ).run()
+
+
+def generate_data(
+    rows: int,
+    processes: Optional[int] = None,
+    batch_size: int = BATCH_SIZE,
+    seed: Optional[int] = None,
+) -> float:
+    """
+    Inserts ``rows`` directors, and ``rows`` movies.
+
+    :param processes:
+        How many processes generate the rows. Defaults to the number of CPUs.
+    :param batch_size:
+        How many rows each process generates at a time.
+    :param seed:
+        If set, the same data is generated each time.
+    :returns:
+        How long it took, in seconds.
+
+    """
+    start = time.perf_counter()
+    asyncio.run(
+        generate_data_async(
+            rows=rows, processes=processes, batch_size=batch_size, seed=seed
+        )
+    )
+    return time.perf_counter() - start
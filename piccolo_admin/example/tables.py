@@ -4,6 +4,7 @@ import enum
 import logging
 import os
 import random
+from typing import Optional
 
 from piccolo.apps.user.tables import BaseUser
 from piccolo.columns.column_types import (
@@ -328,13 +329,21 @@ def create_schema(persist: bool = False):
     create_db_tables_sync(*TABLE_CLASSES, if_not_exists=True)
 
 
-def populate_data(inflate: int = 0, engine: str = "sqlite"):
+def populate_data(
+    inflate: int = 0, engine: str = "sqlite", fast: bool = False
+) -> Optional[float]:
     """
     Populate the database with some example data.
 
     :param inflate:
         If set, this number of extra rows are inserted containing dummy data.
         This is useful for testing.
+    :param fast:
+        If ``True``, the ``inflate`` rows are generated across several
+        processes, and bulk inserted - use this for millions of rows.
+    :returns:
+        If ``fast`` is ``True``, how long generating the ``inflate`` rows
+        took, in seconds.
 
     """
     # Add some rows
@@ -383,6 +392,11 @@ def populate_data(inflate: int = 0, engine: str = "sqlite"):
                 "`pip install piccolo_admin[faker]`"
             )
         else:
+            if fast:
+                from piccolo_admin.example.generate import generate_data
+
+                return generate_data(rows=inflate)
+
             fake = faker.Faker()
             remaining = inflate
             chunk_size = 100
@@ -452,3 +466,5 @@ def populate_data(inflate: int = 0, engine: str = "sqlite"):
                     movies.append(movie)
 
                 Movie.insert(*movies).run_sync()
+
+    return None
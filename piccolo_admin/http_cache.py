@@ -0,0 +1,95 @@
+"""
+Helpers for letting browsers cache responses which rarely change, using
+``ETag`` and ``If-None-Match`` headers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def get_content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:32]
+
+
+def get_etag(content: bytes, weak: bool = False) -> str:
+    """
+    Returns an ``ETag`` based on a hash of the content.
+    """
+    etag = f'"{get_content_hash(content)}"'
+    return f"W/{etag}" if weak else etag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Checks whether the ``If-None-Match`` header contains the ``ETag``, meaning
+    the client already has the latest version. As recommended by RFC 9110,
+    weak comparison is used.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag.removeprefix("W/") in [
+        i.strip().removeprefix("W/") for i in if_none_match.split(",")
+    ]
+
+
+class CachedResponse:
+    """
+    A response body which is serialised once, and then served with an
+    ``ETag``.
+
+    :param content:
+        The response body.
+    :param cache_control:
+        The ``Cache-Control`` header value. By default, the client must check
+        with the server before reusing a response (which is cheap, thanks to
+        the ``ETag``).
+
+    """
+
+    def __init__(
+        self,
+        content: bytes,
+        media_type: str = "application/json",
+        cache_control: str = "private, no-cache",
+        weak: bool = False,
+    ):
+        self.content = content
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.content_hash = get_content_hash(content)
+        self.etag = get_etag(content, weak=weak)
+
+    @classmethod
+    def from_json(cls, data: Any, **kwargs) -> CachedResponse:
+        content = json.dumps(
+            data, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        return cls(content=content, **kwargs)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"ETag": self.etag, "Cache-Control": self.cache_control}
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Returns a ``304`` response if the client already has the content.
+        """
+        if etag_matches(request, self.etag):
+            return Response(status_code=304, headers=self.headers)
+
+        return Response(
+            content=self.content,
+            media_type=self.media_type,
+            headers=self.headers,
+        )
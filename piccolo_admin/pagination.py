@@ -0,0 +1,257 @@
+"""
+Keyset (cursor) pagination for the row listing.
+
+Rather than using ``OFFSET``, which gets slower the deeper you page, we
+remember the ``ORDER BY`` column values of the last row on the page, and ask
+the database for rows which come after it. The primary key is used as a tie
+breaker, so every row has a unique position.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import functools
+import json
+import operator
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from piccolo.table import Table
+from piccolo_api.crud.endpoints import OrderBy
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+
+
+class CursorException(Exception):
+    """
+    Raised when a cursor can't be decoded.
+    """
+
+    pass
+
+
+@dataclass
+class Cursor:
+    """
+    Records where a page starts. It's given to the client as an opaque
+    string.
+
+    :param values:
+        The ``ORDER BY`` column values of the row we're paginating from.
+    :param backwards:
+        If ``True``, we want the rows before ``values``, rather than after.
+    :param offset:
+        If the ordering contains nullable columns, a keyset can't reliably
+        identify a row, so we fall back to using an offset.
+
+    """
+
+    values: Optional[list[Any]] = None
+    backwards: bool = False
+    offset: Optional[int] = None
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(
+            json.dumps(asdict(self)).encode()
+        ).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> Cursor:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(value.encode()))
+            return cls(**data)
+        except (binascii.Error, ValueError, TypeError) as exception:
+            raise CursorException("The cursor is invalid.") from exception
+
+
+@dataclass
+class Page:
+    """
+    The cursors are only set when using keyset pagination.
+    """
+
+    rows: list[dict[str, Any]]
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+
+
+def get_keyset_order_by(
+    table: type[Table], order_by: Sequence[OrderBy]
+) -> list[OrderBy]:
+    """
+    Adds the primary key to the ordering, if not already present, so each
+    row's position is unique.
+    """
+    primary_key = table._meta.primary_key
+    output = list(order_by)
+
+    if primary_key._meta.name not in [i.column._meta.name for i in output]:
+        output.append(
+            OrderBy(
+                column=primary_key,
+                ascending=output[-1].ascending if output else True,
+            )
+        )
+
+    return output
+
+
+def _parse_values(order_by: Sequence[OrderBy], values: list[Any]) -> list[Any]:
+    """
+    Cursor values are JSON, so convert them back into the column types (e.g.
+    ``datetime``).
+    """
+    if len(values) != len(order_by):
+        raise CursorException("The cursor doesn't match the ordering.")
+
+    try:
+        return [
+            TypeAdapter(i.column.value_type).validate_python(value)
+            for i, value in zip(order_by, values)
+        ]
+    except ValidationError as exception:
+        raise CursorException("The cursor is invalid.") from exception
+
+
+def _get_where(
+    order_by: Sequence[OrderBy], values: list[Any], backwards: bool
+):
+    """
+    Matches the rows after ``values`` in the ordering. For example, when
+    ordering by ``(name, id)``::
+
+        name > 'Bob' OR (name = 'Bob' AND id > 10)
+
+    """
+    clauses = []
+
+    for index, (_order_by, value) in enumerate(zip(order_by, values)):
+        column = _order_by.column
+        ascending = _order_by.ascending != backwards
+        comparison = column > value if ascending else column < value
+        equalities = [
+            i.column == j for i, j in zip(order_by[:index], values[:index])
+        ]
+        clauses.append(
+            functools.reduce(operator.and_, [*equalities, comparison])
+        )
+
+    return functools.reduce(operator.or_, clauses)
+
+
+def _get_row_values(
+    order_by: Sequence[OrderBy], row: dict[str, Any]
+) -> list[Any]:
+    return [to_jsonable_python(row[i.column._meta.name]) for i in order_by]
+
+
+async def fetch_keyset_page(
+    query: Any,
+    order_by: Sequence[OrderBy],
+    page_size: int,
+    cursor: Optional[Cursor] = None,
+) -> Page:
+    """
+    Fetches a single page of rows.
+
+    :param query:
+        A ``Select`` query, with any filters applied, but without ordering or
+        pagination. It must include the columns in ``order_by``.
+    :param order_by:
+        The ordering, including a tie breaker - see ``get_keyset_order_by``.
+    :param cursor:
+        Where the page starts - if not specified, the first page is returned.
+    :raises CursorException:
+        If the cursor doesn't match the query.
+
+    """
+    cursor = cursor or Cursor()
+
+    if cursor.offset is not None or any(i.column._meta.null for i in order_by):
+        return await _fetch_offset_page(
+            query=query,
+            order_by=order_by,
+            page_size=page_size,
+            offset=cursor.offset or 0,
+        )
+
+    backwards = cursor.backwards
+
+    if cursor.values is not None:
+        values = _parse_values(order_by, cursor.values)
+        query = query.where(_get_where(order_by, values, backwards))
+
+    for _order_by in order_by:
+        query = query.order_by(
+            _order_by.column, ascending=_order_by.ascending != backwards
+        )
+
+    # We fetch an extra row, to see if there's another page.
+    rows = await query.limit(page_size + 1).run()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if backwards:
+        rows.reverse()
+
+    if not rows:
+        return Page(rows=rows)
+
+    next_cursor = Cursor(values=_get_row_values(order_by, rows[-1]))
+    previous_cursor = Cursor(
+        values=_get_row_values(order_by, rows[0]), backwards=True
+    )
+
+    if backwards:
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, cursor.values is not None
+
+    return Page(
+        rows=rows,
+        next_cursor=next_cursor.encode() if has_next else None,
+        previous_cursor=previous_cursor.encode() if has_previous else None,
+    )
+
+
+async def _fetch_offset_page(
+    query: Any,
+    order_by: Sequence[OrderBy],
+    page_size: int,
+    offset: int,
+) -> Page:
+    for _order_by in order_by:
+        query = query.order_by(_order_by.column, ascending=_order_by.ascending)
+
+    rows = await query.offset(offset).limit(page_size + 1).run()
+    has_more = len(rows) > page_size
+
+    return Page(
+        rows=rows[:page_size],
+        next_cursor=(
+            Cursor(offset=offset + page_size).encode() if has_more else None
+        ),
+        previous_cursor=(
+            Cursor(offset=max(offset - page_size, 0)).encode()
+            if offset > 0
+            else None
+        ),
+    )
+
+
+async def fetch_offset_page(query: Any, page_size: int, page: int) -> Page:
+    """
+    Fetches a single page of rows using ``LIMIT`` and ``OFFSET``, like
+    ``PiccoloCRUD.get_all``.
+
+    :param query:
+        A ``Select`` query, with any filters and ordering applied.
+    :param page:
+        The page number, starting at 1.
+
+    """
+    offset = page_size * (max(page, 1) - 1)
+    rows = await query.limit(page_size).offset(offset).run()
+    return Page(rows=rows)
@@ -5,7 +5,9 @@ the APP_CONFIG.
 
 import os
 
-from piccolo.conf.apps import AppConfig
+from piccolo.conf.apps import AppConfig, Command
+
+from piccolo_admin.example.bench import bench
 
 CURRENT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 
@@ -20,5 +22,5 @@ APP_CONFIG = AppConfig(
         "piccolo_api.session_auth.piccolo_app",
         "piccolo.apps.user.piccolo_app",
     ],
-    commands=[],
+    commands=[Command(callable=bench)],
 )
@@ -0,0 +1,45 @@
+"""
+Routes requests for each table to the app which handles them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Optional
+
+from starlette.routing import Match, Mount
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class TableMount(Mount):
+    """
+    Mounts an app for each table at ``/tables/{table_name}/``.
+
+    Starlette checks each route in turn until one matches, so if each table
+    had its own routes, every request would get slower as more tables are
+    added. Instead, this single route looks up the table's app in a
+    dictionary, so the cost stays the same however many tables there are.
+
+    :param get_app:
+        Returns the app for the given table name, or ``None`` if there's no
+        such table - in which case the request is matched against the
+        remaining routes instead (for example ``/tables/grouped/``).
+
+    """
+
+    def __init__(self, get_app: Callable[[str], Optional[ASGIApp]]):
+        self.get_app = get_app
+        super().__init__(path="/tables/{table_name:str}", app=self.dispatch)
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        match, child_scope = super().matches(scope)
+        if match == Match.FULL and (
+            self.get_app(child_scope["path_params"]["table_name"]) is None
+        ):
+            return Match.NONE, {}
+        return match, child_scope
+
+    async def dispatch(self, scope: Scope, receive: Receive, send: Send):
+        app = self.get_app(scope["path_params"]["table_name"])
+        assert app is not None
+        await app(scope, receive, send)
@@ -0,0 +1,454 @@
+"""
+Strategies for searching the rows of a table, when picking a foreign key
+value in the UI.
+
+Rows which start with the search term are shown first, followed by the rows
+which contain it elsewhere. Rather than using ``OFFSET`` to load more
+results, we remember the primary key of the last result, so each page is as
+fast as the first.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import re
+from abc import ABCMeta, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from piccolo.columns.base import Column
+from piccolo.querystring import QueryString
+from piccolo.table import Table
+from pydantic import TypeAdapter, ValidationError
+
+from .pagination import CursorException
+
+
+@dataclass
+class SearchCursor:
+    """
+    Records where the next page of search results starts. It's given to the
+    client as an opaque string.
+
+    :param phase:
+        The index of the condition the last result matched - see
+        :meth:`SearchStrategy.get_conditions`.
+    :param after:
+        The primary key of the last result.
+
+    """
+
+    phase: int
+    after: Any
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(
+            json.dumps(asdict(self), default=str).encode()
+        ).decode()
+
+    @classmethod
+    def decode(cls, value: str, table: type[Table]) -> SearchCursor:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(value.encode()))
+            cursor = cls(**data)
+            cursor.after = TypeAdapter(
+                table._meta.primary_key.value_type
+            ).validate_python(cursor.after)
+        except (
+            binascii.Error,
+            ValueError,
+            TypeError,
+            ValidationError,
+        ) as exception:
+            raise CursorException("The cursor is invalid.") from exception
+
+        if not isinstance(cursor.phase, int) or cursor.phase < 0:
+            raise CursorException("The cursor is invalid.")
+
+        return cursor
+
+
+@dataclass
+class SearchPage:
+    """
+    :param results:
+        The primary key and readable representation of each row.
+    :param next_cursor:
+        Pass this to get the next page of results, or ``None`` if there
+        aren't any more.
+
+    """
+
+    results: list[tuple[Any, str]]
+    next_cursor: Optional[str] = None
+
+
+def escape_like(value: str) -> str:
+    """
+    Escapes the wildcards in ``LIKE`` patterns.
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def get_words(value: str) -> list[str]:
+    """
+    Only letters, numbers and underscores are kept, so the words are safe to
+    use in full text search queries.
+    """
+    return re.findall(r"\w+", value)
+
+
+###############################################################################
+
+
+class SearchStrategy(metaclass=ABCMeta):
+    """
+    Subclass this to change how rows are searched.
+
+    :param column:
+        The column to search. If not specified, the table's
+        :meth:`get_readable <piccolo.table.Table.get_readable>` value is
+        searched, which can't use an index.
+
+    """
+
+    def __init__(self, column: Optional[Column] = None):
+        self.column = column
+
+    def get_expression(self) -> str:
+        """
+        The value being searched, within the search query.
+        """
+        return (
+            "subquery.search_value"
+            if self.column is not None
+            else "subquery.readable"
+        )
+
+    @abstractmethod
+    def get_conditions(
+        self, table: type[Table], search_term: str
+    ) -> list[QueryString]:
+        """
+        The ``WHERE`` conditions, in order of relevance - for example, rows
+        starting with the search term, then rows containing it. Each row is
+        only returned once, for the first condition it matches.
+
+        Within the query, the primary key is ``subquery."<primary key
+        name>"``, and the value being searched is given by
+        :meth:`get_expression`.
+        """
+        raise NotImplementedError
+
+    def get_index_queries(self, table: type[Table]) -> list[str]:
+        """
+        The SQL for creating any indexes this strategy needs to be fast.
+        """
+        return []
+
+    async def create_indexes(self, table: type[Table]):
+        """
+        Creates the indexes returned by :meth:`get_index_queries`, if they
+        don't already exist. Run it once, for example in a migration.
+        """
+        for query in self.get_index_queries(table):
+            await table.raw(query).run()
+
+    async def search(
+        self,
+        table: type[Table],
+        search_term: str,
+        limit: int,
+        cursor: Optional[SearchCursor] = None,
+    ) -> SearchPage:
+        primary_key = table._meta.primary_key
+        primary_key_name = primary_key._meta.name
+
+        select = table.select(
+            primary_key,
+            table.get_readable(),
+            *(
+                [self.column.as_alias("search_value")]
+                if self.column is not None
+                else []
+            ),
+        )
+
+        conditions = (
+            self.get_conditions(table, search_term)
+            if search_term
+            else [QueryString("TRUE")]
+        )
+
+        start_phase = cursor.phase if cursor else 0
+        results: list[tuple[Any, str]] = []
+        phases: list[int] = []
+
+        # We fetch one more row than required, so we know if there are more.
+        for phase in range(start_phase, len(conditions)):
+            where = QueryString("({})", conditions[phase])
+            for previous_condition in conditions[:phase]:
+                where = QueryString(
+                    "{} AND NOT ({})", where, previous_condition
+                )
+
+            if cursor and phase == cursor.phase:
+                where = QueryString(
+                    f'{{}} AND subquery."{primary_key_name}" > {{}}',
+                    where,
+                    cursor.after,
+                )
+
+            response = await table.raw(
+                f'SELECT subquery."{primary_key_name}" AS pk, '
+                "subquery.readable AS readable "
+                "FROM ({}) AS subquery "
+                "WHERE {} "
+                f'ORDER BY subquery."{primary_key_name}" '
+                f"LIMIT {limit + 1 - len(results)}",
+                select.querystrings[0],
+                where,
+            ).run()
+
+            results.extend((i["pk"], i["readable"]) for i in response)
+            phases.extend(phase for _ in response)
+
+            if len(results) > limit:
+                break
+
+        if len(results) > limit:
+            last_pk = results[limit - 1][0]
+            return SearchPage(
+                results=results[:limit],
+                next_cursor=SearchCursor(
+                    phase=phases[limit - 1], after=last_pk
+                ).encode(),
+            )
+
+        return SearchPage(results=results)
+
+
+class ContainsSearch(SearchStrategy):
+    """
+    Matches rows containing the search term anywhere, ignoring case - this is
+    the default.
+
+    On Postgres, it can be sped up by creating a trigram index on the column
+    - see :class:`TrigramSearch`.
+    """
+
+    def _like(self, table: type[Table], pattern: str) -> QueryString:
+        operator = (
+            "ILIKE" if table._meta.db.engine_type == "postgres" else "LIKE"
+        )
+        return QueryString(
+            f"{self.get_expression()} {operator} {{}} ESCAPE '\\'", pattern
+        )
+
+    def get_conditions(
+        self, table: type[Table], search_term: str
+    ) -> list[QueryString]:
+        escaped = escape_like(search_term)
+        return [
+            self._like(table, f"{escaped}%"),
+            self._like(table, f"%{escaped}%"),
+        ]
+
+
+def _get_fts_table_name(table: type[Table], column: Column) -> str:
+    return f"{table._meta.tablename}_{column._meta.name}_search"
+
+
+def _get_fts_queries(
+    table: type[Table], column: Column, tokenize: str
+) -> list[str]:
+    """
+    SQLite doesn't have indexes for searching text, so we create an FTS5
+    table, which is kept in sync with the table using triggers.
+    """
+    tablename = table._meta.tablename
+    fts_tablename = _get_fts_table_name(table, column)
+    column_name = column._meta.db_column_name
+    primary_key_name = table._meta.primary_key._meta.db_column_name
+
+    insert = (
+        f'INSERT INTO "{fts_tablename}" (rowid, "{column_name}") '
+        f'VALUES (new."{primary_key_name}", new."{column_name}");'
+    )
+    delete = (
+        f'INSERT INTO "{fts_tablename}" '
+        f'("{fts_tablename}", rowid, "{column_name}") '
+        f"VALUES ('delete', old.\"{primary_key_name}\", "
+        f'old."{column_name}");'
+    )
+
+    return [
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts_tablename}" USING fts5('
+        f'"{column_name}", content="{tablename}", '
+        f'content_rowid="{primary_key_name}", tokenize="{tokenize}")',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts_tablename}_insert" '
+        f'AFTER INSERT ON "{tablename}" BEGIN {insert} END',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts_tablename}_delete" '
+        f'AFTER DELETE ON "{tablename}" BEGIN {delete} END',
+        f'CREATE TRIGGER IF NOT EXISTS "{fts_tablename}_update" '
+        f'AFTER UPDATE OF "{column_name}" ON "{tablename}" '
+        f"BEGIN {delete} {insert} END",
+        # Adds any existing rows.
+        f'INSERT INTO "{fts_tablename}" ("{fts_tablename}") '
+        "VALUES ('rebuild')",
+    ]
+
+
+def _supports_fts(table: type[Table]) -> bool:
+    """
+    FTS5 tables are linked to the table using the ``rowid``, so the primary
+    key has to be an integer.
+    """
+    return (
+        table._meta.db.engine_type == "sqlite"
+        and table._meta.primary_key.value_type is int
+    )
+
+
+class TrigramSearch(ContainsSearch):
+    """
+    Matches rows containing the search term anywhere, like
+    :class:`ContainsSearch`, but using an index, so it stays fast for large
+    tables.
+
+    On Postgres, a ``pg_trgm`` GIN index is used. On SQLite, an FTS5 table
+    with the ``trigram`` tokenizer is used, which requires an integer primary
+    key - otherwise it behaves like :class:`ContainsSearch`.
+
+    The index has to be created using :meth:`create_indexes`. Search terms
+    need at least three characters to benefit from it.
+
+    :param column:
+        The column to search.
+
+    """
+
+    def __init__(self, column: Column):
+        super().__init__(column=column)
+
+    def get_index_queries(self, table: type[Table]) -> list[str]:
+        assert self.column is not None
+        tablename = table._meta.tablename
+        column_name = self.column._meta.db_column_name
+
+        if table._meta.db.engine_type == "postgres":
+            return [
+                "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+                f'CREATE INDEX IF NOT EXISTS "{tablename}_{column_name}_trgm" '
+                f'ON "{tablename}" USING gin ("{column_name}" gin_trgm_ops)',
+            ]
+        elif _supports_fts(table):
+            return _get_fts_queries(table, self.column, tokenize="trigram")
+
+        return []
+
+    def get_conditions(
+        self, table: type[Table], search_term: str
+    ) -> list[QueryString]:
+        if not _supports_fts(table):
+            return super().get_conditions(table, search_term)
+
+        assert self.column is not None
+        fts_tablename = _get_fts_table_name(table, self.column)
+        column_name = self.column._meta.db_column_name
+        primary_key_name = table._meta.primary_key._meta.name
+        escaped = escape_like(search_term)
+
+        return [
+            QueryString(
+                f'subquery."{primary_key_name}" IN ('
+                f'SELECT rowid FROM "{fts_tablename}" '
+                f"WHERE \"{column_name}\" LIKE {{}} ESCAPE '\\')",
+                pattern,
+            )
+            for pattern in (f"{escaped}%", f"%{escaped}%")
+        ]
+
+
+class FullTextSearch(SearchStrategy):
+    """
+    Matches rows containing words which start with each word in the search
+    term - so ``'jo sm'`` matches ``'John Smith'``, but ``'ohn'`` doesn't.
+    Rows starting with the search term are shown first.
+
+    On Postgres, a ``tsvector`` GIN index is used. On SQLite, an FTS5 table
+    is used, which requires an integer primary key - otherwise it behaves
+    like :class:`ContainsSearch`.
+
+    The index has to be created using :meth:`create_indexes`.
+
+    :param column:
+        The column to search.
+    :param language:
+        The Postgres text search configuration. The default, ``'simple'``,
+        doesn't remove stop words, or stem words, which suits names.
+
+    """
+
+    def __init__(self, column: Column, language: str = "simple"):
+        if not re.fullmatch(r"\w+", language):
+            raise ValueError("The language isn't valid.")
+        super().__init__(column=column)
+        self.language = language
+
+    def get_index_queries(self, table: type[Table]) -> list[str]:
+        assert self.column is not None
+        tablename = table._meta.tablename
+        column_name = self.column._meta.db_column_name
+
+        if table._meta.db.engine_type == "postgres":
+            return [
+                f'CREATE INDEX IF NOT EXISTS "{tablename}_{column_name}_tsv" '
+                f'ON "{tablename}" USING gin '
+                f"(to_tsvector('{self.language}', \"{column_name}\"))"
+            ]
+        elif _supports_fts(table):
+            return _get_fts_queries(table, self.column, tokenize="unicode61")
+
+        return []
+
+    def get_conditions(
+        self, table: type[Table], search_term: str
+    ) -> list[QueryString]:
+        words = get_words(search_term)
+        if not words:
+            return []
+
+        expression = self.get_expression()
+        engine_type = table._meta.db.engine_type
+
+        if engine_type == "postgres":
+            match = QueryString(
+                f"to_tsvector('{self.language}', {expression}) @@ "
+                f"to_tsquery('{self.language}', {{}})",
+                " & ".join(f"'{i}':*" for i in words),
+            )
+        elif _supports_fts(table):
+            assert self.column is not None
+            fts_tablename = _get_fts_table_name(table, self.column)
+            primary_key_name = table._meta.primary_key._meta.name
+            match = QueryString(
+                f'subquery."{primary_key_name}" IN ('
+                f'SELECT rowid FROM "{fts_tablename}" '
+                f'WHERE "{fts_tablename}" MATCH {{}})',
+                " ".join(f'"{i}"*' for i in words),
+            )
+        else:
+            return ContainsSearch(column=self.column).get_conditions(
+                table, search_term
+            )
+
+        operator = "ILIKE" if engine_type == "postgres" else "LIKE"
+        starts_with = QueryString(
+            f"{{}} AND {expression} {operator} {{}} ESCAPE '\\'",
+            match,
+            f"{escape_like(search_term)}%",
+        )
+        return [starts_with, match]
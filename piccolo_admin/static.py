@@ -0,0 +1,108 @@
+"""
+Serves the static assets for the UI (the JavaScript and CSS files built by
+Vite).
+"""
+
+from __future__ import annotations
+
+import re
+import stat
+from mimetypes import guess_type
+from typing import Optional
+
+import anyio.to_thread
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# The build writes compressed versions of the assets alongside the originals.
+# In order of preference.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Vite adds a hash of the contents to the file names in the assets folder,
+# for example `index-B0sTfVCI.js`.
+HASHED_FILE_NAME = re.compile(r"-[\w-]{8}\.\w+$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def get_accepted_encodings(scope: Scope) -> set[str]:
+    """
+    Parses the ``Accept-Encoding`` header, ignoring any encodings with a
+    quality of zero.
+    """
+    accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+    encodings = set()
+
+    for item in accept_encoding.split(","):
+        encoding, *params = [i.strip() for i in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    pass
+        if encoding and quality > 0:
+            encodings.add(encoding.lower())
+
+    return encodings
+
+
+class AssetFiles(StaticFiles):
+    """
+    Like ``StaticFiles``, but if the browser supports it, sends the Brotli or
+    gzip compressed version of a file instead, if one was created by the
+    build.
+
+    The file names contain a hash of their contents, so browsers are told
+    they can cache them indefinitely.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await self.get_compressed_response(
+            path, scope
+        ) or await super().get_response(path, scope)
+
+        response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = (
+            IMMUTABLE_CACHE_CONTROL
+            if HASHED_FILE_NAME.search(path)
+            else "no-cache"
+        )
+        return response
+
+    async def get_compressed_response(
+        self, path: str, scope: Scope
+    ) -> Optional[Response]:
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
+
+        accepted_encodings = get_accepted_encodings(scope)
+
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted_encodings:
+                continue
+
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(
+                    self.lookup_path, path + suffix
+                )
+            except (OSError, ValueError):
+                return None
+
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=guess_type(path)[0] or "text/plain",
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(response.headers, Headers(scope=scope)):
+                return NotModifiedResponse(response.headers)
+            return response
+
+        return None
@@ -34,6 +34,7 @@ ENGLISH = Translation(
         "Back": "Back",
         "Change Password": "Change Password",
         "Clear filters": "Clear filters",
+        "Clear selection": "Clear selection",
         "Close": "Close",
         "Comma": "Comma",
         "Create": "Create",
@@ -57,6 +58,7 @@ ENGLISH = Translation(
         "Hide referencing tables": "Hide referencing tables",
         "Home": "Home",
         "Hours": "Hours",
+        "Infinite scroll": "Infinite scroll",
         "Light Mode": "Light Mode",
         "Links": "Links",
         "Loading": "Loading",
@@ -82,6 +84,8 @@ ENGLISH = Translation(
         "Select a Column": "Select a Column",
         "Select a table in the sidebar to get started.": "Select a table in the sidebar to get started.",
         "selected result(s) on": "selected result(s) on",
+        "Select all matching result(s)": "Select all matching result(s)",
+        "matching result(s) selected": "matching result(s) selected",
         "Semicolon": "Semicolon",
         "Set Timezone": "Set Timezone",
         "Show Filters": "Show filters",
@@ -117,6 +121,7 @@ WELSH = Translation(
         "Back": "Ol",
         "Change Password": "Newid cyfrinair",
         "Clear filters": "Clirio hidlwyr",
+        "Clear selection": "Clirio'r dewis",
         "Close": "Cau",
         "Comma": "Coma",
         "Create": "Creu",
@@ -140,6 +145,7 @@ WELSH = Translation(
         "Hide referencing tables": "Cuddio tablau cyfeirio",
         "Home": "Cartref",
         "Hours": "Oriau",
+        "Infinite scroll": "Sgrolio diddiwedd",
         "Light Mode": "Modd Golau",
         "Links": "Dolenni",
         "Loading": "Llwytho",
@@ -165,6 +171,8 @@ WELSH = Translation(
         "Select a Column": "Dewiswch Golofn",
         "Select a table in the sidebar to get started.": "Dewiswch un o'r tablau yn y bar ochr i ddechrau.",
         "selected result(s) on": "canlyniad(au) dethol ymlaen",
+        "Select all matching result(s)": "Dewis pob canlyniad cyfatebol",
+        "matching result(s) selected": "canlyniad(au) cyfatebol wedi'u dewis",
         "Semicolon": "Semicolon",
         "Set Timezone": "Gosod Cylchfa Amser",
         "Show Filters": "Dangos hidlwyr",
@@ -199,6 +207,7 @@ CROATIAN = Translation(
         "Back": "Natrag",
         "Change Password": "Promijeni lozinku",
         "Clear filters": "Obriši filtere",
+        "Clear selection": "Poništi odabir",
         "Close": "Zatvori",
         "Comma": "Zarez",
         "Create": "Kreiraj",
@@ -222,6 +231,7 @@ CROATIAN = Translation(
         "Hide referencing tables": "Sakrij referentne tablice",
         "Home": "Početna",
         "Hours": "Sati",
+        "Infinite scroll": "Beskonačno pomicanje",
         "Light Mode": "Svijetli način rada",
         "Links": "Poveznice",
         "Loading": "Učitavanje",
@@ -247,6 +257,8 @@ CROATIAN = Translation(
         "Select a Column": "Odaberite stupac",
         "Select a table in the sidebar to get started.": "Za početak odaberite jednu od tablica na bočnoj traci.",
         "selected result(s) on": "odabranih rezultat(a) na",
+        "Select all matching result(s)": "Odaberi sve odgovarajuće rezultate",
+        "matching result(s) selected": "odgovarajućih rezultat(a) odabrano",
         "Semicolon": "Točka i zarez",
         "Set Timezone": "Postavite vremensku zonu",
         "Show Filters": "Prikaži filtere",
@@ -282,6 +294,7 @@ PORTUGUESE = Translation(
         "Back": "Voltar atrás",
         "Change Password": "Mudar senha",
         "Clear filters": "Limpar Filtros",
+        "Clear selection": "Limpar seleção",
         "Close": "Fechar",
         "Comma": "Vírgula",
         "Create": "Criar",
@@ -305,6 +318,7 @@ PORTUGUESE = Translation(
         "Hide referencing tables": "Ocultar tabelas de referência",
         "Home": "Página inicial",
         "Hours": "Horas",
+        "Infinite scroll": "Rolagem infinita",
         "Light Mode": "Modo claro",
         "Links": "Links",
         "Loading": "Carregando",
@@ -330,6 +344,8 @@ PORTUGUESE = Translation(
         "Select a Column": "Selecione uma coluna",
         "Select a table in the sidebar to get started.": "Selecione uma tabela na barra lateral para começar.",
         "selected result(s) on": "Resultados selecionados (s) em",
+        "Select all matching result(s)": "Selecionar todos os resultados correspondentes",
+        "matching result(s) selected": "resultado(s) correspondente(s) selecionado(s)",
         "Semicolon": "Ponto e vírgula",
         "Set Timezone": "Definir fuso horário",
         "Show Filters": "Mostrar filtros",
@@ -365,6 +381,7 @@ GERMAN = Translation(
         "Back": "Zurück",
         "Change Password": "Passwort ändern",
         "Clear filters": "Filter löschen",
+        "Clear selection": "Auswahl aufheben",
         "Close": "Schließen",
         "Comma": "Komma",
         "Create": "Anlegen",
@@ -388,6 +405,7 @@ GERMAN = Translation(
         "Hide referencing tables": "Referenzierungstabellen ausblenden",
         "Home": "Startseite",
         "Hours": "Std",
+        "Infinite scroll": "Endloses Scrollen",
         "Light Mode": "Heller Modus",
         "Links": "Links",
         "Loading": "Wird geladen",
@@ -413,6 +431,8 @@ GERMAN = Translation(
         "Select a Column": "Wählen Sie eine Spalte aus",
         "Select a table in the sidebar to get started.": "Wählen Sie eine Tabelle in der Seitenleiste aus, um loszulegen.",
         "selected result(s) on": "ausgewählte(s) Ergebnis(se) auf",
+        "Select all matching result(s)": "Alle passenden Ergebnisse auswählen",
+        "matching result(s) selected": "passende(s) Ergebnis(se) ausgewählt",
         "Semicolon": "Semikolon",
         "Set Timezone": "Zeitzone einstellen",
         "Show Filters": "Filter anzeigen",
@@ -448,6 +468,7 @@ FRENCH = Translation(
         "Back": "Retour",
         "Change Password": "Changer le mot de passe",
         "Clear filters": "Supprimer les filtres",
+        "Clear selection": "Effacer la sélection",
         "Close": "Fermer",
         "Create": "Créer",
         "Comma": "Virgule",
@@ -471,6 +492,7 @@ FRENCH = Translation(
         "Hide referencing tables": "Masquer les tables de référence",
         "Home": "Accueil",
         "Hours": "Heures",
+        "Infinite scroll": "Défilement infini",
         "Light Mode": "Mode léger",
         "Links": "Liens",
         "Loading": "Chargement",
@@ -496,6 +518,8 @@ FRENCH = Translation(
         "Select a Column": "Sélectionnez une colonne",
         "Select a table in the sidebar to get started.": "Sélectionnez une table dans la barre latérale pour commencer.",
         "selected result(s) on": "Résultats sélectionnés sur",
+        "Select all matching result(s)": "Sélectionner tous les résultats correspondants",
+        "matching result(s) selected": "résultat(s) correspondant(s) sélectionné(s)",
         "Semicolon": "Point-virgule",
         "Set Timezone": "Définir le fuseau horaire",
         "Show Filters": "Montrer les filtres",
@@ -531,6 +555,7 @@ SPANISH = Translation(
         "Back": "atrás",
         "Change Password": "Cambia la contraseña",
         "Clear filters": "Eliminar filtros",
+        "Clear selection": "Borrar selección",
         "Close": "Cerca",
         "Comma": "Coma",
         "Create": "Crear",
@@ -554,6 +579,7 @@ SPANISH = Translation(
         "Hide referencing tables": "Ocultar tablas de referencia",
         "Home": "Hogar",
         "Hours": "Horas",
+        "Infinite scroll": "Desplazamiento infinito",
         "Light Mode": "Modo de luz",
         "Links": "Enlaces",
         "Loading": "Cargando",
@@ -579,6 +605,8 @@ SPANISH = Translation(
         "Select a Column": "Seleccione una columna",
         "Select a table in the sidebar to get started.": "Seleccione una tabla en la barra lateral para comenzar.",
         "selected result(s) on": "Resultados seleccionados en",
+        "Select all matching result(s)": "Seleccionar todos los resultados coincidentes",
+        "matching result(s) selected": "resultado(s) coincidente(s) seleccionado(s)",
         "Semicolon": "Punto y coma",
         "Set Timezone": "Establecer zona horaria",
         "Show Filters": "Mostrar filtros",
@@ -613,6 +641,7 @@ FINNISH = Translation(
         "Back": "Takaisin",
         "Change Password": "Vaihda salasana",
         "Clear filters": "Nollaa suodattimet",
+        "Clear selection": "Tyhjennä valinta",
         "Close": "Sulje",
         "Comma": "Pilkku",
         "Create": "Luo",
@@ -636,6 +665,7 @@ FINNISH = Translation(
         "Hide referencing tables": "Piilota viitetaulukot",
         "Home": "Koti",
         "Hours": "Tunnit",
+        "Infinite scroll": "Loputon vieritys",
         "Light Mode": "Vaalea tila",
         "Links": "Linkkejä",
         "Loading": "Latautuu",
@@ -661,6 +691,8 @@ FINNISH = Translation(
         "Select a Column": "Valitse pystyrivi",
         "Select a table in the sidebar to get started.": "Valitse taulu sivupalkista aloittaaksesi.",
         "selected result(s) on": "valitut tulokset",
+        "Select all matching result(s)": "Valitse kaikki vastaavat tulokset",
+        "matching result(s) selected": "vastaavaa tulosta valittu",
         "Semicolon": "Puolipiste",
         "Set Timezone": "Aseta aikavyöhyke",
         "Show Filters": "Näytä suodattimet",
@@ -695,6 +727,7 @@ RUSSIAN = Translation(
         "Back": "Назад",
         "Change Password": "Сменить пароль",
         "Clear filters": "Сбросить фильтры",
+        "Clear selection": "Сбросить выбор",
         "Close": "Закрыть",
         "Comma": "Запятая",
         "Create": "Создать",
@@ -718,6 +751,7 @@ RUSSIAN = Translation(
         "Hide referencing tables": "Скрыть связаные таблицы",
         "Home": "Главная",
         "Hours": "Часы",
+        "Infinite scroll": "Бесконечная прокрутка",
         "Light Mode": "Светлая тема",
         "Links": "Cсылки",
         "Loading": "Загрузка",
@@ -743,6 +777,8 @@ RUSSIAN = Translation(
         "Select a Column": "Выберите столбец",
         "Select a table in the sidebar to get started.": "Выберите таблицу в боковой панели.",
         "selected result(s) on": "выбрано на",
+        "Select all matching result(s)": "Выбрать все подходящие результаты",
+        "matching result(s) selected": "подходящих результатов выбрано",
         "Semicolon": "Точка с запятой",
         "Set Timezone": "Установить часовой пояс",
         "Show Filters": "Показать фильтры",
@@ -777,6 +813,7 @@ UKRAINIAN = Translation(
         "Back": "Назад",
         "Change Password": "Змінити пароль",
         "Clear filters": "Очистити фільтри",
+        "Clear selection": "Скасувати вибір",
         "Close": "Закрити",
         "Comma": "Кома",
         "Create": "Створити",
@@ -800,6 +837,7 @@ UKRAINIAN = Translation(
         "Hide referencing tables": "Приховати пов'язані таблиці",
         "Home": "Головна",
         "Hours": "Години",
+        "Infinite scroll": "Нескінченна прокрутка",
         "Light Mode": "Світла тема",
         "Links": "Посилання",
         "Loading": "Завантаження",
@@ -825,6 +863,8 @@ UKRAINIAN = Translation(
         "Select a Column": "Виберіть стовпчик",
         "Select a table in the sidebar to get started.": "Виберіть таблицю в бічній панелі.",
         "selected result(s) on": "вибрано на",
+        "Select all matching result(s)": "Вибрати всі відповідні результати",
+        "matching result(s) selected": "відповідних результатів вибрано",
         "Semicolon": "Крапка з комою",
         "Set Timezone": "Установити часовий пояс",
         "Show Filters": "Показати фільтри",
@@ -859,6 +899,7 @@ SIMPLIFIED_CHINESE = Translation(
         "Back": "返回",
         "Change Password": "修改密码",
         "Clear filters": "清除过滤器",
+        "Clear selection": "清除选择",
         "Close": "关闭",
         "Comma": "逗号",
         "Create": "创建",
@@ -882,6 +923,7 @@ SIMPLIFIED_CHINESE = Translation(
         "Hide referencing tables": "隐藏引用的表",
         "Home": "主页",
         "Hours": "小时",
+        "Infinite scroll": "无限滚动",
         "Light Mode": "白天模式",
         "Links": "链接",
         "Loading": "加载中",
@@ -907,6 +949,8 @@ SIMPLIFIED_CHINESE = Translation(
         "Select a Column": "选择一个列",
         "Select a table in the sidebar to get started.": "请在侧栏选择一个表来开始编辑",
         "selected result(s) on": "选择的结果",
+        "Select all matching result(s)": "选择所有匹配的结果",
+        "matching result(s) selected": "个匹配的结果已选择",
         "Semicolon": "分号",
         "Set Timezone": "设置时区",
         "Show Filters": "显示过滤器",
@@ -942,6 +986,7 @@ TRADITIONAL_CHINESE = Translation(
         "Back": "返回",
         "Change Password": "修改密碼",
         "Clear filters": "清除篩選器",
+        "Clear selection": "清除選擇",
         "Close": "關閉",
         "Comma": "逗號",
         "Create": "建立",
@@ -965,6 +1010,7 @@ TRADITIONAL_CHINESE = Translation(
         "Hide referencing tables": "隱藏引用的表格",
         "Home": "首頁",
         "Hours": "小時",
+        "Infinite scroll": "無限捲動",
         "Light Mode": "淺色模式",
         "Links": "連結",
         "Loading": "載入中",
@@ -990,6 +1036,8 @@ TRADITIONAL_CHINESE = Translation(
         "Select a Column": "選擇一列",
         "Select a table in the sidebar to get started.": "請於側邊欄選擇一個表格來開始編輯",
         "selected result(s) on": "選擇結果",
+        "Select all matching result(s)": "選擇所有符合的結果",
+        "matching result(s) selected": "個符合的結果已選擇",
         "Semicolon": "分號",
         "Set Timezone": "設定時區",
         "Show Filters": "顯示篩選器",
@@ -1024,6 +1072,7 @@ TURKISH = Translation(
         "Back": "Geri dön",
         "Change Password": "Şifreyi değiştir",
         "Clear filters": "Filtreleri temizle",
+        "Clear selection": "Seçimi temizle",
         "Close": "Kapat",
         "Comma": "Virgül",
         "Create": "Oluştur",
@@ -1047,6 +1096,7 @@ TURKISH = Translation(
         "Hide referencing tables": "Referans tablolarını gizle",
         "Home": "Ana Sayfa",
         "Hours": "Saatler",
+        "Infinite scroll": "Sonsuz kaydırma",
         "Light Mode": "Gündüz Modu",
         "Links": "Bağlantılar",
         "Loading": "Yükleniyor",
@@ -1072,6 +1122,8 @@ TURKISH = Translation(
         "Select a Column": "Bir sütun seç",
         "Select a table in the sidebar to get started.": "Başlamak için kenar çubuğundaki bir tabloyu seçin.",
         "selected result(s) on": "seçilen kayıt(lar)",
+        "Select all matching result(s)": "Eşleşen tüm kayıtları seç",
+        "matching result(s) selected": "eşleşen kayıt seçildi",
         "Semicolon": "Noktalı virgül",
         "Set Timezone": "Saat Dilimini Ayarla",
         "Show Filters": "Filtreleri Göster",
@@ -1106,6 +1158,7 @@ FARSI = Translation(
         "Back": "بازگشت",
         "Change Password": "تغییر رمز عبور",
         "Clear filters": "پاک‌کردن فیلترها",
+        "Clear selection": "پاک‌کردن انتخاب",
         "Close": "بستن",
         "Comma": "ویرگول",
         "Create": "ایجاد",
@@ -1129,6 +1182,7 @@ FARSI = Translation(
         "Hide referencing tables": "پنهان کردن جدول‌های مرتبط",
         "Home": "خانه",
         "Hours": "ساعت",
+        "Infinite scroll": "پیمایش بی‌پایان",
         "Light Mode": "حالت روشن",
         "Links": "پیوندها",
         "Loading": "در حال بارگذاری",
@@ -1154,6 +1208,8 @@ FARSI = Translation(
         "Select a Column": "یک ستون انتخاب کنید",
         "Select a table in the sidebar to get started.": "برای شروع، یک جدول را از نوار کناری انتخاب کنید.",
         "selected result(s) on": "نتیجه(های) انتخاب‌شده در",
+        "Select all matching result(s)": "انتخاب همه نتایج منطبق",
+        "matching result(s) selected": "نتیجه(های) منطبق انتخاب‌شده",
         "Semicolon": "نقطه‌ویرگول",
         "Set Timezone": "تنظیم منطقه زمانی",
         "Show Filters": "نمایش فیلترها",
@@ -1189,6 +1245,7 @@ ITALIAN = Translation(
         "Back": "Indietro",
         "Change Password": "Cambia Password",
         "Clear filters": "Rimuovi filtri",
+        "Clear selection": "Cancella selezione",
         "Close": "Chiudi",
         "Comma": "Virgola",
         "Create": "Crea",
@@ -1212,6 +1269,7 @@ ITALIAN = Translation(
         "Hide referencing tables": "Nascondi tabelle di riferimento",
         "Home": "Home",
         "Hours": "Ore",
+        "Infinite scroll": "Scorrimento infinito",
         "Light Mode": "Modalità chiara",
         "Links": "Link",
         "Loading": "Caricamento",
@@ -1237,6 +1295,8 @@ ITALIAN = Translation(
         "Select a Column": "Seleziona una colonna",
         "Select a table in the sidebar to get started.": "Seleziona una tabella nella barra laterale per iniziare.",
         "selected result(s) on": "risultato(i) selezionato(i) su",
+        "Select all matching result(s)": "Seleziona tutti i risultati corrispondenti",
+        "matching result(s) selected": "risultato(i) corrispondente(i) selezionato(i)",
         "Semicolon": "Punto e virgola",
         "Set Timezone": "Imposta fuso orario",
         "Show Filters": "Mostra filtri",
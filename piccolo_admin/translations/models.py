@@ -1,9 +1,18 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
 class TranslationListItem(BaseModel):
     language_name: str = Field(description="e.g. 'English'")
     language_code: str = Field(description="e.g. 'en'")
+    content_hash: Optional[str] = Field(
+        default=None,
+        description=(
+            "Changes whenever the translation changes, so clients can cache "
+            "it."
+        ),
+    )
 
 
 class TranslationListResponse(BaseModel):
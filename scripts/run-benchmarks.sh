@@ -0,0 +1,6 @@
+#!/bin/bash
+# Measures startup time, memory usage, and endpoint latency, for different
+# numbers of tables. Any arguments are passed on - for example:
+#   ./scripts/run-benchmarks.sh --output=before.json --table_counts=10,100
+
+python -m benchmarks.scaling run "$@"
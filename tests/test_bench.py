@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import httpx
+
+from piccolo_admin.example.bench import (
+    REQUEST_WEIGHTS,
+    Results,
+    build_request,
+)
+
+
+class TestResults(TestCase):
+    def test_summarise(self):
+        results = Results(elapsed=2.0)
+        for i in range(1, 101):
+            results.record("listing", duration=i / 1000, success=i != 100)
+        results.record("edit", duration=0.5, success=True)
+
+        summary = results.summarise()
+        self.assertListEqual(
+            list(summary.keys()), ["listing", "edit", "total"]
+        )
+
+        listing = summary["listing"]
+        self.assertEqual(listing["requests"], 100)
+        self.assertEqual(listing["errors"], 1)
+        self.assertEqual(listing["requests_per_second"], 50.0)
+        self.assertEqual(listing["p50_ms"], 50.5)
+        self.assertEqual(listing["p99_ms"], 99.01)
+
+        self.assertEqual(summary["edit"]["p95_ms"], 500.0)
+        self.assertEqual(summary["total"]["requests"], 101)
+        self.assertEqual(summary["total"]["errors"], 1)
+
+
+class TestBuildRequest(TestCase):
+    def test_build_request(self):
+        client = httpx.AsyncClient(base_url="http://localhost")
+
+        for name in REQUEST_WEIGHTS:
+            request = build_request(
+                client, name=name, movie_ids=[1], csrftoken="abc123"
+            )
+            self.assertTrue(request.url.path.startswith("/api/tables/"))
+
+            if name == "edit":
+                self.assertEqual(request.method, "PATCH")
+                self.assertEqual(request.headers["X-CSRFToken"], "abc123")
+            else:
+                self.assertEqual(request.method, "GET")
+
+        with self.assertRaises(ValueError):
+            build_request(client, name="foo", movie_ids=[1], csrftoken="")
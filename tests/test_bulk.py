@@ -0,0 +1,104 @@
+import asyncio
+from unittest import TestCase
+
+from starlette.requests import Request
+
+from piccolo_admin.bulk import (
+    BulkActionError,
+    Job,
+    JobManager,
+    batched,
+    detach_request,
+    serialise_row_id,
+)
+
+
+class TestBatched(TestCase):
+    def test_batched(self):
+        self.assertListEqual(
+            batched([1, 2, 3, 4, 5], 2), [[1, 2], [3, 4], [5]]
+        )
+        self.assertListEqual(batched([], 2), [])
+
+
+class TestSerialiseRowID(TestCase):
+    def test_serialise_row_id(self):
+        self.assertEqual(serialise_row_id(1), 1)
+        self.assertEqual(serialise_row_id(2**53 - 1), 2**53 - 1)
+        self.assertEqual(serialise_row_id(2**53), str(2**53))
+        self.assertEqual(serialise_row_id("abc"), "abc")
+
+
+class TestDetachRequest(TestCase):
+    def test_detach_request(self):
+        async def receive():
+            return {"type": "http.request", "body": b"{}"}
+
+        request = Request(
+            scope={
+                "type": "http",
+                "method": "POST",
+                "path": "/tables/director/-/bulk-delete/matching/",
+                "query_string": b"name=Bob",
+                "headers": [(b"x-custom", b"abc")],
+                "user": "Bob",
+            },
+            receive=receive,
+        )
+        detached_request = detach_request(request)
+
+        self.assertEqual(detached_request.user, "Bob")
+        self.assertEqual(detached_request.headers["x-custom"], "abc")
+        self.assertEqual(detached_request.query_params["name"], "Bob")
+        # The request body isn't kept.
+        self.assertIsNot(detached_request.receive, receive)
+
+
+class TestJob(TestCase):
+    def test_add_results(self):
+        job = Job(job_id="abc", table_name="director", action="delete")
+
+        job.add_results(
+            [1, 2],
+            [BulkActionError(row_id=i, detail="Oops") for i in range(200)],
+        )
+        self.assertEqual(job.processed, 202)
+        self.assertEqual(job.succeeded, 2)
+        self.assertEqual(job.error_count, 200)
+        # Only the first errors are kept.
+        self.assertEqual(len(job.errors), 100)
+
+
+class TestJobManager(TestCase):
+    def test_jobs(self):
+        async def run():
+            job_manager = JobManager(max_jobs=1)
+
+            async def succeed(job: Job):
+                job.total = 1
+
+            async def fail(job: Job):
+                raise ValueError("Oops")
+
+            first_job = job_manager.start("director", "delete", 1, succeed)
+            self.assertEqual(first_job.status, "running")
+            await asyncio.sleep(0.01)
+            self.assertEqual(first_job.status, "completed")
+            self.assertEqual(first_job.total, 1)
+
+            second_job = job_manager.start("director", "update", 1, fail)
+            await asyncio.sleep(0.01)
+            self.assertEqual(second_job.status, "failed")
+            self.assertEqual(second_job.detail, "Oops")
+
+            # Only `max_jobs` finished jobs are kept.
+            job_manager.start("director", "delete", 1, succeed)
+            self.assertIsNone(job_manager.get(first_job.job_id, user_id=1))
+            self.assertIs(
+                job_manager.get(second_job.job_id, user_id=1), second_job
+            )
+
+            # Other users can't see the job.
+            self.assertIsNone(job_manager.get(second_job.job_id, user_id=2))
+
+        asyncio.run(run())
@@ -0,0 +1,148 @@
+import time
+from datetime import timedelta
+from unittest import TestCase
+from unittest.mock import patch
+
+from piccolo.columns.column_types import Varchar
+from piccolo.table import Table
+from piccolo.testing.test_case import AsyncTableTest
+from piccolo_api.crud.hooks import HookType
+
+from piccolo_admin.count import (
+    CappedCount,
+    CountCache,
+    EstimatedCount,
+    ExactCount,
+    RowCount,
+)
+
+
+class Band(Table):
+    name = Varchar()
+
+
+class TestCountStrategies(AsyncTableTest):
+    tables = [Band]
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await Band.insert(
+            *[
+                Band(name=name)
+                for name in ("Pythonistas", "Rustaceans", "C-Sharps")
+            ]
+        )
+
+    async def test_exact(self):
+        query = Band.select(Band.id).where(Band.name != "C-Sharps")
+        self.assertEqual(
+            await ExactCount().count(query=query, filtered=True),
+            RowCount(count=2),
+        )
+
+    async def test_capped(self):
+        query = Band.select(Band.id)
+        self.assertEqual(
+            await CappedCount(limit=2).count(query=query, filtered=False),
+            RowCount(count=2, count_type="capped"),
+        )
+        self.assertEqual(
+            await CappedCount(limit=3).count(query=query, filtered=False),
+            RowCount(count=3),
+        )
+
+    async def test_estimated(self):
+        """
+        Only Postgres provides estimates, otherwise we fall back to an exact
+        count.
+        """
+        query = Band.select(Band.id)
+        self.assertEqual(
+            await EstimatedCount().count(query=query, filtered=False),
+            RowCount(count=3),
+        )
+
+
+class TestCappedCount(TestCase):
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            CappedCount(limit=0)
+
+
+class TestCountCache(TestCase):
+    def test_get_key(self):
+        """
+        Only the filters should affect the key.
+        """
+        self.assertEqual(
+            CountCache.get_key(
+                "band", {"name": "Pythonistas", "__page": 2, "__order": "id"}
+            ),
+            CountCache.get_key("band", {"name": "Pythonistas"}),
+        )
+        self.assertNotEqual(
+            CountCache.get_key("band", {"name": "Pythonistas"}),
+            CountCache.get_key("band", {"name": "Rustaceans"}),
+        )
+
+    def test_expiry(self):
+        cache = CountCache(ttl=timedelta(seconds=10))
+        cache.set("band", {}, RowCount(count=3), version=0)
+        now = time.monotonic()
+
+        with patch("piccolo_admin.count.time.monotonic") as monotonic:
+            monotonic.return_value = now + 5
+            self.assertEqual(cache.get("band", {}), RowCount(count=3))
+
+            monotonic.return_value = now + 11
+            self.assertIsNone(cache.get("band", {}))
+
+    def test_max_size(self):
+        """
+        Make sure the least recently used entry is discarded.
+        """
+        cache = CountCache(ttl=timedelta(minutes=1), max_size=2)
+        cache.set("band", {"name": "a"}, RowCount(count=1), version=0)
+        cache.set("band", {"name": "b"}, RowCount(count=2), version=0)
+        cache.get("band", {"name": "a"})
+        cache.set("band", {"name": "c"}, RowCount(count=3), version=0)
+
+        self.assertIsNotNone(cache.get("band", {"name": "a"}))
+        self.assertIsNone(cache.get("band", {"name": "b"}))
+        self.assertIsNotNone(cache.get("band", {"name": "c"}))
+
+    def test_invalidate(self):
+        cache = CountCache(ttl=timedelta(minutes=1))
+        cache.set("band", {}, RowCount(count=1), version=0)
+        cache.set("manager", {}, RowCount(count=2), version=0)
+
+        version = cache.get_version("band")
+        cache.invalidate("band")
+        self.assertIsNone(cache.get("band", {}))
+        self.assertIsNotNone(cache.get("manager", {}))
+
+        # Counts started before the invalidation are discarded.
+        cache.set("band", {}, RowCount(count=1), version=version)
+        self.assertIsNone(cache.get("band", {}))
+
+    def test_count_before_commit(self):
+        """
+        A count which starts after the hook, but before the change has been
+        committed, is cached - this is the staleness window described in the
+        ``CountCache`` docstring. Invalidating again after the commit (as the
+        bulk actions do) clears it.
+        """
+        cache = CountCache(ttl=timedelta(minutes=1))
+        hooks = {i.hook_type: i.callable for i in cache.get_hooks("band")}
+
+        # A row is being deleted.
+        hooks[HookType.pre_delete](row_id=1)
+
+        # A count starts, before the delete has been committed.
+        version = cache.get_version("band")
+        cache.set("band", {}, RowCount(count=3), version=version)
+        self.assertEqual(cache.get("band", {}), RowCount(count=3))
+
+        # The delete is committed.
+        cache.invalidate("band")
+        self.assertIsNone(cache.get("band", {}))
@@ -2,13 +2,18 @@ import csv
 import datetime
 import io
 import os
+import tempfile
+import time
 import uuid
 from pathlib import Path
+from typing import Optional
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from piccolo.apps.user.tables import BaseUser
 from piccolo.columns.column_types import (
+    Array,
+    BigInt,
     ForeignKey,
     Integer,
     Text,
@@ -24,7 +29,9 @@ from piccolo_api.mfa.authenticator.tables import AuthenticatorSecret
 from piccolo_api.session_auth.tables import SessionsBase
 from starlette.exceptions import HTTPException
 from starlette.testclient import TestClient
+from starlette.types import ASGIApp
 
+from piccolo_admin.count import CappedCount, CountCache, RowCount
 from piccolo_admin.endpoints import (
     OrderBy,
     TableConfig,
@@ -36,6 +43,38 @@ from piccolo_admin.translations.data import ENGLISH, FRENCH, TRANSLATIONS
 from piccolo_admin.version import __VERSION__
 
 
+def wait_for_bulk_job(client: TestClient, job_id: str) -> dict:
+    for _ in range(100):
+        job = client.get(f"/api/bulk-jobs/{job_id}/").json()
+        if job["status"] != "running":
+            return job
+        time.sleep(0.05)
+    raise TimeoutError("The job didn't finish.")
+
+
+def login(app: ASGIApp, credentials: dict[str, str]) -> tuple[TestClient, str]:
+    """
+    Returns a client which is logged into the admin, and the CSRF token which
+    it needs to send with ``POST`` requests. Use a new app for each client if
+    there are lots of logins, to avoid the rate limit.
+    """
+    client = TestClient(app)
+
+    # To get a CSRF cookie
+    response = client.get("/")
+    csrftoken = response.cookies["csrftoken"]
+
+    # Login
+    payload = dict(csrftoken=csrftoken, **credentials)
+    client.post(
+        "/public/login/",
+        json=payload,
+        headers={"X-CSRFToken": csrftoken},
+    )
+
+    return client, csrftoken
+
+
 class TableA(Table):
     name = Varchar(length=100)
 
@@ -223,6 +262,7 @@ class TestAdminRouter(TestCase):
             {
                 "piccolo_admin_version": __VERSION__,
                 "site_name": "Piccolo Admin",
+                "service_worker": False,
             },
         )
         self.assertEqual(response.status_code, 200)
@@ -233,6 +273,31 @@ class TestAdminRouter(TestCase):
         response = client.get("/")
         self.assertEqual(response.status_code, 200)
 
+    def test_service_worker(self):
+        """
+        It's only served if enabled, and mustn't be cached by the browser.
+        """
+        client = TestClient(create_admin([Movie]))
+        response = client.get("/service-worker.js")
+        self.assertEqual(response.status_code, 404)
+
+        client = TestClient(create_admin([Movie], service_worker=True))
+        self.assertTrue(client.get("/public/meta/").json()["service_worker"])
+
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "service-worker.js"), "w") as f:
+                f.write("// Service worker")
+
+            with patch("piccolo_admin.endpoints.ASSET_PATH", path):
+                response = client.get("/service-worker.js")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "// Service worker")
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+        self.assertTrue(
+            response.headers["Content-Type"].startswith("text/javascript")
+        )
+
     def test_auth_exception(self):
         client = TestClient(APP)
 
@@ -870,6 +935,107 @@ class TestTables(TableTest):
             {"username": "Bob", "user_id": "1"},
         )
 
+    def test_root(self):
+        """
+        Make sure the index page can be revalidated using the ETag.
+        """
+        client = TestClient(APP)
+
+        response = client.get("/")
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["etag"]
+        self.assertTrue(etag.startswith("W/"))
+
+        response = client.get("/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_bootstrap(self):
+        """
+        Make sure everything the UI needs on startup is returned.
+        """
+        client = TestClient(APP)
+
+        # To get a CSRF cookie
+        response = client.get("/")
+        csrftoken = response.cookies["csrftoken"]
+
+        # Login
+        payload = dict(csrftoken=csrftoken, **self.credentials)
+        client.post(
+            "/public/login/",
+            json=payload,
+            headers={"X-CSRFToken": csrftoken},
+        )
+
+        response = client.get("/api/bootstrap/")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(data["user"], client.get("/api/user/").json())
+        self.assertEqual(data["meta"], client.get("/public/meta/").json())
+        self.assertEqual(
+            data["translations"], client.get("/public/translations/").json()
+        )
+        self.assertEqual(
+            data["tables"], client.get("/api/tables/grouped/").json()
+        )
+        self.assertEqual(data["forms"], client.get("/api/forms/").json())
+        self.assertEqual(
+            data["form_groups"], client.get("/api/forms/grouped/").json()
+        )
+        self.assertEqual(data["links"], client.get("/api/links/").json())
+
+        # The language defaults to English.
+        self.assertEqual(data["translation"]["language_code"], "en")
+
+        # If the client already has the translation, it's omitted.
+        content_hash = next(
+            i["content_hash"]
+            for i in data["translations"]["translations"]
+            if i["language_code"] == "en"
+        )
+        response = client.get(
+            "/api/bootstrap/",
+            params={"language_code": "en", "translation_hash": content_hash},
+        )
+        self.assertEqual(response.json()["language_code"], "en")
+        self.assertIsNone(response.json()["translation"])
+
+        # Not logged in
+        response = TestClient(APP).get("/api/bootstrap/")
+        self.assertEqual(response.status_code, 401)
+
+    def test_bootstrap_language(self):
+        """
+        Make sure the correct translation is chosen.
+        """
+        client = TestClient(APP)
+
+        # To get a CSRF cookie
+        response = client.get("/")
+        csrftoken = response.cookies["csrftoken"]
+
+        # Login
+        payload = dict(csrftoken=csrftoken, **self.credentials)
+        client.post(
+            "/public/login/",
+            json=payload,
+            headers={"X-CSRFToken": csrftoken},
+        )
+
+        for params, language_code in (
+            ({"browser_language_code": "de-DE"}, "de"),
+            ({"browser_language_code": "xx"}, "en"),
+            ({"language_code": "fr", "browser_language_code": "de"}, "fr"),
+            ({"language_code": "xx", "browser_language_code": "de"}, "de"),
+        ):
+            response = client.get("/api/bootstrap/", params=params)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                response.json()["translation"]["language_code"],
+                language_code,
+            )
+
     def test_schema(self):
         """
         We add some additonal attributes to the table schema.
@@ -925,61 +1091,1301 @@ class TestTables(TableTest):
             {"booked_on": 1, "start_time": 60},
         )
 
+    def test_schema_etag(self):
+        """
+        Make sure the schema can be revalidated using the ETag.
+        """
+        client, _ = login(APP, self.credentials)
 
-class TestTranslations(TestCase):
-    def test_translations(self):
+        response = client.get("/api/tables/director/schema/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.headers["cache-control"], "private, no-cache"
+        )
+        etag = response.headers["etag"]
+
+        response = client.get(
+            "/api/tables/director/schema/", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        # A different table has a different ETag.
+        response = client.get(
+            "/api/tables/movie/schema/", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+
+        response = client.get("/api/tables/no_such_table/schema/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_schema_validators(self):
         """
-        Test the default configuration, where the translations endpoint should
-        return all translations.
+        The schema is cached, but the validators must still run on every
+        request, including ones which would get a ``304`` response.
         """
-        client = TestClient(APP)
+        allowed = True
 
-        response = client.get("/public/translations/")
+        def get_schema_validator(piccolo_crud, request):
+            if not allowed:
+                raise HTTPException(detail="Not allowed!", status_code=403)
+
+        client, _ = login(
+            create_admin(
+                [
+                    TableConfig(
+                        Director,
+                        validators=Validators(
+                            get_schema=[get_schema_validator]
+                        ),
+                    )
+                ]
+            ),
+            self.credentials,
+        )
+
+        response = client.get("/api/tables/director/schema/")
         self.assertEqual(response.status_code, 200)
+        etag = response.headers["etag"]
 
-        data = response.json()
+        allowed = False
 
-        self.assertEqual(data["default_language_code"], "auto")
+        for headers in ({}, {"If-None-Match": etag}):
+            response = client.get(
+                "/api/tables/director/schema/", headers=headers
+            )
+            self.assertEqual(response.status_code, 403)
+            self.assertEqual(response.json(), {"detail": "Not allowed!"})
+
+
+class TestExportCSV(TableTest):
+    credentials = {"username": "Bob", "password": "bob123"}
+
+    tables = [BaseUser, SessionsBase, AuthenticatorSecret, Director, Movie]
+
+    def setUp(self):
+        super().setUp()
+        BaseUser.create_user_sync(
+            **self.credentials, active=True, admin=True, superuser=True
+        )
+        Director.insert(
+            Director(name="George Lucas", gender="m"),
+            Director(name="Ridley Scott", gender="m"),
+            Director(name="Kathryn Bigelow", gender="f"),
+        ).run_sync()
+
+    def test_export(self):
+        """
+        Make sure all matching rows are exported, using the filters and
+        ordering from the row listing.
+        """
+        client, _ = login(APP, self.credentials)
+
+        response = client.get(
+            "/api/tables/director/-/export.csv",
+            params={
+                "gender": "m",
+                "__order": "name",
+                "__visible_fields": "id,name",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.headers["content-disposition"],
+            'attachment; filename="director.csv"',
+        )
+        self.assertEqual(
+            response.headers["content-type"], "text/csv; charset=utf-8"
+        )
+
+        rows = list(csv.reader(io.StringIO(response.content.decode())))
         self.assertListEqual(
-            [i["language_code"] for i in data.get("translations")],
-            [i.language_code for i in TRANSLATIONS],
+            rows,
+            [["id", "name"], ["1", "George Lucas"], ["2", "Ridley Scott"]],
         )
 
-    def test_translations_custom(self):
+    def test_export_batches(self):
         """
-        Test a custom configuration, where the translations endpoint should
-        return only the configured translations.
+        Make sure rows spanning several database batches are all exported.
         """
-        translations = [ENGLISH, FRENCH]
+        client, _ = login(APP, self.credentials)
 
-        client = TestClient(
-            create_admin(
-                tables=[],
-                translations=translations,
-                default_language_code="fr",
+        with patch("piccolo_admin.endpoints.EXPORT_BATCH_SIZE", 2):
+            response = client.get(
+                "/api/tables/director/-/export.csv",
+                params={"__delimiter": ";", "__visible_fields": "name"},
             )
+        self.assertEqual(response.status_code, 200)
+
+        rows = list(
+            csv.reader(io.StringIO(response.content.decode()), delimiter=";")
+        )
+        self.assertListEqual(
+            rows,
+            [
+                ["name"],
+                ["Kathryn Bigelow"],
+                ["Ridley Scott"],
+                ["George Lucas"],
+            ],
         )
 
-        response = client.get("/public/translations/")
+    def test_export_errors(self):
+        client, _ = login(APP, self.credentials)
+
+        response = client.get("/api/tables/no_such_table/-/export.csv")
+        self.assertEqual(response.status_code, 404)
+
+        response = client.get(
+            "/api/tables/director/-/export.csv", params={"__delimiter": "|"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = client.get(
+            "/api/tables/director/-/export.csv", params={"foo": "bar"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_head(self):
+        """
+        The UI sends a HEAD request first, to check for errors, so make sure
+        it's validated in the same way, but without fetching any rows.
+        """
+        client, _ = login(create_admin([Director]), self.credentials)
+
+        with patch("piccolo_admin.endpoints.fetch_in_batches") as fetch:
+            response = client.head(
+                "/api/tables/director/-/export.csv", params={"gender": "m"}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.headers["content-disposition"],
+            'attachment; filename="director.csv"',
+        )
+        self.assertEqual(response.content, b"")
+        fetch.assert_not_called()
+
+        response = client.head("/api/tables/no_such_table/-/export.csv")
+        self.assertEqual(response.status_code, 404)
+
+        response = client.head(
+            "/api/tables/director/-/export.csv", params={"foo": "bar"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class TestListing(TableTest):
+    credentials = {"username": "Bob", "password": "bob123"}
+
+    tables = [BaseUser, SessionsBase, AuthenticatorSecret, Director]
+
+    def setUp(self):
+        super().setUp()
+        BaseUser.create_user_sync(
+            **self.credentials, active=True, admin=True, superuser=True
+        )
+        # There are duplicate names, to make sure the primary key is used as
+        # a tie breaker.
+        Director.insert(
+            *[
+                Director(name=name, gender="m" if name != "C" else "f")
+                for name in ("A", "B", "B", "B", "C")
+            ]
+        ).run_sync()
+
+    def test_listing(self):
+        """
+        Make sure the rows and the count are returned together.
+        """
+        client, _ = login(APP, self.credentials)
+
+        response = client.get(
+            "/api/tables/director/-/listing/",
+            params={
+                "gender": "m",
+                "__order": "name",
+                "__page": 2,
+                "__page_size": 2,
+                "__visible_fields": "id,name",
+            },
+        )
         self.assertEqual(response.status_code, 200)
+        self.assertDictEqual(
+            response.json(),
+            {
+                "rows": [{"id": 3, "name": "B"}, {"id": 4, "name": "B"}],
+                "count": 4,
+                "count_type": "exact",
+                "page_size": 2,
+                "next_cursor": None,
+                "previous_cursor": None,
+            },
+        )
+
+    def test_skip_count(self):
+        """
+        The client can skip the count, if it already knows it.
+        """
+        client, _ = login(APP, self.credentials)
 
+        response = client.get(
+            "/api/tables/director/-/listing/",
+            params={"__page": 2, "__page_size": 2, "__count": "false"},
+        )
+        self.assertEqual(response.status_code, 200)
         data = response.json()
+        self.assertIsNone(data["count"])
+        self.assertEqual(len(data["rows"]), 2)
 
-        self.assertEqual(data["default_language_code"], "fr")
-        self.assertListEqual(
-            [i["language_code"] for i in data.get("translations")],
-            [i.language_code for i in translations],
+    def test_count_strategy(self):
+        client, _ = login(
+            create_admin(
+                [TableConfig(Director, count_strategy=CappedCount(limit=3))]
+            ),
+            self.credentials,
         )
 
-    def test_get_single_translation(self):
+        response = client.get("/api/tables/director/-/listing/")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(data["count_type"], "capped")
+        self.assertEqual(len(data["rows"]), 5)
+
+    def test_count_cache(self):
         """
-        Make sure we can retrieve a single translation.
+        Make sure counts are cached, and the cache is cleared when a row is
+        modified via the admin.
         """
-        client = TestClient(APP)
+        client, _ = login(
+            create_admin(
+                [Director], count_cache_ttl=datetime.timedelta(minutes=1)
+            ),
+            self.credentials,
+        )
 
-        response = client.get("/public/translations/en/")
+        def get_count() -> int:
+            response = client.get("/api/tables/director/-/listing/")
+            self.assertEqual(response.status_code, 200)
+            return response.json()["count"]
+
+        self.assertEqual(get_count(), 5)
+
+        # Modifying the table directly doesn't clear the cache.
+        Director.delete().where(Director.id == 1).run_sync()
+        self.assertEqual(get_count(), 5)
+
+        # But modifying it via the admin does.
+        response = client.delete(
+            "/api/tables/director/2/",
+            headers={"X-CSRFToken": client.cookies["csrftoken"]},
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(get_count(), 3)
+
+    def test_errors(self):
+        client, _ = login(APP, self.credentials)
+
+        response = client.get("/api/tables/no_such_table/-/listing/")
+        self.assertEqual(response.status_code, 404)
+
+        response = client.get(
+            "/api/tables/director/-/listing/", params={"foo": "bar"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = client.get(
+            "/api/tables/director/-/listing/", params={"__page_size": 10000}
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def get_keyset_page(
+        self, client: TestClient, cursor: Optional[str] = None
+    ):
+        params = {
+            "__order": "name",
+            "__page_size": 2,
+            "__visible_fields": "id,name",
+        }
+        if cursor:
+            params["__cursor"] = cursor
+
+        response = client.get("/api/tables/director/-/listing/", params=params)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json()["translations"]["About"], "About")
+        data = response.json()
+        self.assertEqual(data["count"], 5)
+        return data
+
+    def test_keyset_pagination(self):
+        """
+        Make sure we can page forwards and backwards through the rows.
+        """
+        client, _ = login(
+            create_admin([TableConfig(Director, keyset_pagination=True)]),
+            self.credentials,
+        )
+
+        page_1 = self.get_keyset_page(client)
+        self.assertListEqual(
+            page_1["rows"], [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+        )
+        self.assertIsNone(page_1["previous_cursor"])
+
+        page_2 = self.get_keyset_page(client, page_1["next_cursor"])
+        self.assertListEqual(
+            page_2["rows"], [{"id": 3, "name": "B"}, {"id": 4, "name": "B"}]
+        )
+
+        page_3 = self.get_keyset_page(client, page_2["next_cursor"])
+        self.assertListEqual(page_3["rows"], [{"id": 5, "name": "C"}])
+        self.assertIsNone(page_3["next_cursor"])
+
+        # Now go backwards
+        self.assertEqual(
+            self.get_keyset_page(client, page_3["previous_cursor"]), page_2
+        )
+
+        previous_page = self.get_keyset_page(client, page_2["previous_cursor"])
+        self.assertListEqual(previous_page["rows"], page_1["rows"])
+        self.assertIsNone(previous_page["previous_cursor"])
+
+    def test_invalid_cursor(self):
+        client, _ = login(
+            create_admin([TableConfig(Director, keyset_pagination=True)]),
+            self.credentials,
+        )
+
+        response = client.get(
+            "/api/tables/director/-/listing/", params={"__cursor": "abc"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class Sensor(Table):
+    reading_id = BigInt()
+    reading_ids = Array(BigInt())
+
+
+class TestBigInt(TableTest):
+    credentials = {"username": "Bob", "password": "bob123"}
+
+    tables = [BaseUser, SessionsBase, AuthenticatorSecret, Sensor]
+
+    def setUp(self):
+        super().setUp()
+        BaseUser.create_user_sync(
+            **self.credentials, active=True, admin=True, superuser=True
+        )
+        Sensor.insert(
+            Sensor(reading_id=2**60 + 1, reading_ids=[1, 2**60 + 2])
+        ).run_sync()
+
+    def test_listing(self):
+        """
+        ``BigInt`` values are returned as strings, so they don't lose
+        precision in the browser.
+        """
+        client, _ = login(create_admin([Sensor]), self.credentials)
+
+        response = client.get("/api/tables/sensor/schema/")
+        self.assertListEqual(
+            response.json()["extra"]["bigint_columns"],
+            ["reading_id", "reading_ids"],
+        )
+
+        response = client.get("/api/tables/sensor/-/listing/")
+        self.assertEqual(response.status_code, 200)
+        self.assertListEqual(
+            response.json()["rows"],
+            [
+                {
+                    "id": 1,
+                    "reading_id": str(2**60 + 1),
+                    "reading_ids": ["1", str(2**60 + 2)],
+                }
+            ],
+        )
+
+    def test_single_row(self):
+        """
+        The edit page gets the row from the admin's own endpoint, so
+        ``BigInt`` values are returned as strings there too, and can be
+        saved as strings.
+        """
+        client, csrftoken = login(create_admin([Sensor]), self.credentials)
+
+        response = client.get("/api/tables/sensor/-/rows/1/?__readable=true")
+        self.assertEqual(response.status_code, 200)
+        self.assertDictEqual(
+            response.json(),
+            {
+                "id": 1,
+                "reading_id": str(2**60 + 1),
+                "reading_ids": ["1", str(2**60 + 2)],
+            },
+        )
+
+        response = client.get("/api/tables/sensor/-/rows/2/")
+        self.assertEqual(response.status_code, 404)
+
+        response = client.get("/api/tables/sensor/-/rows/abc/")
+        self.assertEqual(response.status_code, 400)
+
+        response = client.patch(
+            "/api/tables/sensor/1/",
+            json={"reading_id": str(2**60 + 3)},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            Sensor.select(Sensor.reading_id).first().run_sync(),
+            {"reading_id": 2**60 + 3},
+        )
+
+
+class TestBulkDelete(TableTest):
+    credentials = {"username": "Bob", "password": "bob123"}
+
+    tables = [BaseUser, SessionsBase, AuthenticatorSecret, Director]
+
+    def setUp(self):
+        super().setUp()
+        BaseUser.create_user_sync(
+            **self.credentials, active=True, admin=True, superuser=True
+        )
+        Director.insert(
+            *[Director(name=name, gender="m") for name in ("A", "B", "C")]
+        ).run_sync()
+
+    def test_bulk_delete(self):
+        client, csrftoken = login(create_admin([Director]), self.credentials)
+
+        response = client.post(
+            "/api/tables/director/-/bulk-delete/",
+            json={"row_ids": [1, "2", 2, 100, "abc"]},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "row_ids": [1, 2],
+                "errors": [
+                    {"row_id": "abc", "detail": "Invalid row ID."},
+                    {"row_id": 100, "detail": "The resource doesn't exist"},
+                ],
+            },
+        )
+        self.assertListEqual(
+            Director.select(Director.name).output(as_list=True).run_sync(),
+            ["C"],
+        )
+
+    def test_hooks(self):
+        """
+        Make sure the ``pre_delete`` hooks run for each row, and a row is
+        skipped if its hook raises an exception.
+        """
+        hook_row_ids = []
+
+        def pre_delete(row_id):
+            hook_row_ids.append(row_id)
+            if row_id == 2:
+                raise HTTPException(status_code=403, detail="Not allowed!")
+
+        app = create_admin(
+            [
+                TableConfig(
+                    Director,
+                    hooks=[
+                        Hook(
+                            hook_type=HookType.pre_delete, callable=pre_delete
+                        )
+                    ],
+                )
+            ]
+        )
+        client, csrftoken = login(app, self.credentials)
+
+        with patch("piccolo_admin.bulk.BULK_BATCH_SIZE", 2):
+            response = client.post(
+                "/api/tables/director/-/bulk-delete/",
+                json={"row_ids": [1, 2, 3]},
+                headers={"X-CSRFToken": csrftoken},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "row_ids": [1, 3],
+                "errors": [{"row_id": 2, "detail": "Not allowed!"}],
+            },
+        )
+        self.assertListEqual(hook_row_ids, [1, 2, 3])
+        self.assertListEqual(
+            Director.select(Director.name).output(as_list=True).run_sync(),
+            ["B"],
+        )
+
+    def test_validators(self):
+        def delete_single_validator(piccolo_crud, request):
+            raise HTTPException(status_code=403, detail="Not allowed!")
+
+        app = create_admin(
+            [
+                TableConfig(
+                    Director,
+                    validators=Validators(
+                        delete_single=[delete_single_validator]
+                    ),
+                )
+            ]
+        )
+        client, csrftoken = login(app, self.credentials)
+
+        response = client.post(
+            "/api/tables/director/-/bulk-delete/",
+            json={"row_ids": [1]},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Director.count().run_sync(), 3)
+
+    def test_read_only(self):
+        client, csrftoken = login(
+            create_admin([Director], read_only=True), self.credentials
+        )
+
+        response = client.post(
+            "/api/tables/director/-/bulk-delete/",
+            json={"row_ids": [1]},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(Director.count().run_sync(), 3)
+
+    def test_count_cache(self):
+        """
+        A count can be cached after the hooks have cleared the cache, but
+        before the rows have been deleted, so make sure the cache is cleared
+        again afterwards.
+        """
+        client, csrftoken = login(
+            create_admin(
+                [Director], count_cache_ttl=datetime.timedelta(minutes=1)
+            ),
+            self.credentials,
+        )
+        invalidate = CountCache.invalidate
+        stale_count_cached = False
+
+        def invalidate_then_count(cache: CountCache, table_name: str):
+            nonlocal stale_count_cached
+            invalidate(cache, table_name)
+            if not stale_count_cached:
+                # Simulate a listing request which counts the rows before
+                # the delete has been committed.
+                cache.set(
+                    table_name,
+                    {},
+                    RowCount(count=3),
+                    version=cache.get_version(table_name),
+                )
+                stale_count_cached = True
+
+        with patch.object(CountCache, "invalidate", invalidate_then_count):
+            response = client.post(
+                "/api/tables/director/-/bulk-delete/",
+                json={"row_ids": [1]},
+                headers={"X-CSRFToken": csrftoken},
+            )
+        self.assertEqual(response.status_code, 200)
+
+        response = client.get("/api/tables/director/-/listing/")
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_delete_matching(self):
+        """
+        Make sure every row matching the filters is deleted in the
+        background.
+        """
+        client, csrftoken = login(
+            create_admin([TableConfig(Director, allow_bulk_delete=True)]),
+            self.credentials,
+        )
+        Director.insert(
+            *[Director(name="B", gender="f") for _ in range(4)]
+        ).run_sync()
+
+        with client, patch("piccolo_admin.bulk.BULK_BATCH_SIZE", 2):
+            response = client.post(
+                "/api/tables/director/-/bulk-delete/matching/",
+                params={"name": "B", "__match": "exact", "__page": 2},
+                headers={"X-CSRFToken": csrftoken},
+            )
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.json()["action"], "delete")
+
+            job = wait_for_bulk_job(client, response.json()["job_id"])
+
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["total"], 5)
+        self.assertEqual(job["processed"], 5)
+        self.assertEqual(job["succeeded"], 5)
+        self.assertListEqual(
+            Director.select(Director.name)
+            .order_by(Director.id)
+            .output(as_list=True)
+            .run_sync(),
+            ["A", "C"],
+        )
+
+    def test_delete_matching_errors(self):
+        client, csrftoken = login(
+            create_admin([TableConfig(Director, allow_bulk_delete=True)]),
+            self.credentials,
+        )
+
+        response = client.post(
+            "/api/tables/director/-/bulk-delete/matching/",
+            params={"foo": "bar"},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = client.get("/api/bulk-jobs/foo/")
+        self.assertEqual(response.status_code, 404)
+
+        self.assertEqual(Director.count().run_sync(), 3)
+
+    def test_delete_matching_not_allowed(self):
+        """
+        Like ``PiccoloCRUD``, deleting every matching row is only allowed if
+        ``allow_bulk_delete`` is enabled.
+        """
+        client, csrftoken = login(create_admin([Director]), self.credentials)
+
+        response = client.post(
+            "/api/tables/director/-/bulk-delete/matching/",
+            params={"name": "A"},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(Director.count().run_sync(), 3)
+
+    def test_delete_matching_validators(self):
+        """
+        Make sure the ``delete_all`` validators are applied.
+        """
+
+        def delete_all_validator(piccolo_crud, request):
+            raise HTTPException(detail="Not allowed!", status_code=403)
+
+        client, csrftoken = login(
+            create_admin(
+                [
+                    TableConfig(
+                        Director,
+                        allow_bulk_delete=True,
+                        validators=Validators(
+                            delete_all=[delete_all_validator]
+                        ),
+                    )
+                ]
+            ),
+            self.credentials,
+        )
+
+        response = client.post(
+            "/api/tables/director/-/bulk-delete/matching/",
+            params={"name": "A"},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Director.count().run_sync(), 3)
+
+    def test_delete_matching_all_rows(self):
+        """
+        If there are no filters, the client has to confirm that every row
+        should be deleted.
+        """
+        client, csrftoken = login(
+            create_admin([TableConfig(Director, allow_bulk_delete=True)]),
+            self.credentials,
+        )
+
+        with client:
+            response = client.post(
+                "/api/tables/director/-/bulk-delete/matching/",
+                headers={"X-CSRFToken": csrftoken},
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(Director.count().run_sync(), 3)
+
+            response = client.post(
+                "/api/tables/director/-/bulk-delete/matching/",
+                params={"__all_rows": "true"},
+                headers={"X-CSRFToken": csrftoken},
+            )
+            self.assertEqual(response.status_code, 202)
+            job = wait_for_bulk_job(client, response.json()["job_id"])
+
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(Director.count().run_sync(), 0)
+
+    def test_job_visibility(self):
+        """
+        Only the user who started a job can see its progress.
+        """
+        BaseUser.create_user_sync(
+            username="Sally",
+            password="sally123",
+            email="sally@example.com",
+            active=True,
+            admin=True,
+            superuser=True,
+        )
+        app = create_admin([TableConfig(Director, allow_bulk_delete=True)])
+        client, csrftoken = login(app, self.credentials)
+        other_client, _ = login(
+            app, {"username": "Sally", "password": "sally123"}
+        )
+
+        with client:
+            response = client.post(
+                "/api/tables/director/-/bulk-delete/matching/",
+                params={"name": "A"},
+                headers={"X-CSRFToken": csrftoken},
+            )
+            job_id = response.json()["job_id"]
+            wait_for_bulk_job(client, job_id)
+
+        response = other_client.get(f"/api/bulk-jobs/{job_id}/")
+        self.assertEqual(response.status_code, 404)
+
+
+class TestBulkUpdate(TableTest):
+    credentials = {"username": "Bob", "password": "bob123"}
+
+    tables = [BaseUser, SessionsBase, AuthenticatorSecret, Director]
+
+    def setUp(self):
+        super().setUp()
+        BaseUser.create_user_sync(
+            **self.credentials, active=True, admin=True, superuser=True
+        )
+        Director.insert(
+            *[Director(name=name, gender="m") for name in ("A", "B", "C")]
+        ).run_sync()
+
+    def get_names(self) -> list[str]:
+        return (
+            Director.select(Director.name)
+            .order_by(Director.id)
+            .output(as_list=True)
+            .run_sync()
+        )
+
+    def test_bulk_update(self):
+        client, csrftoken = login(create_admin([Director]), self.credentials)
+
+        with patch("piccolo_admin.bulk.BULK_BATCH_SIZE", 1):
+            response = client.post(
+                "/api/tables/director/-/bulk-update/",
+                json={
+                    "row_ids": [1, 2, 100],
+                    "column_name": "name",
+                    "value": "X",
+                },
+                headers={"X-CSRFToken": csrftoken},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "row_ids": [1, 2],
+                "errors": [
+                    {"row_id": 100, "detail": "The resource doesn't exist"}
+                ],
+            },
+        )
+        self.assertListEqual(self.get_names(), ["X", "X", "C"])
+
+    def test_hooks(self):
+        """
+        Make sure the ``pre_patch`` hooks can change the values for each row,
+        or prevent a row from being updated.
+        """
+
+        def pre_patch(row_id, values):
+            if row_id == 2:
+                raise HTTPException(status_code=403, detail="Not allowed!")
+            if row_id == 3:
+                return {Director.name: "Y"}
+            return values
+
+        app = create_admin(
+            [
+                TableConfig(
+                    Director,
+                    hooks=[
+                        Hook(hook_type=HookType.pre_patch, callable=pre_patch)
+                    ],
+                )
+            ]
+        )
+        client, csrftoken = login(app, self.credentials)
+
+        response = client.post(
+            "/api/tables/director/-/bulk-update/",
+            json={"row_ids": [1, 2, 3], "column_name": "name", "value": "X"},
+            headers={"X-CSRFToken": csrftoken},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "row_ids": [1, 3],
+                "errors": [{"row_id": 2, "detail": "Not allowed!"}],
+            },
+        )
+        self.assertListEqual(self.get_names(), ["X", "B", "Y"])
+
+    def test_password(self):
+        """
+        Like when updating a single row, the ``pre_patch`` hooks receive the
+        password which the user entered, and it's hashed afterwards.
+        """
+        for username in ("Sally", "Jo"):
+            BaseUser.create_user_sync(
+                username=username,
+                password="password123",
+                email=f"{username}@example.com",
+            )
+        received_passwords = []
+
+        def pre_patch(row_id, values):
+            password = list(values.values())[0]
+            received_passwords.append(password)
+            # A hook can change the password - e.g. to reject it.
+            if row_id == 3:
+                return {BaseUser.password: "abc"}
+            return values
+
+        app = create_admin(
+            [
+                TableConfig(
+                    BaseUser,
+                    hooks=[
+                        Hook(hook_type=HookType.pre_patch, callable=pre_patch)
+                    ],
+                )
+            ]
+        )
+        client, csrftoken = login(app, self.credentials)
+
+        response = client.post(
+            "/api/tables/piccolo_user/-/bulk-update/",
+            json={
+                "row_ids": [2, 3],
+                "column_name": "password",
+                "value": "new_password123",
+            },
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["row_ids"], [2])
+        self.assertEqual(
+            response.json()["errors"][0]["row_id"], 3, response.json()
+        )
+
+        self.assertListEqual(received_passwords, ["new_password123"] * 2)
+        self.assertEqual(BaseUser.login_sync("Sally", "new_password123"), 2)
+        self.assertEqual(BaseUser.login_sync("Jo", "password123"), 3)
+
+    def test_errors(self):
+        client, csrftoken = login(create_admin([Director]), self.credentials)
+
+        for column_name, value in (
+            ("foo", "X"),
+            ("id", 10),
+            ("name", "X" * 1000),
+        ):
+            response = client.post(
+                "/api/tables/director/-/bulk-update/",
+                json={
+                    "row_ids": [1],
+                    "column_name": column_name,
+                    "value": value,
+                },
+                headers={"X-CSRFToken": csrftoken},
+            )
+            self.assertEqual(response.status_code, 400)
+
+        self.assertListEqual(self.get_names(), ["A", "B", "C"])
+
+    def test_validators(self):
+        def patch_single_validator(piccolo_crud, request):
+            raise HTTPException(status_code=403, detail="Not allowed!")
+
+        app = create_admin(
+            [
+                TableConfig(
+                    Director,
+                    validators=Validators(
+                        patch_single=[patch_single_validator]
+                    ),
+                )
+            ]
+        )
+        client, csrftoken = login(app, self.credentials)
+
+        response = client.post(
+            "/api/tables/director/-/bulk-update/",
+            json={"row_ids": [1], "column_name": "name", "value": "X"},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 403)
+
+        client, csrftoken = login(
+            create_admin([Director], read_only=True), self.credentials
+        )
+        response = client.post(
+            "/api/tables/director/-/bulk-update/",
+            json={"row_ids": [1], "column_name": "name", "value": "X"},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 405)
+
+        self.assertListEqual(self.get_names(), ["A", "B", "C"])
+
+    def test_update_matching(self):
+        client, csrftoken = login(
+            create_admin([TableConfig(Director, allow_bulk_update=True)]),
+            self.credentials,
+        )
+
+        with client, patch("piccolo_admin.bulk.BULK_BATCH_SIZE", 1):
+            response = client.post(
+                "/api/tables/director/-/bulk-update/matching/",
+                params={"name": "B", "__match": "ends"},
+                json={"column_name": "name", "value": "AB"},
+                headers={"X-CSRFToken": csrftoken},
+            )
+            self.assertEqual(response.status_code, 202)
+
+            job = wait_for_bulk_job(client, response.json()["job_id"])
+
+        # The updated row still matches the filter - make sure it's only
+        # updated once.
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["total"], 1)
+        self.assertEqual(job["succeeded"], 1)
+        self.assertListEqual(self.get_names(), ["A", "AB", "C"])
+
+        response = client.post(
+            "/api/tables/director/-/bulk-update/matching/",
+            params={"__all_rows": "true"},
+            json={"column_name": "foo", "value": "X"},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_update_matching_all_rows(self):
+        """
+        If there are no filters, the client has to confirm that every row
+        should be updated.
+        """
+        client, csrftoken = login(
+            create_admin([TableConfig(Director, allow_bulk_update=True)]),
+            self.credentials,
+        )
+
+        with client:
+            response = client.post(
+                "/api/tables/director/-/bulk-update/matching/",
+                json={"column_name": "name", "value": "X"},
+                headers={"X-CSRFToken": csrftoken},
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertListEqual(self.get_names(), ["A", "B", "C"])
+
+            response = client.post(
+                "/api/tables/director/-/bulk-update/matching/",
+                params={"__all_rows": "true"},
+                json={"column_name": "name", "value": "X"},
+                headers={"X-CSRFToken": csrftoken},
+            )
+            self.assertEqual(response.status_code, 202)
+            wait_for_bulk_job(client, response.json()["job_id"])
+
+        self.assertListEqual(self.get_names(), ["X", "X", "X"])
+
+    def test_update_matching_not_allowed(self):
+        """
+        Updating every matching row is only allowed if ``allow_bulk_update``
+        is enabled.
+        """
+        client, csrftoken = login(create_admin([Director]), self.credentials)
+
+        response = client.post(
+            "/api/tables/director/-/bulk-update/matching/",
+            params={"name": "A"},
+            json={"column_name": "name", "value": "X"},
+            headers={"X-CSRFToken": csrftoken},
+        )
+        self.assertEqual(response.status_code, 405)
+        self.assertListEqual(self.get_names(), ["A", "B", "C"])
+
+
+class Tag(Table):
+    name = Varchar(primary_key=True)
+
+
+class TestTableRouting(TableTest):
+    credentials = {"username": "Bob", "password": "bob123"}
+
+    tables = [
+        BaseUser,
+        SessionsBase,
+        AuthenticatorSecret,
+        Director,
+        Movie,
+        Tag,
+    ]
+
+    def setUp(self):
+        super().setUp()
+        BaseUser.create_user_sync(
+            **self.credentials, active=True, admin=True, superuser=True
+        )
+        Director.insert(Director(name="George Lucas", gender="m")).run_sync()
+
+    def test_openapi(self):
+        """
+        The table routes aren't registered on the main app, so make sure
+        they're still in the OpenAPI schema.
+        """
+        client, _ = login(create_admin([Director, Movie]), self.credentials)
+
+        response = client.get("/api/openapi.json")
+        self.assertEqual(response.status_code, 200)
+
+        paths = response.json()["paths"]
+        self.assertIn("/tables/director/{row_id}/", paths)
+        self.assertIn("/tables/movie/", paths)
+        self.assertIn("/tables/{table_name}/-/listing/", paths)
+
+    def test_lazy_tables(self):
+        """
+        Make sure the ``PiccoloCRUD`` for each table is only created when
+        needed, and the least recently used ones are discarded.
+        """
+        app = create_admin(
+            [Director, Movie], lazy_tables=True, lazy_tables_cache_size=1
+        )
+        self.assertEqual(len(app.piccolo_crud_map), 0)
+
+        client, _ = login(app, self.credentials)
+
+        response = client.get("/api/tables/director/1/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["name"], "George Lucas")
+        self.assertListEqual(list(app.piccolo_crud_map), ["director"])
+
+        response = client.get("/api/tables/movie/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"rows": []})
+        self.assertListEqual(list(app.piccolo_crud_map), ["movie"])
+
+        # The listing endpoint uses the same PiccoloCRUD instances.
+        response = client.get("/api/tables/director/-/listing/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 1)
+        self.assertListEqual(list(app.piccolo_crud_map), ["director"])
+
+        # Make sure other endpoints under `/tables/` still work.
+        response = client.get("/api/tables/grouped/")
+        self.assertEqual(response.status_code, 200)
+
+        response = client.get("/api/tables/foo/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_string_primary_keys(self):
+        """
+        The admin's table endpoints are under ``/-/``, so they don't shadow
+        rows whose primary key matches one of their names.
+        """
+        names = ["listing", "search", "bulk-delete", "bulk-update", "-"]
+        Tag.insert(*[Tag(name=name) for name in names]).run_sync()
+
+        client, _ = login(create_admin([Tag]), self.credentials)
+
+        for name in names:
+            response = client.get(f"/api/tables/tag/{name}/")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["name"], name)
+
+        response = client.get("/api/tables/tag/-/listing/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], len(names))
+
+
+class TestSearch(TableTest):
+    credentials = {"username": "Bob", "password": "bob123"}
+
+    tables = [BaseUser, SessionsBase, AuthenticatorSecret, Director, Movie]
+
+    def setUp(self):
+        super().setUp()
+        BaseUser.create_user_sync(
+            **self.credentials, active=True, admin=True, superuser=True
+        )
+        Director.insert(
+            Director(name="Ridley Scott", gender="m"),
+            Director(name="George Lucas", gender="m"),
+            Director(name="Kathryn Bigelow", gender="f"),
+            Director(name="Sofia Coppola", gender="f"),
+        ).run_sync()
+
+    def test_search(self):
+        """
+        Rows starting with the search term come first, and we can load more
+        results using the cursor.
+        """
+        client, _ = login(create_admin([Director, Movie]), self.credentials)
+
+        response = client.get(
+            "/api/tables/director/-/search/",
+            params={"search": "s", "limit": 2},
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertListEqual(
+            data["results"],
+            [
+                {"id": 4, "readable": "Sofia Coppola"},
+                {"id": 1, "readable": "Ridley Scott"},
+            ],
+        )
+        self.assertIsNotNone(data["next_cursor"])
+
+        response = client.get(
+            "/api/tables/director/-/search/",
+            params={"search": "s", "limit": 2, "cursor": data["next_cursor"]},
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertListEqual(
+            data["results"], [{"id": 2, "readable": "George Lucas"}]
+        )
+        self.assertIsNone(data["next_cursor"])
+
+    def test_no_search_term(self):
+        client, _ = login(create_admin([Director, Movie]), self.credentials)
+
+        response = client.get("/api/tables/director/-/search/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 4)
+
+    def test_invalid_params(self):
+        client, _ = login(create_admin([Director, Movie]), self.credentials)
+
+        for params in (
+            {"limit": "abc"},
+            {"limit": 0},
+            {"limit": 10_000},
+            {"cursor": "abc"},
+        ):
+            response = client.get(
+                "/api/tables/director/-/search/", params=params
+            )
+            self.assertEqual(response.status_code, 400)
+
+        response = client.get("/api/tables/foo/-/search/")
+        self.assertEqual(response.status_code, 404)
+
+
+class TestTranslations(TestCase):
+    def test_translations(self):
+        """
+        Test the default configuration, where the translations endpoint should
+        return all translations.
+        """
+        client = TestClient(APP)
+
+        response = client.get("/public/translations/")
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertEqual(data["default_language_code"], "auto")
+        self.assertListEqual(
+            [i["language_code"] for i in data.get("translations")],
+            [i.language_code for i in TRANSLATIONS],
+        )
+
+    def test_translations_custom(self):
+        """
+        Test a custom configuration, where the translations endpoint should
+        return only the configured translations.
+        """
+        translations = [ENGLISH, FRENCH]
+
+        client = TestClient(
+            create_admin(
+                tables=[],
+                translations=translations,
+                default_language_code="fr",
+            )
+        )
+
+        response = client.get("/public/translations/")
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertEqual(data["default_language_code"], "fr")
+        self.assertListEqual(
+            [i["language_code"] for i in data.get("translations")],
+            [i.language_code for i in translations],
+        )
+
+    def test_get_single_translation(self):
+        """
+        Make sure we can retrieve a single translation.
+        """
+        client = TestClient(APP)
+
+        response = client.get("/public/translations/en/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["translations"]["About"], "About")
+
+    def test_translation_etag(self):
+        """
+        Make sure the translations can be cached by the client, using the
+        content hash in the translation list, or the ETag.
+        """
+        client = TestClient(APP)
+
+        response = client.get("/public/translations/en/")
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["etag"]
+
+        content_hash = {
+            i["language_code"]: i["content_hash"]
+            for i in client.get("/public/translations/").json()["translations"]
+        }["en"]
+        self.assertEqual(etag, f'"{content_hash}"')
+
+        response = client.get(
+            "/public/translations/en/", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
 
     def test_get_language_case_insensitive(self):
         """
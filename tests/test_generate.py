@@ -0,0 +1,88 @@
+from unittest import TestCase, skipUnless
+
+from piccolo.engine.postgres import PostgresEngine
+from piccolo.testing.test_case import TableTest
+
+from piccolo_admin.example.generate import (
+    DIRECTOR_COLUMNS,
+    MOVIE_COLUMNS,
+    generate_data,
+    generate_directors,
+    generate_movies,
+    set_pools,
+)
+from piccolo_admin.example.tables import Director, Movie
+
+
+class TestGenerate(TestCase):
+    def setUp(self):
+        set_pools(
+            {
+                "m": ["Bob"],
+                "f": ["Alice"],
+                "n": ["Sam"],
+                "last_names": ["Smith"],
+                "words": ["Big"],
+                "sentences": ["A sentence."],
+            }
+        )
+
+    def tearDown(self):
+        set_pools({})
+
+    def test_generate_directors(self):
+        rows = generate_directors((10, 5, 1))
+        self.assertEqual(len(rows), 5)
+        self.assertListEqual([i[0] for i in rows], [10, 11, 12, 13, 14])
+        for row in rows:
+            self.assertEqual(len(row), len(DIRECTOR_COLUMNS))
+            self.assertIn(row[1], ["Bob Smith", "Alice Smith", "Sam Smith"])
+
+    def test_generate_movies(self):
+        rows = generate_movies((1, 3, 100, 1))
+        self.assertEqual(len(rows), 100)
+        director_index = MOVIE_COLUMNS.index("director")
+        for row in rows:
+            self.assertEqual(len(row), len(MOVIE_COLUMNS))
+            self.assertIn(row[director_index], [1, 2, 3])
+
+        # The same seed generates the same rows.
+        self.assertListEqual(rows, generate_movies((1, 3, 100, 1)))
+
+
+class TestGenerateData(TableTest):
+    tables = [Director, Movie]
+
+    def test_generate_data(self):
+        Director(name="Guido").save().run_sync()
+
+        elapsed = generate_data(rows=25, processes=1, batch_size=10, seed=1)
+        self.assertIsInstance(elapsed, float)
+
+        self.assertEqual(Director.count().run_sync(), 26)
+        self.assertEqual(Movie.count().run_sync(), 25)
+
+        # The IDs follow on from the existing rows.
+        director_ids = Director.select(Director.id).output(as_list=True)
+        self.assertListEqual(
+            sorted(director_ids.run_sync()), list(range(1, 27))
+        )
+
+        # Every movie belongs to one of the new directors.
+        self.assertEqual(
+            Movie.count()
+            .where(Movie.director.is_in(list(range(2, 27))))
+            .run_sync(),
+            25,
+        )
+
+    @skipUnless(isinstance(Director._meta.db, PostgresEngine), "Postgres only")
+    def test_sequence(self):
+        """
+        The director IDs are set explicitly when using ``COPY``, so make sure
+        the sequence is updated afterwards.
+        """
+        generate_data(rows=5, processes=1, seed=1)
+        director = Director(name="Guido")
+        director.save().run_sync()
+        self.assertEqual(director.id, 6)
@@ -0,0 +1,36 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from piccolo_admin.http_cache import etag_matches, get_etag
+
+
+class TestETagMatches(TestCase):
+    def get_request(self, if_none_match: str) -> MagicMock:
+        request = MagicMock()
+        request.headers = {"if-none-match": if_none_match}
+        return request
+
+    def test_matches(self):
+        etag = get_etag(b"hello")
+
+        for if_none_match in (
+            etag,
+            f"W/{etag}",
+            f'"abc", {etag}',
+            "*",
+        ):
+            self.assertTrue(
+                etag_matches(self.get_request(if_none_match), etag)
+            )
+
+        self.assertTrue(
+            etag_matches(self.get_request(etag), get_etag(b"hello", weak=True))
+        )
+
+    def test_no_match(self):
+        etag = get_etag(b"hello")
+
+        for if_none_match in ("", get_etag(b"world")):
+            self.assertFalse(
+                etag_matches(self.get_request(if_none_match), etag)
+            )
@@ -0,0 +1,103 @@
+from unittest import TestCase
+
+from piccolo.columns.column_types import Integer, Varchar
+from piccolo.table import Table
+from piccolo.testing.test_case import AsyncTableTest
+from piccolo_api.crud.endpoints import OrderBy
+
+from piccolo_admin.pagination import (
+    Cursor,
+    CursorException,
+    fetch_keyset_page,
+    get_keyset_order_by,
+)
+
+
+class Band(Table):
+    name = Varchar()
+    popularity = Integer(null=True, default=None)
+
+
+class TestCursor(TestCase):
+    def test_round_trip(self):
+        cursor = Cursor(values=["Pythonistas", 1], backwards=True)
+        self.assertEqual(Cursor.decode(cursor.encode()), cursor)
+
+    def test_invalid(self):
+        # Not base64, and base64 encoded JSON which isn't a dict.
+        for value in ("abc", "WzFd"):
+            with self.assertRaises(CursorException):
+                Cursor.decode(value)
+
+
+class TestGetKeysetOrderBy(TestCase):
+    def test_primary_key_added(self):
+        order_by = get_keyset_order_by(
+            Band, [OrderBy(Band.name, ascending=False)]
+        )
+        self.assertEqual(
+            order_by,
+            [
+                OrderBy(Band.name, ascending=False),
+                OrderBy(Band._meta.primary_key, ascending=False),
+            ],
+        )
+
+    def test_primary_key_present(self):
+        order_by = [OrderBy(Band._meta.primary_key)]
+        self.assertEqual(get_keyset_order_by(Band, order_by), order_by)
+
+
+class TestFetchKeysetPage(AsyncTableTest):
+    tables = [Band]
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await Band.insert(
+            *[
+                Band(name=name, popularity=popularity)
+                for name, popularity in (
+                    ("Pythonistas", 1000),
+                    ("Rustaceans", None),
+                    ("C-Sharps", 10),
+                )
+            ]
+        )
+
+    async def test_nullable_order_by(self):
+        """
+        Nullable columns can't be used in a keyset, so make sure we fall back
+        to using an offset.
+        """
+        order_by = get_keyset_order_by(Band, [OrderBy(Band.popularity)])
+
+        page = await fetch_keyset_page(
+            query=Band.select(Band.name, Band.popularity, Band.id),
+            order_by=order_by,
+            page_size=2,
+        )
+        self.assertIsNone(page.previous_cursor)
+        assert page.next_cursor is not None
+        self.assertEqual(Cursor.decode(page.next_cursor).offset, 2)
+
+        next_page = await fetch_keyset_page(
+            query=Band.select(Band.name, Band.popularity, Band.id),
+            order_by=order_by,
+            page_size=2,
+            cursor=Cursor.decode(page.next_cursor),
+        )
+        self.assertEqual(len(next_page.rows), 1)
+        self.assertIsNone(next_page.next_cursor)
+        self.assertEqual(
+            {i["name"] for i in [*page.rows, *next_page.rows]},
+            {"Pythonistas", "Rustaceans", "C-Sharps"},
+        )
+
+    async def test_mismatched_cursor(self):
+        with self.assertRaises(CursorException):
+            await fetch_keyset_page(
+                query=Band.select(),
+                order_by=get_keyset_order_by(Band, [OrderBy(Band.name)]),
+                page_size=2,
+                cursor=Cursor(values=["Pythonistas"]),
+            )
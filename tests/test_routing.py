@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from starlette.responses import PlainTextResponse
+from starlette.routing import Match, Router
+from starlette.testclient import TestClient
+
+from piccolo_admin.routing import TableMount
+
+
+class TestTableMount(TestCase):
+    def setUp(self):
+        async def director_app(scope, receive, send):
+            response = PlainTextResponse(
+                f"{scope['path_params']['table_name']} {scope['path']}"
+            )
+            await response(scope, receive, send)
+
+        self.apps = {"director": director_app}
+        self.mount = TableMount(self.apps.get)
+
+    def test_matches(self):
+        """
+        Make sure only registered tables are matched, so other routes under
+        ``/tables/`` still work.
+        """
+        for path, match in (
+            ("/tables/director/", Match.FULL),
+            ("/tables/director/1/", Match.FULL),
+            ("/tables/grouped/", Match.NONE),
+            ("/tables/", Match.NONE),
+        ):
+            scope = {"type": "http", "path": path, "root_path": ""}
+            self.assertEqual(self.mount.matches(scope)[0], match, path)
+
+    def test_dispatch(self):
+        client = TestClient(Router(routes=[self.mount]))
+
+        response = client.get("/tables/director/1/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "director /tables/director/1/")
+
+        response = client.get("/tables/movie/")
+        self.assertEqual(response.status_code, 404)
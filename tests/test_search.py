@@ -0,0 +1,178 @@
+from unittest import TestCase
+
+from piccolo.columns.column_types import Varchar
+from piccolo.columns.readable import Readable
+from piccolo.table import Table
+from piccolo.testing.test_case import AsyncTableTest
+
+from piccolo_admin.pagination import CursorException
+from piccolo_admin.search import (
+    ContainsSearch,
+    FullTextSearch,
+    SearchCursor,
+    TrigramSearch,
+    escape_like,
+)
+
+
+class Band(Table):
+    name = Varchar()
+
+    @classmethod
+    def get_readable(cls):
+        return Readable(template="%s", columns=[cls.name])
+
+
+BAND_NAMES = [
+    "Rustaceans",
+    "Pythonistas",
+    "Python Monks",
+    "C-Sharps",
+    "Monty Python",
+    "100% Python",
+]
+
+
+class TestSearchStrategies(AsyncTableTest):
+    tables = [Band]
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await Band.insert(*[Band(name=name) for name in BAND_NAMES])
+
+    async def get_names(self, strategy, search_term: str) -> list[str]:
+        page = await strategy.search(Band, search_term=search_term, limit=10)
+        return [i[1] for i in page.results]
+
+    async def test_contains(self):
+        """
+        Rows starting with the search term come first.
+        """
+        self.assertListEqual(
+            await self.get_names(ContainsSearch(), "python"),
+            ["Pythonistas", "Python Monks", "Monty Python", "100% Python"],
+        )
+        self.assertListEqual(
+            await self.get_names(ContainsSearch(Band.name), "python"),
+            ["Pythonistas", "Python Monks", "Monty Python", "100% Python"],
+        )
+
+    async def test_wildcards(self):
+        """
+        ``LIKE`` wildcards in the search term are matched literally.
+        """
+        self.assertListEqual(
+            await self.get_names(ContainsSearch(), "0%"), ["100% Python"]
+        )
+        self.assertListEqual(await self.get_names(ContainsSearch(), "_"), [])
+
+    async def test_no_search_term(self):
+        self.assertListEqual(
+            await self.get_names(ContainsSearch(), ""), BAND_NAMES
+        )
+
+    async def test_pagination(self):
+        """
+        Make sure we can page through the results, including across the
+        prefix matches and the other matches.
+        """
+        strategy = ContainsSearch()
+        names = []
+        cursor = None
+
+        while True:
+            page = await strategy.search(
+                Band,
+                search_term="python",
+                limit=1,
+                cursor=(
+                    SearchCursor.decode(cursor, table=Band) if cursor else None
+                ),
+            )
+            names.extend(i[1] for i in page.results)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertListEqual(
+            names,
+            ["Pythonistas", "Python Monks", "Monty Python", "100% Python"],
+        )
+
+    async def test_trigram(self):
+        strategy = TrigramSearch(Band.name)
+        await strategy.create_indexes(Band)
+        # Make sure it's idempotent.
+        await strategy.create_indexes(Band)
+
+        # Rows added after the index is created are also searchable.
+        await Band.insert(Band(name="Python Pirates"))
+
+        self.assertListEqual(
+            await self.get_names(strategy, "python"),
+            [
+                "Pythonistas",
+                "Python Monks",
+                "Python Pirates",
+                "Monty Python",
+                "100% Python",
+            ],
+        )
+
+        # Updated and deleted rows are also reflected.
+        await Band.update({Band.name: "Cobras"}).where(
+            Band.name == "Monty Python"
+        )
+        await Band.delete().where(Band.name == "Pythonistas")
+        self.assertListEqual(
+            await self.get_names(strategy, "python"),
+            ["Python Monks", "Python Pirates", "100% Python"],
+        )
+
+        await Band.raw('DROP TABLE "band_name_search"')
+
+    async def test_full_text(self):
+        strategy = FullTextSearch(Band.name)
+        await strategy.create_indexes(Band)
+
+        # Only the start of words are matched.
+        self.assertListEqual(
+            await self.get_names(strategy, "pyth"),
+            ["Pythonistas", "Python Monks", "Monty Python", "100% Python"],
+        )
+        self.assertListEqual(await self.get_names(strategy, "ython"), [])
+        self.assertListEqual(
+            await self.get_names(strategy, "mon pyth"),
+            ["Python Monks", "Monty Python"],
+        )
+        self.assertListEqual(await self.get_names(strategy, "'*"), [])
+
+        await Band.raw('DROP TABLE "band_name_search"')
+
+
+class TestSearchCursor(TestCase):
+    def test_round_trip(self):
+        cursor = SearchCursor(phase=1, after=5)
+        self.assertEqual(
+            SearchCursor.decode(cursor.encode(), table=Band), cursor
+        )
+
+    def test_invalid(self):
+        for value in (
+            "abc",
+            SearchCursor(phase=1, after="abc").encode(),
+            SearchCursor(phase=-1, after=1).encode(),
+        ):
+            with self.assertRaises(CursorException):
+                SearchCursor.decode(value, table=Band)
+
+
+class TestEscapeLike(TestCase):
+    def test_escape_like(self):
+        self.assertEqual(escape_like("100%_\\"), "100\\%\\_\\\\")
+
+
+class TestFullTextSearch(TestCase):
+    def test_language(self):
+        with self.assertRaises(ValueError):
+            FullTextSearch(Band.name, language="simple'; DROP TABLE band")
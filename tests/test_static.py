@@ -0,0 +1,95 @@
+import gzip
+import os
+import tempfile
+from unittest import TestCase
+
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from piccolo_admin.static import AssetFiles, get_accepted_encodings
+
+CONTENT = b"console.log('hello world')"
+
+
+class TestAssetFiles(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = self.directory.name
+
+        with open(os.path.join(path, "index-B0sTfVCI.js"), "wb") as f:
+            f.write(CONTENT)
+
+        with open(os.path.join(path, "index-B0sTfVCI.js.gz"), "wb") as f:
+            f.write(gzip.compress(CONTENT))
+
+        # We don't actually decode it, so the contents don't matter.
+        with open(os.path.join(path, "index-B0sTfVCI.js.br"), "wb") as f:
+            f.write(b"brotli")
+
+        with open(os.path.join(path, "unhashed.js"), "wb") as f:
+            f.write(CONTENT)
+
+        self.client = TestClient(
+            Starlette(
+                routes=[Mount("/assets", app=AssetFiles(directory=path))]
+            )
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_encodings(self):
+        url = "/assets/index-B0sTfVCI.js"
+
+        with self.client.stream(
+            "GET", url, headers={"Accept-Encoding": "gzip, br"}
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["content-encoding"], "br")
+            self.assertIn("javascript", response.headers["content-type"])
+
+        response = self.client.get(
+            url, headers={"Accept-Encoding": "gzip, br;q=0"}
+        )
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.content, CONTENT)
+
+        response = self.client.get(url, headers={"Accept-Encoding": ""})
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(response.content, CONTENT)
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+
+    def test_cache_control(self):
+        response = self.client.get("/assets/index-B0sTfVCI.js")
+        self.assertIn("immutable", response.headers["cache-control"])
+
+        response = self.client.get("/assets/unhashed.js")
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+
+    def test_not_modified(self):
+        url = "/assets/index-B0sTfVCI.js"
+        headers = {"Accept-Encoding": "gzip"}
+
+        response = self.client.get(url, headers=headers)
+        etag = response.headers["etag"]
+
+        response = self.client.get(
+            url, headers={**headers, "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_missing(self):
+        response = self.client.get(
+            "/assets/missing.js", headers={"Accept-Encoding": "gzip"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class TestGetAcceptedEncodings(TestCase):
+    def test_parse(self):
+        scope = {
+            "type": "http",
+            "headers": [(b"accept-encoding", b"gzip;q=0.5, BR, zstd;q=0")],
+        }
+        self.assertEqual(get_accepted_encodings(scope), {"gzip", "br"})